@@ -1,15 +1,24 @@
+import asyncio
 import httpx
 import logging
+import sqlite3
 import time
+from types import ModuleType
 from typing import Dict, List, Optional, Tuple, Union
 from ..config.constants import MAX_RESPONSE_SIZE_BYTES, WARNING_RESPONSE_SIZE_BYTES
 from ..util.query_validator import validate_lucene_syntax
 from ..util.rate_limiter import get_rate_limiter, RateLimitConfig
 from ..util.retry import retry_async
 from ..util.metrics import get_metrics_collector, MetricsCollector
-from ..util.cache import get_fields_cache, get_search_cache, generate_cache_key
+from ..util.cache import (
+    get_disk_cache,
+    get_fields_cache,
+    get_search_cache,
+    generate_cache_key,
+)
 from ..shared.circuit_breaker import uspto_api_breaker, CircuitBreakerError
 from ..shared.enums import ContextLevel
+from ..shared.error_utils import raise_http_exception
 from ..shared.exceptions import (
     RateLimitError,
     APIConnectionError,
@@ -18,9 +27,22 @@ from ..shared.exceptions import (
     ValidationError,
 )
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to httpx's stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _decode_json(response: httpx.Response) -> Dict:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class EnrichedCitationClient:
     """
     Async HTTP client for USPTO Enriched Citation API v3.
@@ -37,6 +59,8 @@ class EnrichedCitationClient:
         enable_cache: bool = True,
         fields_cache_ttl: int = 3600,
         search_cache_size: int = 100,
+        persistent_cache_path: Optional[str] = None,
+        persistent_cache_ttl: int = 86400,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
@@ -71,6 +95,35 @@ class EnrichedCitationClient:
             self.search_cache = None
             logger.info("Caching disabled")
 
+        # Persistent search cache (optional, survives restarts)
+        self.disk_cache = (
+            get_disk_cache(persistent_cache_path, ttl_seconds=persistent_cache_ttl)
+            if enable_cache and persistent_cache_path
+            else None
+        )
+
+    async def _disk_cache_get(self, cache_key: str) -> Optional[Dict]:
+        """Read the persistent cache off the event loop; a failed read is a miss."""
+        disk_cache = self.disk_cache
+        if disk_cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(disk_cache.get, cache_key)
+        except (sqlite3.Error, ValueError) as e:
+            # Locked/corrupt database or an undecodable row: fall through to the API
+            logger.warning(f"Disk cache read failed, continuing without it: {e}")
+            return None
+
+    async def _disk_cache_set(self, cache_key: str, result: Dict) -> None:
+        """Write the persistent cache off the event loop; a failed write is skipped."""
+        disk_cache = self.disk_cache
+        if disk_cache is None:
+            return
+        try:
+            await asyncio.to_thread(disk_cache.set, cache_key, result)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed, result not persisted: {e}")
+
     def _handle_http_error(self, response: httpx.Response) -> None:
         """
         Handle HTTP errors by raising appropriate custom exceptions.
@@ -83,9 +136,8 @@ class EnrichedCitationClient:
         Raises:
             Appropriate custom exception based on status code
         """
-        from ..shared.error_utils import raise_http_exception
-
-        raise_http_exception(response)
+        if response.status_code >= 400:
+            raise_http_exception(response)
 
     def _validate_content_type(
         self, response: httpx.Response, expected_types: Optional[List[str]] = None
@@ -253,7 +305,7 @@ class EnrichedCitationClient:
                 pass  # Don't fail on metrics errors
 
             # API returns GZIP, httpx decompresses automatically
-            result = response.json()
+            result = _decode_json(response)
 
             # Store in cache
             if self.enable_cache and self.fields_cache:
@@ -382,6 +434,15 @@ class EnrichedCitationClient:
                 logger.debug(f"Cache hit for search: {cache_key[:100]}...")
                 return cached_result
 
+        if self.disk_cache:
+            cached_result = await self._disk_cache_get(cache_key)
+            if cached_result is not None:
+                logger.debug(f"Disk cache hit for search: {cache_key[:100]}...")
+                # Promote to the in-memory cache for subsequent lookups
+                if self.search_cache:
+                    self.search_cache.set(cache_key, cached_result)
+                return cached_result
+
         # Start timing for metrics
         start_time = time.time()
         endpoint = "search_records"
@@ -430,7 +491,7 @@ class EnrichedCitationClient:
                 pass  # Don't fail on metrics errors
 
             # Response is JSON in {"response": {"start": X, "numFound": Y, "docs": [...]}} format
-            result = response.json()
+            result = _decode_json(response)
 
             # Check for API-level errors in response body
             if "error" in result:
@@ -442,6 +503,8 @@ class EnrichedCitationClient:
             if self.enable_cache and self.search_cache:
                 self.search_cache.set(cache_key, result)
                 logger.debug(f"Cached search result: {cache_key[:100]}...")
+            if self.disk_cache:
+                await self._disk_cache_set(cache_key, result)
 
             # Record successful request metrics
             duration = time.time() - start_time
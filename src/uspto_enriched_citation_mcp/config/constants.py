@@ -89,6 +89,9 @@ LOG_ERROR_MESSAGE_MAX_LENGTH = 200
 MIN_API_KEY_LENGTH = 28
 MAX_API_KEY_LENGTH = 40
 
+# Error text longer than this is truncated before redaction (bounds regex work)
+MAX_SANITIZE_INPUT_LENGTH = 4096
+
 # Request/Response size limits (bytes)
 MAX_RESPONSE_SIZE_BYTES = 50 * 1024 * 1024  # 50 MB (DoS protection)
 MAX_REQUEST_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB (query size limit)
@@ -100,6 +103,7 @@ ENABLE_CACHE_DEFAULT = True
 FIELDS_CACHE_TTL_SECONDS = 3600  # 1 hour (fields rarely change)
 SEARCH_CACHE_SIZE = 100  # Max 100 cached search results (LRU)
 FIELDS_CACHE_SIZE = 10  # Max 10 cached field responses
+PERSISTENT_CACHE_TTL_SECONDS = 86400  # 24 hours (on-disk search results)
 
 # === FIELD CONFIGURATION ===
 # Default field configuration file path
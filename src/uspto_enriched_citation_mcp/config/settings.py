@@ -15,6 +15,7 @@ from .constants import (
     ENABLE_CACHE_DEFAULT,
     FIELDS_CACHE_TTL_SECONDS,
     SEARCH_CACHE_SIZE,
+    PERSISTENT_CACHE_TTL_SECONDS,
     MAX_MINIMAL_SEARCH_ROWS,
     DEFAULT_BALANCED_SEARCH_ROWS,
     MAX_ROWS_PER_REQUEST,
@@ -73,6 +74,14 @@ class Settings(BaseSettings):
         default=SEARCH_CACHE_SIZE,
         validation_alias="SEARCH_CACHE_SIZE"
     )
+    persistent_cache_path: Optional[str] = Field(
+        default=None,
+        validation_alias="PERSISTENT_CACHE_PATH"
+    )
+    persistent_cache_ttl: int = Field(
+        default=PERSISTENT_CACHE_TTL_SECONDS,
+        validation_alias="PERSISTENT_CACHE_TTL"
+    )
 
     # Context Optimization
     max_minimal_results: int = Field(
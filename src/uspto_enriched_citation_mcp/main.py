@@ -17,6 +17,7 @@ from .config.constants import (
     API_DATA_CUTOFF_DATE_STRING,
     MAX_MINIMAL_SEARCH_ROWS,
 )
+from .shared.enums import ContextLevel
 from .shared.error_utils import format_error_response
 from .services.citation_service import CitationService
 from .util.request_context import RequestContext
@@ -94,10 +95,13 @@ api_client = None
 field_manager = None
 citation_service = None
 
+# Set once services are initialized so tools can skip the initialize_services() call
+_services_ready = False
+
 
 def initialize_services():
     """Initialize services with settings."""
-    global api_client, field_manager, citation_service
+    global api_client, field_manager, citation_service, _services_ready
 
     if api_client is None:
         settings = get_settings()
@@ -123,6 +127,8 @@ def initialize_services():
             enable_cache=settings.enable_cache,
             fields_cache_ttl=settings.fields_cache_ttl,
             search_cache_size=settings.search_cache_size,
+            persistent_cache_path=settings.persistent_cache_path,
+            persistent_cache_ttl=settings.persistent_cache_ttl,
         )
 
         # Load field manager from project root (consistent with other MCPs)
@@ -132,6 +138,8 @@ def initialize_services():
         # Initialize service layer
         citation_service = CitationService(api_client, field_manager)
 
+    _services_ready = True
+
 
 # =============================================================================
 # DATA STRUCTURES FOR QUERY BUILDING
@@ -158,6 +166,12 @@ class QueryParameters:
     art_unit: Optional[str] = None
 
 
+# Characters (besides whitespace) that mark criteria as multi-term: grouping,
+# phrases and the ||/&& operators. Such criteria need parentheses when ANDed
+# with other parts.
+_CRITERIA_GROUPING_CHARS = frozenset('()"|&')
+
+
 class QueryBuildResult(NamedTuple):
     """Result of query building operation.
 
@@ -228,9 +242,13 @@ def build_query(params: QueryParameters) -> QueryBuildResult:
     params_used = {}
     warnings = []
 
-    if params.criteria:
-        parts.append(f"({params.criteria})")
-        params_used["base_criteria"] = params.criteria
+    if criteria := params.criteria:
+        # Only multi-term criteria need grouping; a single field:value term is sent as-is
+        if any(c.isspace() or c in _CRITERIA_GROUPING_CHARS for c in criteria):
+            parts.append(f"({criteria})")
+        else:
+            parts.append(criteria)
+        params_used["base_criteria"] = criteria
 
     if applicant_name := validate_string_param(params.applicant_name):
         parts.append(f'{QueryFieldNames.FIRST_APPLICANT_NAME}:"{applicant_name}"')
@@ -302,7 +320,8 @@ async def get_available_fields() -> Dict[str, Any]:
     For field selection strategies and Solr/Lucene syntax examples, use citations_get_guidance(section='fields').
     """
     try:
-        initialize_services()
+        if not _services_ready:
+            initialize_services()
         fields = await api_client.get_fields()
         return {
             "status": "success",
@@ -372,7 +391,8 @@ async def search_citations_minimal(
     # Set request context for tracking
     with RequestContext() as request_id:
         try:
-            initialize_services()
+            if not _services_ready:
+                initialize_services()
             if rows > MAX_MINIMAL_SEARCH_ROWS:
                 return format_error_response(
                     f"Max {MAX_MINIMAL_SEARCH_ROWS} rows for minimal search", 400
@@ -493,7 +513,8 @@ async def search_citations_balanced(
     Quick reference: 'fields' section for Solr syntax, 'workflows_pfw'/'workflows_ptab'/'workflows_fpd' for integration patterns.
     """
     try:
-        initialize_services()
+        if not _services_ready:
+            initialize_services()
         if rows > 50:
             return format_error_response("Max 50 rows for balanced search", 400)
 
@@ -589,42 +610,59 @@ async def get_citation_details(
     For complete cross-MCP workflows, use citations_get_guidance(section='workflows_pfw') for detailed integration patterns.
     """
     try:
-        initialize_services()
+        if not _services_ready:
+            initialize_services()
         if not citation_id:
             return format_error_response("Citation ID required", 400)
 
-        result = await citation_service.get_details(citation_id, include_context)
-
-        # Add LLM guidance for document retrieval via PFW MCP
-        if result and "patentApplicationNumber" in result:
-            app_number = result.get("patentApplicationNumber", "")
-            result["pfw_document_retrieval_guidance"] = {
-                "notice": "⚠️ This is citation METADATA only. To get actual documents, use PFW MCP (2-step process):",
-                "step_1_get_documents": f"pfw_get_application_documents(app_number='{app_number}', document_code='CTFR', limit=20)",
-                "common_citation_documents": {
-                    "CTFR": "Non-Final Office Action (where this citation appears)",
-                    "CTNF": "Final Office Action Rejection",
-                    "NOA": "Notice of Allowance (citation overcame or not used)",
-                    "892": "Examiner's Search Strategy & Citations List",
-                    "IDS": "Applicant's Information Disclosure Statement",
-                },
-                "step_2_options": {
-                    "for_llm_analysis": f"pfw_get_document_content(app_number='{app_number}', document_identifier='{{from_step_1}}') → Extract text to answer user questions",
-                    "for_user_download": f"pfw_get_document_download(app_number='{app_number}', document_identifier='{{from_step_1}}') → PDF download link",
-                },
-                "example_workflow_analysis": f"""
+        level = ContextLevel.FULL if include_context else ContextLevel.MINIMAL
+        return await _get_details(citation_id, level)
+    except Exception as e:
+        return format_error_response("Details retrieval failed", 500, exception=e)
+
+
+async def _get_details(citation_id: str, level: ContextLevel) -> Dict[str, Any]:
+    """Fetch a citation record at the given context level plus PFW retrieval guidance.
+
+    Repeat lookups are served by the client's search cache, which is keyed on
+    the id criteria and the level's field selection.
+    """
+    result = await citation_service.get_details(citation_id, level)
+    _add_pfw_retrieval_guidance(result)
+    return result
+
+
+def _add_pfw_retrieval_guidance(result: Dict[str, Any]) -> None:
+    """Attach PFW MCP document retrieval guidance to a citation details result."""
+    if result and "patentApplicationNumber" in result:
+        app_number = result.get("patentApplicationNumber", "")
+        result["pfw_document_retrieval_guidance"] = {
+            "notice": "⚠️ This is citation METADATA only. To get actual documents, use PFW MCP (2-step process):",
+            "step_1_get_documents": f"pfw_get_application_documents(app_number='{app_number}', document_code='CTFR', limit=20)",
+            "common_citation_documents": {
+                "CTFR": "Non-Final Office Action (where this citation appears)",
+                "CTNF": "Final Office Action Rejection",
+                "NOA": "Notice of Allowance (citation overcame or not used)",
+                "892": "Examiner's Search Strategy & Citations List",
+                "IDS": "Applicant's Information Disclosure Statement",
+            },
+            "step_2_options": {
+                "for_llm_analysis": f"pfw_get_document_content(app_number='{app_number}', document_identifier='{{from_step_1}}') → Extract text to answer user questions",
+                "for_user_download": f"pfw_get_document_download(app_number='{app_number}', document_identifier='{{from_step_1}}') → PDF download link",
+            },
+            "example_workflow_analysis": f"""
 # When user asks "What did the examiner say?" or wants citation context:
 docs = pfw_get_application_documents(app_number='{app_number}', document_code='CTFR', limit=20)
 content = pfw_get_document_content(app_number='{app_number}', document_identifier=docs['documents'][0]['documentIdentifier'])
 # Analyze content and respond to user question
 """,
-                "example_workflow_download": f"""
+            "example_workflow_download": f"""
 # When user says "Get me the office action" or wants to review themselves:
 docs = pfw_get_application_documents(app_number='{app_number}', document_code='CTFR', limit=20)
 download = pfw_get_document_download(app_number='{app_number}', document_identifier=docs['documents'][0]['documentIdentifier'])
 # Present as: **📁 [Download Office Action]({{download['proxy_download_url']}})**
 """,
-                "alternative_xml_retrieval": f"""
+            "alternative_xml_retrieval": f"""
 # Alternative: Patent XML (rare for citation workflows, use document retrieval above instead)
 # If you need patent claims/abstract for prior art comparison:
 xml_data = pfw_get_patent_or_application_xml(
@@ -634,11 +672,7 @@ xml_data = pfw_get_patent_or_application_xml(
 )
 # Note: Document retrieval (above) is preferred for citation context and examiner reasoning
 """,
-            }
-
-        return result
-    except Exception as e:
-        return format_error_response("Details retrieval failed", 500, exception=e)
+        }
 
 
 @mcp.tool()
@@ -660,7 +694,8 @@ async def validate_query(
     For comprehensive query syntax guide, use citations_get_guidance(section='fields').
     """
     try:
-        initialize_services()
+        if not _services_ready:
+            initialize_services()
         if not query:
             return format_error_response("Query required", 400)
 
@@ -677,7 +712,8 @@ async def get_citation_statistics(
 ) -> Dict[str, Any]:
     """Get database statistics and aggregations for strategic planning."""
     try:
-        initialize_services()
+        if not _services_ready:
+            initialize_services()
         result = await citation_service.get_statistics(criteria)
         return result
     except Exception as e:
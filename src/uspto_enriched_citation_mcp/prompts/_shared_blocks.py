@@ -0,0 +1,47 @@
+"""Shared Prompt Code Blocks
+
+Emitted example code and query fragments that appear verbatim in more than one
+prompt. Each block is plain top-level Python; prompts that nest a block under an
+``if`` indent it with ``textwrap.indent`` when their template is built.
+"""
+
+from typing import Final
+
+# Citation records only exist for office actions from this date forward
+OA_DATE_CLAUSE: Final[str] = "officeActionDate:[2017-10-01 TO *]"
+
+# Expects Counter in scope; defines bootstrap_ci(ref_ids, refs)
+BOOTSTRAP_CI_BLOCK: Final[str] = """import random
+
+# Percentile bootstrap interval on how often each of refs appears in ref_ids
+def bootstrap_ci(ref_ids, refs, n_boot=1000, alpha=0.05, seed=42):
+    rng = random.Random(seed)
+    draws = {ref: [] for ref in refs}
+    for _ in range(n_boot):
+        tally = Counter(rng.choices(ref_ids, k=len(ref_ids)))
+        for ref in refs:
+            draws[ref].append(tally[ref])
+    lo, hi = int(n_boot * alpha / 2), int(n_boot * (1 - alpha / 2)) - 1
+    intervals = {}
+    for ref, d in draws.items():
+        d.sort()  # Sort each draw list once for both percentiles
+        intervals[ref] = (d[lo], d[hi])
+    return intervals
+"""
+
+# Expects app_number and noa_bag (NOA documents) in scope; sets noa_content
+NOA_EXTRACTION_BLOCK: Final[str] = """# Sequential on purpose: content extraction may fall back to paid OCR, and
+# concurrent calls would pay for NOAs whose text is then discarded. Try one
+# NOA at a time and stop at the first that yields text.
+noa_content = None
+for noa_doc in noa_bag:
+    try:
+        noa_content = await pfw_get_document_content(
+            app_number=app_number,
+            document_identifier=noa_doc['documentIdentifier']
+        )
+    except Exception:
+        continue
+    if noa_content:
+        break
+"""
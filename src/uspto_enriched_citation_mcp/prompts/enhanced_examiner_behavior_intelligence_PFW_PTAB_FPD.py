@@ -14,41 +14,16 @@ This enhanced version includes:
 - Complete download workflows and presentation formatting
 """
 
-from . import mcp
-
-
-@mcp.prompt(
-    name="enhanced_examiner_behavior_intelligence_PFW_PTAB_FPD",
-    description="ENHANCED: Comprehensive examiner profiling with citation patterns, petition history, PTAB correlation, and strategic prosecution recommendations. At least ONE parameter required (examiner_name, art_unit, or technology_keywords). Citations data Oct 1, 2017+ only. Requires PFW, Citations, FPD, and PTAB MCPs.",
-)
-async def enhanced_examiner_behavior_intelligence_PFW_PTAB_FPD_prompt(
-    examiner_name: str = "", art_unit: str = "", technology_keywords: str = ""
-) -> str:
-    """Generate comprehensive examiner profiles combining prosecution patterns, citation behavior,
-    petition history, and PTAB challenge correlation for strategic prosecution planning.
+import functools
+from string import Template
+from typing import Final
 
-    MANDATORY FIRST STEP: Validate the provided parameters and immediately begin analysis using
-    any non-empty parameter. If ALL parameters are empty, ask the user to provide at least one
-    search parameter.
+from . import mcp
 
-    This is a COMPREHENSIVE MULTI-PHASE workflow:
-    1. PFW: Get examiner's applications with wildcard search + ultra-minimal fields
-    2. Citations: Analyze citation patterns with 2017+ date filtering
-    3. PFW: NOA deep dive for allowance reasoning patterns
-    4. PFW: Prosecution efficiency metrics (RCE, finals, amendments)
-    5. FPD: Petition history for quality assessment
-    6. PTAB: Post-grant challenge correlation
-    7. Generate comprehensive intelligence report with strategic recommendations
+# Bound once; register_prompts() sets mcp before importing this module
+_prompt = mcp.prompt
 
-    Args:
-        examiner_name: Examiner last name or full name (e.g., 'SMITH' or 'SMITH, JOHN')
-        art_unit: Optional art unit number for filtering (e.g., '2854')
-        technology_keywords: Optional technology focus areas
-    """
-
-    # Validate inputs
-    if not examiner_name and not art_unit and not technology_keywords:
-        return """
+_MISSING_PARAMS_MSG: Final[str] = """
 # ENHANCED EXAMINER BEHAVIOR INTELLIGENCE SYSTEM
 
 ❌ **ERROR: Missing Search Parameters**
@@ -68,13 +43,15 @@ technology_keywords='semiconductor'
 **Recommended:** Provide examiner name AND art unit for best results and fastest execution.
 """
 
-    return f"""
+# Built once at import; rendered per distinct parameter combination
+_PROMPT_TEMPLATE: Final[Template] = Template(
+    """
 # ENHANCED EXAMINER BEHAVIOR INTELLIGENCE SYSTEM
 
 **Target Analysis:**
-- **Examiner**: {examiner_name or "Not specified"}
-- **Art Unit**: {art_unit or "Not specified"}
-- **Technology Focus**: {technology_keywords or "Not specified"}
+- **Examiner**: ${examiner_name_display}
+- **Art Unit**: ${art_unit_display}
+- **Technology Focus**: ${technology_keywords_display}
 
 **Data Coverage Notes:**
 - **Citations MCP:** Office actions from Oct 1, 2017+ only
@@ -91,11 +68,72 @@ technology_keywords='semiconductor'
 **⚠️ CRITICAL:** Use wildcard search + ultra-minimal fields (99% token reduction)
 
 ```python
+import asyncio
 from collections import Counter
+import heapq
+from itertools import islice
+from operator import itemgetter
+import math
+import io
+import random
 import statistics
+import sys
+
+# Collect each phase's report in memory and write it once at the phase end.
+# Swapping sys.stdout works for any stream (terminal, StringIO, Jupyter).
+phase_stdout = None
+
+def end_phase():
+    global phase_stdout
+    if phase_stdout is not None:
+        report, sys.stdout = sys.stdout.getvalue(), phase_stdout
+        phase_stdout = None
+        sys.stdout.write(report)
+        sys.stdout.flush()
+
+def begin_phase():
+    global phase_stdout
+    end_phase()  # Write out any phase that stopped before its end_phase()
+    phase_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+
+begin_phase()
+
+# Every tool call in this analysis is awaited through call_with_backoff(), which
+# bounds concurrency with one shared semaphore sized to the APIs'
+# concurrent-request budget and retries with backoff
+API_CONCURRENCY = 8
+api_semaphore = asyncio.Semaphore(API_CONCURRENCY)
+
+# Only throttling and transient failures are worth retrying; validation,
+# auth and not-found errors fail the same way on every attempt
+TRANSIENT_ERROR_TYPES = {'RateLimitError', 'APITimeoutError', 'APIConnectionError', 'APIUnavailableError'}
+TRANSIENT_ERROR_MARKERS = (
+    '429', 'rate limit', 'too many requests', '502', '503', '504',
+    'timeout', 'timed out', 'temporarily unavailable', 'connection reset'
+)
+
+def is_transient_error(exc):
+    if isinstance(exc, (TimeoutError, ConnectionError)) or type(exc).__name__ in TRANSIENT_ERROR_TYPES:
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in TRANSIENT_ERROR_MARKERS)
+
+async def call_with_backoff(tool, attempts=3, **kwargs):
+    # Retry a rate-limited or transient tool failure with exponential backoff
+    # plus jitter so throttled requests do not all retry at the same instant
+    for attempt in range(attempts):
+        try:
+            async with api_semaphore:
+                return await tool(**kwargs)
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient_error(e):
+                raise
+        # Sleep outside the semaphore so waiting retries do not hold a slot
+        await asyncio.sleep(min(10, 2 ** attempt) * random.uniform(0.5, 1.5))
 
 # Extract last name for wildcard search
-examiner_input = "{examiner_name}"
+examiner_input = "${examiner_name}"
 if ',' in examiner_input:
     last_name = examiner_input.split(',')[0].strip()
     full_name_search = examiner_input.replace(',', '').strip()
@@ -104,29 +142,30 @@ else:
     full_name_search = last_name
 
 # Build targeted query with art unit filter if provided
-art_unit_input = "{art_unit}"
-tech_keywords_input = "{technology_keywords}"
+art_unit_input = "${art_unit}"
+tech_keywords_input = "${technology_keywords}"
 
 if art_unit_input:
     art_unit_prefix = art_unit_input[:3]  # "1759" → "175" for broader coverage
-    query = f'examinerNameText:{{{{last_name}}}}* AND groupArtUnitNumber:{{{{art_unit_prefix}}}}*'
+    query = f'examinerNameText:{{last_name}}* AND groupArtUnitNumber:{{art_unit_prefix}}*'
 else:
-    query = f'examinerNameText:{{{{last_name}}}}*'
+    query = f'examinerNameText:{{last_name}}*'
 
 # Add technology filter if specified
 if tech_keywords_input:
-    query += f' AND inventionTitle:({{{{tech_keywords_input}}}})'
+    query += f' AND inventionTitle:({{tech_keywords_input}})'
 
 # Add filing date filter (2015+ accounts for 2-year lag to 2017+ citation data)
 query += ' AND filingDate:[2015-01-01 TO *]'
 
-print(f"🔍 **Searching for examiner:** {{last_name}}")
-print(f"📋 **Query:** `{{query}}`")
+print(f"🔍 **Searching for examiner:** {last_name}")
+print(f"📋 **Query:** `{query}`")
 print()
 
 # STEP 1: Get examiner's application portfolio (ULTRA-MINIMAL MODE)
 try:
-    results = pfw_search_applications_minimal(
+    results = await call_with_backoff(
+        pfw_search_applications_minimal,
         query=query,
         fields=['applicationNumberText', 'applicationMetaData.examinerNameText',
                 'applicationMetaData.groupArtUnitNumber', 'patentGrantDate',
@@ -138,13 +177,13 @@ try:
     total_found = results.get('searchResultsTotalSize', 0)
     applications = results.get('applications', [])
 
-    print(f"✅ **Found {{total_found}} total applications**")
-    print(f"📦 **Retrieved {{len(applications)}} for analysis**")
+    print(f"✅ **Found {total_found} total applications**")
+    print(f"📦 **Retrieved {len(applications)} for analysis**")
     print()
 
 except Exception as e:
     print(f"❌ **ERROR:** Failed to retrieve examiner applications")
-    print(f"   Error details: {{str(e)[:200]}}")
+    print(f"   Error details: {str(e)[:200]}")
     print()
     print("**Troubleshooting:**")
     print("  - Verify examiner name spelling")
@@ -157,7 +196,7 @@ except Exception as e:
 # Validate sufficient data
 min_sample_size = 20
 if len(applications) < min_sample_size:
-    print(f"⚠️ **WARNING:** Only {{len(applications)}} applications found (minimum {{min_sample_size}} recommended)")
+    print(f"⚠️ **WARNING:** Only {len(applications)} applications found (minimum {min_sample_size} recommended)")
     print()
     print("**Options:**")
     print("  1. Continue with limited data (results may have low statistical confidence)")
@@ -172,12 +211,20 @@ if len(applications) < min_sample_size:
 ### 1.2 Portfolio Overview & Examiner Name Disambiguation
 
 ```python
-# Extract examiner names from results
-examiner_names = Counter([
-    app.get('applicationMetaData', {{}}).get('examinerNameText')
-    for app in applications
-    if app.get('applicationMetaData', {{}}).get('examinerNameText')
-])
+# Single pass over applications: examiner names, art units, and status distribution
+examiner_names = Counter()
+art_units = Counter()
+status_dist = Counter()
+empty_meta = {}
+
+for app in applications:
+    meta = app.get('applicationMetaData') or empty_meta
+    if name := meta.get('examinerNameText'):
+        examiner_names[name] += 1
+    if unit := meta.get('groupArtUnitNumber'):
+        art_units[unit] += 1
+    if status := meta.get('appStatusDescText'):
+        status_dist[status] += 1
 
 # Check for multiple examiners with similar names
 if len(examiner_names) > 1:
@@ -185,62 +232,50 @@ if len(examiner_names) > 1:
     print()
     for name, count in examiner_names.most_common():
         pct = (count / len(applications)) * 100
-        print(f"  - **{{name}}**: {{count}} apps ({{pct:.1f}}%)")
+        print(f"  - **{name}**: {count} apps ({pct:.1f}%)")
     print()
 
     primary_examiner = examiner_names.most_common(1)[0][0]
-    print(f"🎯 **Recommendation:** Filter to primary examiner: '{{primary_examiner}}'")
+    print(f"🎯 **Recommendation:** Filter to primary examiner: '{primary_examiner}'")
     print()
     print("**To filter to specific examiner:**")
     print(f"```python")
-    print(f"target_examiner = '{{primary_examiner}}'")
+    print(f"target_examiner = '{primary_examiner}'")
     print(f"applications = [app for app in applications")
-    print(f"               if app.get('applicationMetaData', {{}}).get('examinerNameText') == target_examiner]")
-    print(f"print(f'✅ Filtered to {{{{len(applications)}}}} applications for {{{{target_examiner}}}}')")
+    print(f"               if app.get('applicationMetaData', {}).get('examinerNameText') == target_examiner]")
+    print(f"print(f'✅ Filtered to {{len(applications)}} applications for {{target_examiner}}')")
     print(f"```")
     print()
     # USER DECISION POINT - Let user filter if desired
 else:
     primary_examiner = examiner_names.most_common(1)[0][0] if examiner_names else "Unknown"
-    print(f"✅ **Single examiner identified:** {{primary_examiner}}")
+    print(f"✅ **Single examiner identified:** {primary_examiner}")
     print()
 
-# Analyze art unit distribution
-art_units = Counter([
-    app.get('applicationMetaData', {{}}).get('groupArtUnitNumber')
-    for app in applications
-    if app.get('applicationMetaData', {{}}).get('groupArtUnitNumber')
-])
-
+# Art unit distribution (counted in the single pass above)
 primary_art_unit = art_units.most_common(1)[0] if art_units else ("Unknown", 0)
 
-# Status distribution
-status_dist = Counter([
-    app.get('applicationMetaData', {{}}).get('appStatusDescText')
-    for app in applications
-    if app.get('applicationMetaData', {{}}).get('appStatusDescText')
-])
-
 # Display portfolio overview
 print("### Examiner Portfolio Overview")
 print()
-print(f"**Examiner:** {{primary_examiner}}")
-print(f"**Primary Art Unit:** {{primary_art_unit[0]}} ({{primary_art_unit[1]}} apps, {{(primary_art_unit[1]/len(applications)*100):.1f}}%)")
-print(f"**Art Units Covered:** {{len(art_units)}}")
-print(f"**Total Applications Analyzed:** {{len(applications)}}")
+print(f"**Examiner:** {primary_examiner}")
+print(f"**Primary Art Unit:** {primary_art_unit[0]} ({primary_art_unit[1]} apps, {(primary_art_unit[1]/len(applications)*100):.1f}%)")
+print(f"**Art Units Covered:** {len(art_units)}")
+print(f"**Total Applications Analyzed:** {len(applications)}")
 print()
 
 print("**Art Unit Distribution:**")
 for unit, count in art_units.most_common(5):
     pct = (count / len(applications)) * 100
-    print(f"  - Art Unit {{unit}}: {{count}} apps ({{pct:.1f}}%)")
+    print(f"  - Art Unit {unit}: {count} apps ({pct:.1f}%)")
 print()
 
 print("**Application Status Distribution:**")
 for status, count in status_dist.most_common(5):
     pct = (count / len(applications)) * 100
-    print(f"  - {{status}}: {{count}} ({{pct:.1f}}%)")
+    print(f"  - {status}: {count} ({pct:.1f}%)")
 print()
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -252,6 +287,7 @@ print()
 **⚠️ DATE CONSTRAINT:** Citation API has office action dates from 2017-10-01 forward only!
 
 ```python
+begin_phase()
 print("---")
 print()
 print("### Citation Behavior Analysis")
@@ -263,10 +299,10 @@ print()
 # Office actions typically occur 1-2 years after filing
 citation_eligible_apps = [
     app for app in applications
-    if app.get('applicationMetaData', {{}}).get('filingDate', '') >= '2015-01-01'
+    if app.get('applicationMetaData', {}).get('filingDate', '') >= '2015-01-01'
 ]
 
-print(f"🎯 **Citation-Eligible Applications:** {{len(citation_eligible_apps)}} (filed 2015+)")
+print(f"🎯 **Citation-Eligible Applications:** {len(citation_eligible_apps)} (filed 2015+)")
 print()
 
 # Sort by application number (descending) - higher numbers = more recent = better citation coverage
@@ -282,90 +318,111 @@ sample_size = min(30, len(citation_eligible_apps_sorted))
 sample_apps = citation_eligible_apps_sorted[:sample_size]
 
 print(f"📊 **Sorted by application number (most recent first) for optimal citation coverage**")
-print(f"    Sample range: {{sample_apps[0].get('applicationNumberText') if sample_apps else 'N/A'}} to {{sample_apps[-1].get('applicationNumberText') if len(sample_apps) > 1 else 'N/A'}}")
+print(f"    Sample range: {sample_apps[0].get('applicationNumberText') if sample_apps else 'N/A'} to {sample_apps[-1].get('applicationNumberText') if len(sample_apps) > 1 else 'N/A'}")
 print()
 
-print(f"📊 **Analyzing {{sample_size}} applications for citation patterns...**")
+print(f"📊 **Analyzing {sample_size} applications for citation patterns...**")
 print()
-print("⚠️ **IMPORTANT:** Must search ALL {{sample_size}} applications individually - do not skip or aggregate!")
+print("⚠️ **IMPORTANT:** Must search ALL {sample_size} applications individually - do not skip or aggregate!")
 print()
 
-# Aggregate citation data
-all_citations = []
-examiner_cited_count = 0
-applicant_cited_count = 0
+# Aggregate citation data as parallel arrays (only the fields used downstream)
+from array import array
+from datetime import date
+
+MONTH_ABBR = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+def format_oa_month(date_str):
+    # Format as Mon YYYY (e.g., "Jan 2025")
+    try:
+        d = date.fromisoformat(date_str[:10])
+        return f"{MONTH_ABBR[d.month]} {d.year}"
+    except (ValueError, TypeError):
+        # Non-ISO strings and non-string values (e.g. epoch numbers)
+        return str(date_str)[:7]  # Fallback to YYYY-MM
+
+is_examiner_cited = array('b')  # 1 = examiner-cited, 0 = applicant-cited, per citation
+examiner_categories = []  # citationCategoryCode of each examiner-cited reference
 apps_with_citations = 0
 citation_errors = 0
 app_citation_details = []  # Track per-app citation counts for temporal analysis
 
-# CRITICAL: Must iterate through ALL sample_apps - do not stop early even if some have no citations
-for i, app in enumerate(sample_apps, 1):
-    app_number = app.get('applicationNumberText')
-
-    # Progress indicator - log EVERY application searched
-    print(f"  [{{i}}/{{sample_size}}] Searching citations for {{app_number}}...")
-
+# CRITICAL: Must search ALL sample_apps - do not stop early even if some have no citations
+# Searches run concurrently (max 8 in flight to respect rate limits); if your environment
+# cannot await tool calls, issue them as parallel tool calls in batches of 8 instead
+async def fetch_app_citations(app):
     try:
         # Get citations (use application_number only - date filtering automatic)
-        citations = search_citations_minimal(
-            application_number=app_number,
+        return app, await call_with_backoff(
+            search_citations_minimal,
+            application_number=app.get('applicationNumberText'),
             rows=100  # Increased to capture all citations
         )
+    except Exception as e:
+        return app, e
 
-        citation_count = citations.get('response', {{}}).get('numFound', 0)
-
-        if citation_count > 0:
-            apps_with_citations += 1
-            citation_records = citations.get('response', {{}}).get('docs', [])
-            all_citations.extend(citation_records)
-
-            # Extract office action dates for temporal analysis
-            oa_dates = [cite.get('officeActionDate', '') for cite in citation_records if cite.get('officeActionDate')]
-            oa_dates_formatted = []
-            for date_str in oa_dates:
-                if date_str:
-                    try:
-                        # Format as Mon YYYY (e.g., "Jan 2025")
-                        from datetime import datetime
-                        dt = datetime.strptime(date_str[:10], '%Y-%m-%d')
-                        oa_dates_formatted.append(dt.strftime('%b %Y'))
-                    except:
-                        oa_dates_formatted.append(date_str[:7])  # Fallback to YYYY-MM
-
-            # Store application citation details
-            app_citation_details.append({{
-                'app_number': app_number,
-                'citation_count': citation_count,
-                'oa_dates': list(set(oa_dates_formatted))  # Unique dates
-            }})
-
-            # Count examiner vs applicant citations
-            for cite in citation_records:
-                if cite.get('examinerCitedReferenceIndicator') == 'true':
-                    examiner_cited_count += 1
-                else:
-                    applicant_cited_count += 1
+citation_results = await asyncio.gather(*(fetch_app_citations(app) for app in sample_apps))
 
-    except Exception as e:
+# Aggregate in one serial pass (results keep sample_apps order)
+progress_lines = []
+for i, (app, citations) in enumerate(citation_results, 1):
+    app_number = app.get('applicationNumberText')
+
+    # Progress indicator - log EVERY application searched
+    progress_lines.append(f"  [{i}/{sample_size}] Searched citations for {app_number}")
+
+    if isinstance(citations, Exception):
         citation_errors += 1
         # Log first few errors for debugging
         if citation_errors <= 3:
-            print(f"  ⚠️ Error searching citations for {{app_number}}: {{str(e)[:100]}}")
+            progress_lines.append(f"  ⚠️ Error searching citations for {app_number}: {str(citations)[:100]}")
         # Gracefully continue processing other applications
         continue
 
+    citation_count = citations.get('response', {}).get('numFound', 0)
+
+    if citation_count > 0:
+        apps_with_citations += 1
+        citation_records = citations.get('response', {}).get('docs', [])
+
+        # Extract office action dates for temporal analysis
+        oa_dates_formatted = [
+            format_oa_month(date_str)
+            for cite in citation_records
+            if (date_str := cite.get('officeActionDate'))
+        ]
+
+        # Store application citation details
+        app_citation_details.append({
+            'app_number': app_number,
+            'citation_count': citation_count,
+            'oa_dates': list(set(oa_dates_formatted))  # Unique dates
+        })
+
+        # Record examiner vs applicant source (and category for examiner citations)
+        for cite in citation_records:
+            examiner_cited = cite.get('examinerCitedReferenceIndicator') == 'true'
+            is_examiner_cited.append(examiner_cited)
+            if examiner_cited:
+                examiner_categories.append(cite.get('citationCategoryCode', 'Unknown'))
+
+print("\\n".join(progress_lines))
+
+total_citations_collected = len(is_examiner_cited)
+examiner_cited_count = sum(is_examiner_cited)
+applicant_cited_count = total_citations_collected - examiner_cited_count
 print()
 print(f"✅ **Citation Analysis Complete**")
-print(f"  - Applications with citations: {{apps_with_citations}}/{{sample_size}} ({{(apps_with_citations/sample_size*100):.1f}}%)")
-print(f"  - Total citations collected: {{len(all_citations)}}")
+print(f"  - Applications with citations: {apps_with_citations}/{sample_size} ({(apps_with_citations/sample_size*100):.1f}%)")
+print(f"  - Total citations collected: {total_citations_collected}")
 if citation_errors > 0:
-    print(f"  - Errors/No data: {{citation_errors}} applications")
+    print(f"  - Errors/No data: {citation_errors} applications")
 print()
 
 # Validate citation data sufficiency
 citation_coverage = (apps_with_citations / sample_size) * 100 if sample_size > 0 else 0
 if citation_coverage < 30:
-    print(f"⚠️ **WARNING: Low citation coverage ({{citation_coverage:.1f}}%)**")
+    print(f"⚠️ **WARNING: Low citation coverage ({citation_coverage:.1f}%)**")
     print()
     print("**Possible causes:**")
     print("  - Applications filed before 2015 (pre-coverage period)")
@@ -391,7 +448,7 @@ if len(app_citation_details) > 0:
     if all_oa_dates:
         # Sort dates to find range
         all_oa_dates_sorted = sorted(set(all_oa_dates))
-        print(f"**Office Action Dates Range:** {{all_oa_dates_sorted[0]}} to {{all_oa_dates_sorted[-1]}}")
+        print(f"**Office Action Dates Range:** {all_oa_dates_sorted[0]} to {all_oa_dates_sorted[-1]}")
         print()
         print("**Data Coverage Note:** Citation API captures office actions from Oct 1, 2017+ only")
         print()
@@ -407,6 +464,9 @@ if len(app_citation_details) > 0:
     moderate_density = []
     low_density = []
 
+    # Highest count computed once (list is non-empty inside this branch)
+    max_citation_count = app_citation_details_sorted[0]['citation_count']
+
     for app_detail in app_citation_details_sorted:
         app_num = app_detail['app_number']
         cite_count = app_detail['citation_count']
@@ -427,27 +487,27 @@ if len(app_citation_details) > 0:
             density_note = ""
 
         # Special note for highest
-        if cite_count == max([a['citation_count'] for a in app_citation_details]):
+        if cite_count == max_citation_count:
             density_note = " - Highest citation density"
 
-        print(f"  - **{{app_num}}**: {{cite_count}} citations ({{oa_dates_str}}){{density_note}}")
+        print(f"  - **{app_num}**: {cite_count} citations ({oa_dates_str}){density_note}")
 
     print()
     print("**Citation Density Insights:**")
     print()
 
     if high_density:
-        print(f"  - **High-density applications (10+ citations):** {{len(high_density)}} applications")
+        print(f"  - **High-density applications (10+ citations):** {len(high_density)} applications")
         print(f"      → Suggests complex claim scope or highly competitive technical areas")
         print()
 
     if moderate_density:
-        print(f"  - **Moderate-density (4-9 citations):** {{len(moderate_density)}} applications")
+        print(f"  - **Moderate-density (4-9 citations):** {len(moderate_density)} applications")
         print(f"      → Indicates standard prosecution complexity")
         print()
 
     if low_density:
-        print(f"  - **Low-density (2-3 citations):** {{len(low_density)}} applications")
+        print(f"  - **Low-density (2-3 citations):** {len(low_density)} applications")
         print(f"      → Suggests narrower claim scope or clearer patentability")
         print()
 ```
@@ -455,34 +515,29 @@ if len(app_citation_details) > 0:
 ### 2.2 Enhanced Citation Behavior Analysis with Strategic Interpretation
 
 ```python
-if len(all_citations) > 0:
+if total_citations_collected > 0:
     total_cites = examiner_cited_count + applicant_cited_count
     examiner_rate = (examiner_cited_count / total_cites) * 100 if total_cites > 0 else 0
 
     print("### Citation Behavior Metrics")
     print()
     print(f"**Overall Citation Statistics:**")
-    print(f"  - Total Citations: {{total_cites}}")
-    print(f"  - Examiner-Cited: {{examiner_cited_count}} ({{examiner_rate:.1f}}%)")
-    print(f"  - Applicant-Cited: {{applicant_cited_count}} ({{100-examiner_rate:.1f}}%)")
-    print(f"  - Citations per Application: {{total_cites / apps_with_citations:.1f}}")
-    print(f"  - Examiner Citations per Application: {{examiner_cited_count / apps_with_citations:.1f}}")
+    print(f"  - Total Citations: {total_cites}")
+    print(f"  - Examiner-Cited: {examiner_cited_count} ({examiner_rate:.1f}%)")
+    print(f"  - Applicant-Cited: {applicant_cited_count} ({100-examiner_rate:.1f}%)")
+    print(f"  - Citations per Application: {total_cites / apps_with_citations:.1f}")
+    print(f"  - Examiner Citations per Application: {examiner_cited_count / apps_with_citations:.1f}")
     print()
 
-    # Category analysis (examiner-cited only)
-    examiner_citations = [c for c in all_citations if c.get('examinerCitedReferenceIndicator') == 'true']
-
-    categories = Counter([
-        c.get('citationCategoryCode', 'Unknown')
-        for c in examiner_citations
-    ])
+    # Category analysis (examiner-cited only, collected during Phase 2.1)
+    categories = Counter(examiner_categories)
 
     print("**Examiner Citation Category Preferences:**")
     for cat, count in categories.most_common():
         pct = (count / examiner_cited_count) * 100 if examiner_cited_count > 0 else 0
 
         # Enhanced category interpretation with descriptions
-        cat_desc = {{
+        cat_desc = {
             'X': 'X (Alone anticipates - single reference rejection)',
             'Y': 'Y (Combination anticipates - obviousness rejection)',
             'A': 'A (General background art)',
@@ -494,9 +549,9 @@ if len(all_citations) > 0:
             'L': 'L (Earlier-filed prior art)',
             'I': 'I (Related to interfering patent)',
             'T': 'T (Later-filed prior art)'
-        }}.get(cat, cat)
+        }.get(cat, cat)
 
-        print(f"  - {{cat_desc}}: {{count}} ({{pct:.1f}}%)")
+        print(f"  - {cat_desc}: {count} ({pct:.1f}%)")
     print()
 
     # Strategic interpretation based on citation patterns
@@ -512,31 +567,31 @@ if len(all_citations) > 0:
         x_rate = (x_citations / xy_total) * 100
         print("**Rejection Strategy Pattern:**")
         if x_rate > 60:
-            print(f"  - ⚠️ **High X-Citation Rate ({{x_rate:.0f}}%):** Examiner frequently finds single-reference anticipation")
+            print(f"  - ⚠️ **High X-Citation Rate ({x_rate:.0f}%):** Examiner frequently finds single-reference anticipation")
             print(f"      → **Implication:** Claim scope likely too broad for this examiner")
             print(f"      → **Strategy:** Consider narrower claims with specific implementation details")
         elif x_rate < 30:
-            print(f"  - ✅ **Low X-Citation Rate ({{x_rate:.0f}}%):** Examiner relies on combination rejections")
+            print(f"  - ✅ **Low X-Citation Rate ({x_rate:.0f}%):** Examiner relies on combination rejections")
             print(f"      → **Implication:** Claims avoid single-reference anticipation")
             print(f"      → **Strategy:** Focus arguments on lack of motivation to combine and non-obvious differences")
         else:
-            print(f"  - 📊 **Balanced X/Y Citations ({{x_rate:.0f}}% X, {{100-x_rate:.0f}}% Y):** Mixed anticipation/obviousness approach")
+            print(f"  - 📊 **Balanced X/Y Citations ({x_rate:.0f}% X, {100-x_rate:.0f}% Y):** Mixed anticipation/obviousness approach")
             print(f"      → **Strategy:** Prepare for both anticipation and obviousness rejections")
         print()
 
     # Examiner citation selectivity (IDS strategy guidance)
     print("**Citation Source Selectivity (IDS Strategy Guidance):**")
     if examiner_rate > 75:
-        print(f"  - 🎯 **Highly Selective ({{examiner_rate:.0f}}% examiner-cited):** Rarely uses applicant-cited references")
+        print(f"  - 🎯 **Highly Selective ({examiner_rate:.0f}% examiner-cited):** Rarely uses applicant-cited references")
         print(f"      → **IDS Strategy:** Focus on technical distinctions over comprehensive IDS")
         print(f"      → **Rationale:** Examiner conducts own search, rarely adopts applicant references")
         print(f"      → **Action:** File targeted IDS with detailed non-applicability explanations")
     elif examiner_rate > 50:
-        print(f"  - 📋 **Moderately Selective ({{examiner_rate:.0f}}% examiner-cited):** Uses some applicant-cited references")
+        print(f"  - 📋 **Moderately Selective ({examiner_rate:.0f}% examiner-cited):** Uses some applicant-cited references")
         print(f"      → **IDS Strategy:** Strategic filing of closest prior art with commentary")
         print(f"      → **Action:** Include key references with substantive explanations of differences")
     else:
-        print(f"  - 📚 **Low Selectivity ({{examiner_rate:.0f}}% examiner-cited):** Frequently uses applicant-cited references")
+        print(f"  - 📚 **Low Selectivity ({examiner_rate:.0f}% examiner-cited):** Frequently uses applicant-cited references")
         print(f"      → **IDS Strategy:** Comprehensive disclosure can help frame prosecution narrative")
         print(f"      → **Action:** Strategic IDS with detailed explanations to shape examiner's understanding")
     print()
@@ -545,14 +600,14 @@ if len(all_citations) > 0:
     avg_examiner_cites = examiner_cited_count / apps_with_citations
     print("**Citation Density (Prior Art Search Thoroughness):**")
     if avg_examiner_cites > 15:
-        print(f"  - 📚 **High Citation Density ({{avg_examiner_cites:.1f}} citations/app):** Very thorough prior art searcher")
+        print(f"  - 📚 **High Citation Density ({avg_examiner_cites:.1f} citations/app):** Very thorough prior art searcher")
         print(f"      → **Implication:** Expect extensive, detailed office actions")
         print(f"      → **Strategy:** Prepare comprehensive responses with detailed technical distinctions")
     elif avg_examiner_cites > 8:
-        print(f"  - 📊 **Moderate Citation Density ({{avg_examiner_cites:.1f}} citations/app):** Standard search thoroughness")
+        print(f"  - 📊 **Moderate Citation Density ({avg_examiner_cites:.1f} citations/app):** Standard search thoroughness")
         print(f"      → **Strategy:** Standard response approach with clear technical arguments")
     else:
-        print(f"  - 📄 **Low Citation Density ({{avg_examiner_cites:.1f}} citations/app):** Focused search approach")
+        print(f"  - 📄 **Low Citation Density ({avg_examiner_cites:.1f} citations/app):** Focused search approach")
         print(f"      → **Implication:** Examiner identifies strongest references quickly")
         print(f"      → **Strategy:** Focus on distinguishing key references cited")
     print()
@@ -567,6 +622,7 @@ else:
     print()
     print("📋 **Continuing with prosecution pattern analysis (citations unavailable)...**")
     print()
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -576,19 +632,23 @@ else:
 ### 3.1 Strategic NOA Selection for Pattern Detection
 
 ```python
+begin_phase()
 print("---")
 print()
 print("### Allowance Reasoning Analysis (NOA Deep Dive)")
 print()
 
+# Ultra-minimal document fields: only what the NOA and prosecution analyses read
+document_fields = ['documentIdentifier', 'documentCode', 'directionCategory', 'mailRoomDate', 'pageCount']
+
 # Find granted patents for NOA analysis
 granted_apps = [
     app for app in applications
     if app.get('patentNumber') or
-       app.get('applicationMetaData', {{}}).get('appStatusDescText') == 'Patented Case'
+       app.get('applicationMetaData', {}).get('appStatusDescText') == 'Patented Case'
 ]
 
-print(f"📊 **Granted Patents Found:** {{len(granted_apps)}}")
+print(f"📊 **Granted Patents Found:** {len(granted_apps)}")
 print()
 
 if len(granted_apps) == 0:
@@ -600,7 +660,7 @@ else:
     # Sort by issue date (most recent first)
     granted_sorted = sorted(
         granted_apps,
-        key=lambda x: x.get('patentGrantDate', x.get('applicationMetaData', {{}}).get('patentGrantDate', '')),
+        key=lambda x: x.get('patentGrantDate', x.get('applicationMetaData', {}).get('patentGrantDate', '')),
         reverse=True
     )
 
@@ -608,7 +668,7 @@ else:
     noa_sample_size = min(5, len(granted_sorted))
     representative_patents = granted_sorted[:noa_sample_size]
 
-    print(f"📋 **Analyzing {{noa_sample_size}} recent NOAs for allowance patterns...**")
+    print(f"📋 **Analyzing {noa_sample_size} recent NOAs for allowance patterns...**")
     print()
 
     noa_insights = []
@@ -617,31 +677,34 @@ else:
     for idx, patent in enumerate(representative_patents, 1):
         app_number = patent.get('applicationNumberText')
         patent_number = patent.get('patentNumber', 'N/A')
-        title = patent.get('applicationMetaData', {{}}).get('inventionTitle', 'Unknown')
-        issue_date = patent.get('patentGrantDate', patent.get('applicationMetaData', {{}}).get('patentGrantDate', 'N/A'))
+        title = patent.get('applicationMetaData', {}).get('inventionTitle', 'Unknown')
+        issue_date = patent.get('patentGrantDate', patent.get('applicationMetaData', {}).get('patentGrantDate', 'N/A'))
 
-        print(f"**NOA {{idx}}/{{noa_sample_size}}: Patent {{patent_number}}**")
+        print(f"**NOA {idx}/{noa_sample_size}: Patent {patent_number}**")
         title_display = title[:80] + ('...' if len(title) > 80 else '')
-        print(f"  - Title: {{title_display}}")
-        print(f"  - Issue Date: {{issue_date}}")
+        print(f"  - Title: {title_display}")
+        print(f"  - Issue Date: {issue_date}")
 
         # Get NOA document
         try:
-            noa_docs = pfw_get_application_documents(
+            noa_docs = await call_with_backoff(
+                pfw_get_application_documents,
                 app_number=app_number,
                 document_code='NOA',
+                fields=document_fields,
                 limit=1
             )
 
-            if noa_docs.get('documentBag') and len(noa_docs['documentBag']) > 0:
+            if noa_docs.get('documentBag'):
                 noa_doc = noa_docs['documentBag'][0]
                 page_count = noa_doc.get('pageCount', 'Unknown')
                 doc_id = noa_doc.get('documentIdentifier')
 
-                print(f"  - NOA Pages: {{page_count}}")
+                print(f"  - NOA Pages: {page_count}")
 
                 # Extract NOA content (auto-optimize: PyPDF2 first, Mistral fallback)
-                noa_content = pfw_get_document_content(
+                noa_content = await call_with_backoff(
+                    pfw_get_document_content,
                     app_number=app_number,
                     document_identifier=doc_id,
                     auto_optimize=True  # 70% cost savings vs Mistral-only
@@ -652,28 +715,28 @@ else:
                 cost = noa_content.get('processing_cost_usd', 0.0)
                 total_noa_cost += cost
 
-                print(f"  - Extracted: {{len(extracted_text)}} chars via {{extraction_method}}")
-                print(f"  - Cost: ${{cost:.3f}}")
+                print(f"  - Extracted: {len(extracted_text)} chars via {extraction_method}")
+                print(f"  - Cost: $${cost:.3f}")
 
                 # Store for cross-NOA pattern analysis
-                noa_insights.append({{
+                noa_insights.append({
                     'patent_number': patent_number,
                     'app_number': app_number,
                     'title': title,
                     'noa_text': extracted_text,
                     'page_count': page_count
-                }})
+                })
 
                 print(f"  - ✅ NOA extracted successfully")
             else:
                 print(f"  - ⚠️ NOA document not found in file wrapper")
 
         except Exception as e:
-            print(f"  - ❌ Error extracting NOA: {{str(e)[:100]}}")
+            print(f"  - ❌ Error extracting NOA: {str(e)[:100]}")
 
         print()
 
-    print(f"**Total NOA extraction cost:** ${{total_noa_cost:.3f}}")
+    print(f"**Total NOA extraction cost:** $${total_noa_cost:.3f}")
     print()
 
     # Cross-NOA pattern analysis
@@ -682,7 +745,7 @@ else:
         print()
 
         # Common allowance reasoning keywords
-        allowance_keywords = {{
+        allowance_keywords = {
             'specification': 0,
             'detailed description': 0,
             'written description': 0,
@@ -695,23 +758,33 @@ else:
             'motivation': 0,
             'combination': 0,
             'unexpected': 0
-        }}
+        }
+
+        # Count keyword occurrences across all NOAs with one scan per NOA
+        # Lookahead catches overlapping matches; longest keywords are tried first
+        import re
+        keyword_pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(k) for k in sorted(allowance_keywords, key=len, reverse=True)) + '))'
+        )
+        # A longer match implies the keywords it contains (e.g. 'specification' → 'specific')
+        implied_keywords = {
+            k: [other for other in allowance_keywords if other in k]
+            for k in allowance_keywords
+        }
 
-        # Count keyword occurrences across all NOAs
         for noa in noa_insights:
-            text_lower = noa['noa_text'].lower()
-            for keyword in allowance_keywords:
-                if keyword in text_lower:
-                    allowance_keywords[keyword] += 1
+            matched = set(keyword_pattern.findall(noa['noa_text'].lower()))
+            for keyword in {kw for m in matched for kw in implied_keywords[m]}:
+                allowance_keywords[keyword] += 1
 
         # Identify top patterns
         sorted_keywords = sorted(allowance_keywords.items(), key=lambda x: x[1], reverse=True)
 
         print("**Common Allowance Reasoning Patterns:**")
-        for keyword, count in sorted_keywords[:10]:
+        for keyword, count in islice(sorted_keywords, 10):
             if count > 0:
                 pct = (count / len(noa_insights)) * 100
-                print(f"  - '{{keyword}}': {{count}}/{{len(noa_insights)}} NOAs ({{pct:.0f}}%)")
+                print(f"  - '{keyword}': {count}/{len(noa_insights)} NOAs ({pct:.0f}%)")
         print()
 
         # Strategic recommendations based on NOA patterns
@@ -721,7 +794,7 @@ else:
         spec_reliance = allowance_keywords.get('specification', 0) + allowance_keywords.get('detailed description', 0)
         if spec_reliance > len(noa_insights) * 0.6:
             print("**High Specification Reliance Detected:**")
-            print(f"  - 📝 **Pattern:** Examiner heavily cites specification for claim support ({{spec_reliance}}/{{len(noa_insights)}} NOAs)")
+            print(f"  - 📝 **Pattern:** Examiner heavily cites specification for claim support ({spec_reliance}/{len(noa_insights)} NOAs)")
             print(f"      → **Claim Drafting:** Ensure detailed description with explicit support for each claim element")
             print(f"      → **Specification Strategy:** Include implementation examples for each limitation")
             print(f"      → **Prosecution:** Point to specific specification passages in arguments")
@@ -747,6 +820,7 @@ else:
             print(f"      → **Prosecution Strategy:** Provide data showing unexpected advantages")
             print(f"      → **Specification:** Include comparative examples demonstrating superiority")
             print()
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -756,15 +830,74 @@ else:
 ### 4.1 RCE and Amendment Analysis
 
 ```python
+begin_phase()
 print("---")
 print()
 print("### Prosecution Patterns & Efficiency Metrics")
 print()
 
+# Stage sample sizes; each stage takes a prefix of the same sample_apps list
+PROBE_N = 5
+PROSECUTION_N = 30
+PROSECUTION_LOW_ACTIVITY_N = 10
+PETITION_N = 20
+PTAB_N = 30
+
+# Cheap early probe: a 5-app petition check and one batched 5-patent PTAB check.
+# When both succeed and neither shows activity, a smaller prosecution sample is
+# enough and the document walks below (the most expensive stage) shrink 3x.
+# Failed probe calls are not counted as "no activity".
+probe_apps = sample_apps[:PROBE_N]
+probe_petition_hits = 0
+probe_petition_checked = 0
+for app in probe_apps:
+    try:
+        probe = await call_with_backoff(
+            fpd_search_petitions_by_application,
+            application_number=app.get('applicationNumberText'),
+            fields=['petitionTypeCode'],
+            include_documents=False
+        )
+        probe_petition_checked += 1
+        if probe.get('count', 0) > 0:
+            probe_petition_hits += 1
+    except Exception:
+        continue
+
+probe_patents = list(islice((app.get('patentNumber') for app in sample_apps if app.get('patentNumber')), PROBE_N))
+probe_ptab_hits = 0
+probe_ptab_ok = False
+if probe_patents:
+    try:
+        probe = await call_with_backoff(
+            search_trials_minimal, patent_number=probe_patents, fields=['trialNumber'], limit=10
+        )
+        probe_ptab_hits = probe.get('count', 0)
+        probe_ptab_ok = True
+    except Exception:
+        pass
+
+if probe_petition_checked == 0 or not probe_ptab_ok:
+    low_activity = False
+    probe_reason = (
+        f"probe incomplete ({probe_petition_checked}/{len(probe_apps)} petition checks, "
+        f"PTAB check {'ok' if probe_ptab_ok else 'unavailable'})"
+    )
+else:
+    probe_petition_rate = probe_petition_hits / probe_petition_checked * 100
+    probe_ptab_rate = probe_ptab_hits / len(probe_patents) * 100
+    low_activity = probe_petition_rate < 5 and probe_ptab_rate < 5
+    probe_reason = (
+        f"{probe_petition_hits}/{probe_petition_checked} probed apps with petitions, "
+        f"{probe_ptab_hits} PTAB proceedings across {len(probe_patents)} probed patents"
+    )
+
 # Re-use sample from citation analysis for consistency
-prosecution_sample = sample_apps[:min(30, len(sample_apps))]
+prosecution_sample = sample_apps[:PROSECUTION_LOW_ACTIVITY_N if low_activity else PROSECUTION_N]
+sample_choice = "reduced (low petition/PTAB activity)" if low_activity else "full"
+print(f"ℹ️ **Prosecution sample:** {len(prosecution_sample)} applications, {sample_choice} - {probe_reason}")
 
-print(f"📊 **Analyzing {{len(prosecution_sample)}} applications for prosecution patterns...**")
+print(f"📊 **Analyzing {len(prosecution_sample)} applications for prosecution patterns...**")
 print()
 
 # Initialize counters
@@ -775,147 +908,144 @@ ctnf_count = 0  # Final rejections
 total_oa_pages = 0
 oa_apps = 0
 
-apps_with_rce = []
-apps_with_final = []
-
-# Progress tracking
-for i, app in enumerate(prosecution_sample, 1):
-    app_number = app.get('applicationNumberText')
+apps_with_rce_count = 0
+apps_with_final_count = 0
 
-    if i % 10 == 0:
-        print(f"  Progress: {{i}}/{{len(prosecution_sample)}} applications processed...")
+# Amendment document codes: after non-final, after final, after allowance
+# (Rule 312), preliminary, after Ex parte Quayle, and supplemental
+AMENDMENT_CODES = frozenset({'A...', 'A.NE', 'A.NA', 'A.PE', 'A.QU', 'AMSB'})
 
+# Fetch each application's document list once, concurrently (bounded by the
+# shared api_semaphore from Phase 1)
+# One unfiltered call per app replaces separate RCEX / INCOMING / CTFR / CTNF calls
+async def fetch_prosecution_documents(app):
     try:
-        # Check for RCE filings (continuation after final rejection)
-        rce_docs = pfw_get_application_documents(
-            app_number=app_number,
-            document_code='RCEX',
-            limit=10
-        )
-        if rce_docs.get('documentBag'):
-            rce_num = len(rce_docs['documentBag'])
-            rce_count += rce_num
-            if rce_num > 0:
-                apps_with_rce.append(app_number)
-
-        # Check for amendments/responses (applicant activity)
-        amend_docs = pfw_get_application_documents(
-            app_number=app_number,
-            direction_category='INCOMING',  # Applicant submissions
-            limit=20
-        )
-        if amend_docs.get('documentBag'):
-            # Filter for actual responses (A... document codes)
-            responses = [
-                doc for doc in amend_docs['documentBag']
-                if doc.get('mailRoomDate') and
-                   doc.get('documentCode', '').startswith('A')
-            ]
-            amendment_count += len(responses)
-
-        # Check for non-final rejections (examiner activity)
-        oa_docs = pfw_get_application_documents(
-            app_number=app_number,
-            document_code='CTFR',  # Non-final rejection
-            limit=10
-        )
-        if oa_docs.get('documentBag'):
-            ctfr_count += len(oa_docs['documentBag'])
-            oa_apps += 1
-            for doc in oa_docs['documentBag']:
-                total_oa_pages += doc.get('pageCount', 0)
-
-        # Check for final rejections
-        final_docs = pfw_get_application_documents(
-            app_number=app_number,
-            document_code='CTNF',  # Final rejection
-            limit=5
+        return await call_with_backoff(
+            pfw_get_application_documents,
+            app_number=app.get('applicationNumberText'),
+            fields=document_fields,
+            limit=100
         )
-        if final_docs.get('documentBag'):
-            ctnf_num = len(final_docs['documentBag'])
-            ctnf_count += ctnf_num
-            if ctnf_num > 0:
-                apps_with_final.append(app_number)
-
     except Exception as e:
-        # Gracefully continue with other applications
+        # One failed call should not sink the batch
+        return e
+
+prosecution_results = await asyncio.gather(
+    *(fetch_prosecution_documents(app) for app in prosecution_sample)
+)
+print(f"  Fetched document lists for {len(prosecution_results)} applications")
+
+# Bucket documents locally by code (failed calls are skipped)
+for docs in prosecution_results:
+    if isinstance(docs, Exception) or not docs.get('documentBag'):
         continue
 
+    bag = docs['documentBag']
+
+    # One C-level tally of document codes instead of per-document increments
+    code_counts = Counter(doc.get('documentCode', '') for doc in bag)
+    rce_num = code_counts['RCEX']        # RCE filings (continuation after final rejection)
+    app_ctfr = code_counts['CTFR']       # Non-final rejections (examiner activity)
+    ctnf_num = code_counts['CTNF']       # Final rejections
+
+    if app_ctfr:
+        total_oa_pages += sum(
+            doc['pageCount'] for doc in bag
+            if doc.get('documentCode') == 'CTFR' and 'pageCount' in doc
+        )
+
+    # Applicant amendments/responses; the code test runs first since it
+    # rejects most documents
+    amendment_count += sum(
+        1 for doc in bag
+        if doc.get('documentCode') in AMENDMENT_CODES
+        and doc.get('directionCategory') == 'INCOMING'
+        and doc.get('mailRoomDate')
+    )
+
+    rce_count += rce_num
+    if rce_num > 0:
+        apps_with_rce_count += 1
+
+    ctfr_count += app_ctfr
+    if app_ctfr > 0:
+        oa_apps += 1
+
+    ctnf_count += ctnf_num
+    if ctnf_num > 0:
+        apps_with_final_count += 1
+
 print()
 print("✅ **Prosecution pattern analysis complete**")
 print()
 
-# Calculate metrics
-avg_rce = rce_count / len(prosecution_sample) if len(prosecution_sample) > 0 else 0
-rce_rate = (len(apps_with_rce) / len(prosecution_sample)) * 100 if len(prosecution_sample) > 0 else 0
-avg_amendments = amendment_count / len(prosecution_sample) if len(prosecution_sample) > 0 else 0
-avg_ctfr = ctfr_count / len(prosecution_sample) if len(prosecution_sample) > 0 else 0
-avg_ctnf = ctnf_count / len(prosecution_sample) if len(prosecution_sample) > 0 else 0
-final_rate = (len(apps_with_final) / len(prosecution_sample)) * 100 if len(prosecution_sample) > 0 else 0
+# Calculate metrics (sample size checked once, then multiply by the inverse)
+n = len(prosecution_sample)
+inv_n = 1.0 / n if n else 0.0
+inv_n_pct = 100.0 * inv_n
+
+avg_rce = rce_count * inv_n
+rce_rate = apps_with_rce_count * inv_n_pct
+avg_amendments = amendment_count * inv_n
+avg_ctfr = ctfr_count * inv_n
+avg_ctnf = ctnf_count * inv_n
+final_rate = apps_with_final_count * inv_n_pct
 avg_oa_pages = total_oa_pages / oa_apps if oa_apps > 0 else 0
 
 print("### Prosecution Efficiency Metrics")
 print()
 
 print("**RCE Analysis (Continuation After Final):**")
-print(f"  - Applications with RCE: {{len(apps_with_rce)}}/{{len(prosecution_sample)}} ({{rce_rate:.1f}}%)")
-print(f"  - Average RCE per Application: {{avg_rce:.2f}}")
+print(f"  - Applications with RCE: {apps_with_rce_count}/{n} ({rce_rate:.1f}%)")
+print(f"  - Average RCE per Application: {avg_rce:.2f}")
 print()
 
 print("**Office Action Patterns:**")
-print(f"  - Average Non-Final Rejections: {{avg_ctfr:.2f}} per app")
-print(f"  - Average Final Rejections: {{avg_ctnf:.2f}} per app")
-print(f"  - Applications with Finals: {{len(apps_with_final)}}/{{len(prosecution_sample)}} ({{final_rate:.1f}}%)")
-print(f"  - Average OA Length: {{avg_oa_pages:.1f}} pages")
+print(f"  - Average Non-Final Rejections: {avg_ctfr:.2f} per app")
+print(f"  - Average Final Rejections: {avg_ctnf:.2f} per app")
+print(f"  - Applications with Finals: {apps_with_final_count}/{n} ({final_rate:.1f}%)")
+print(f"  - Average OA Length: {avg_oa_pages:.1f} pages")
 print()
 
 print("**Applicant Response Activity:**")
-print(f"  - Average Amendments/Responses: {{avg_amendments:.2f}} per app")
+print(f"  - Average Amendments/Responses: {avg_amendments:.2f} per app")
 print()
 
 # Prosecution difficulty assessment
 print("### Prosecution Difficulty Assessment")
 print()
 
-if avg_rce > 0.8:
-    difficulty = "Very High"
-    color = "🔴"
-    strategy = "Expect extended prosecution - consider narrow claims from outset"
-    budget_multiplier = "3-4x"
-elif avg_rce > 0.5:
-    difficulty = "High"
-    color = "🟠"
-    strategy = "Frequent RCE filings - prepare for iterative claim narrowing"
-    budget_multiplier = "2-3x"
-elif avg_rce > 0.2:
-    difficulty = "Moderate"
-    color = "🟡"
-    strategy = "Some RCE activity - balanced approach with claim flexibility"
-    budget_multiplier = "1.5-2x"
-else:
-    difficulty = "Low"
-    color = "🟢"
-    strategy = "Most applications allow without RCE - examiner reasonable"
-    budget_multiplier = "1-1.5x"
-
-print(f"**Difficulty Level:** {{color}} **{{difficulty}}**")
-print(f"**Expected Budget:** {{budget_multiplier}} standard prosecution costs")
-print(f"**Strategy:** {{strategy}}")
+# (avg RCE threshold, (difficulty, color, budget multiplier, strategy)), highest first
+DIFFICULTY_TIERS = (
+    (0.8, ("Very High", "🔴", "3-4x", "Expect extended prosecution - consider narrow claims from outset")),
+    (0.5, ("High", "🟠", "2-3x", "Frequent RCE filings - prepare for iterative claim narrowing")),
+    (0.2, ("Moderate", "🟡", "1.5-2x", "Some RCE activity - balanced approach with claim flexibility")),
+    (float('-inf'), ("Low", "🟢", "1-1.5x", "Most applications allow without RCE - examiner reasonable")),
+)
+
+difficulty, color, budget_multiplier, strategy = next(
+    tier for threshold, tier in DIFFICULTY_TIERS if avg_rce > threshold
+)
+
+print(f"**Difficulty Level:** {color} **{difficulty}**")
+print(f"**Expected Budget:** {budget_multiplier} standard prosecution costs")
+print(f"**Strategy:** {strategy}")
 print()
 
 if final_rate > 50:
-    print(f"⚠️ **High Final Rejection Rate ({{final_rate:.0f}}%):** Examiner frequently issues finals")
+    print(f"⚠️ **High Final Rejection Rate ({final_rate:.0f}%):** Examiner frequently issues finals")
     print(f"   → **Implication:** Plan for RCE filings or early claim narrowing to avoid finals")
     print()
 
 if avg_oa_pages > 20:
-    print(f"📚 **Lengthy Office Actions ({{avg_oa_pages:.0f}} pages avg):** Detailed examiner analysis")
+    print(f"📚 **Lengthy Office Actions ({avg_oa_pages:.0f} pages avg):** Detailed examiner analysis")
     print(f"   → **Implication:** Expect thorough rejections with extensive prior art discussion")
     print(f"   → **Strategy:** Prepare comprehensive responses with detailed technical distinctions")
     print()
 elif avg_oa_pages > 10:
-    print(f"📄 **Standard Office Actions ({{avg_oa_pages:.0f}} pages avg):** Normal detail level")
+    print(f"📄 **Standard Office Actions ({avg_oa_pages:.0f} pages avg):** Normal detail level")
     print()
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -925,6 +1055,7 @@ elif avg_oa_pages > 10:
 ### 5.1 Petition Analysis for Examiner Quality Indicators
 
 ```python
+begin_phase()
 print("---")
 print()
 print("### Petition History & Quality Assessment (FPD Integration)")
@@ -934,109 +1065,122 @@ print()
 petition_apps = []
 petition_count = 0
 
-# Sample 20 applications for petition check (reduce API calls)
-petition_sample = prosecution_sample[:20]
+# Sample PETITION_N applications for petition check (reduce API calls)
+petition_sample = prosecution_sample[:PETITION_N]
 
-print(f"🔍 **Checking petition history for {{len(petition_sample)}} applications...**")
-print()
+# Below half the minimum sample size, petition rates are not statistically meaningful
+min_phase_sample = min_sample_size // 2
 
-for app in petition_sample:
-    app_number = app.get('applicationNumberText')
+if len(petition_sample) < min_phase_sample:
+    print(f"⚠️ **Skipping petition analysis** (n={len(petition_sample)} below statistical threshold of {min_phase_sample})")
+    print()
+    petition_rate = 0
+else:
+    print(f"🔍 **Checking petition history for {len(petition_sample)} applications...**")
+    print()
 
-    try:
-        petitions = fpd_search_petitions_by_application(
-            application_number=app_number,
-            include_documents=False  # Metadata only
-        )
+    # Petition type code descriptions (built once, used in the distribution report)
+    PETITION_TYPE_DESC = {
+        '182': 'Restriction Requirement Petition',
+        '131': 'Terminal Disclaimer Petition',
+        '133': 'Suspended Application Petition',
+        '137': 'Revival (Unintentional Abandonment)',
+        '183': 'Unity of Invention Petition',
+        '181': 'Supervisory Review Petition'
+    }
 
-        if petitions.get('count', 0) > 0:
-            petition_count += len(petitions.get('petitions', []))
-            petition_apps.append({{
-                'app_number': app_number,
-                'petitions': petitions['petitions']
-            }})
-    except Exception as e:
-        # FPD data may not be available for all applications
-        continue
+    for app in petition_sample:
+        app_number = app.get('applicationNumberText')
 
-petition_rate = (len(petition_apps) / len(petition_sample)) * 100 if len(petition_sample) > 0 else 0
-
-print(f"**Petition Activity:**")
-print(f"  - Applications with Petitions: {{len(petition_apps)}}/{{len(petition_sample)}} ({{petition_rate:.1f}}%)")
-print(f"  - Total Petitions Filed: {{petition_count}}")
-print()
+        try:
+            petitions = await call_with_backoff(
+                fpd_search_petitions_by_application,
+                application_number=app_number,
+                fields=['petitionTypeCode', 'decisionType'],
+                include_documents=False  # Metadata only
+            )
 
-if len(petition_apps) > 0:
-    # Analyze petition types and outcomes
-    petition_types = Counter()
-    petition_decisions = Counter()
-
-    for app_data in petition_apps:
-        for petition in app_data['petitions']:
-            pet_type = petition.get('petitionTypeCode', 'Unknown')
-            decision = petition.get('decisionType', 'Unknown')
-            petition_types[pet_type] += 1
-            petition_decisions[decision] += 1
-
-    print("**Petition Type Distribution:**")
-    for pet_type, count in petition_types.most_common():
-        pct = (count / petition_count) * 100
-
-        # Interpret petition type
-        type_desc = {{
-            '182': 'Restriction Requirement Petition',
-            '131': 'Terminal Disclaimer Petition',
-            '133': 'Suspended Application Petition',
-            '137': 'Revival (Unintentional Abandonment)',
-            '183': 'Unity of Invention Petition',
-            '181': 'Supervisory Review Petition'
-        }}.get(pet_type, f'Type {{pet_type}}')
-
-        print(f"  - {{type_desc}}: {{count}} ({{pct:.1f}}%)")
-    print()
+            if petitions.get('count', 0) > 0:
+                petition_count += len(petitions.get('petitions', []))
+                petition_apps.append({
+                    'app_number': app_number,
+                    'petitions': petitions['petitions']
+                })
+        except Exception as e:
+            # FPD data may not be available for all applications
+            continue
 
-    print("**Petition Decision Outcomes:**")
-    for decision, count in petition_decisions.most_common():
-        pct = (count / petition_count) * 100
-        print(f"  - {{decision}}: {{count}} ({{pct:.1f}}%)")
-    print()
+    petition_rate = (len(petition_apps) / len(petition_sample)) * 100 if len(petition_sample) > 0 else 0
 
-    # Quality indicators based on petition patterns
-    print("### Quality Indicators from Petition History")
+    print(f"**Petition Activity:**")
+    print(f"  - Applications with Petitions: {len(petition_apps)}/{len(petition_sample)} ({petition_rate:.1f}%)")
+    print(f"  - Total Petitions Filed: {petition_count}")
     print()
 
-    denied_rate = (petition_decisions.get('DENIED', 0) / petition_count) * 100 if petition_count > 0 else 0
-    granted_rate = (petition_decisions.get('GRANTED', 0) / petition_count) * 100 if petition_count > 0 else 0
-
-    if petition_rate > 15:
-        print(f"⚠️ **High Petition Rate ({{petition_rate:.0f}}%):** Above-average supervisory review requests")
-        print(f"   → **Implication:** Possible applicant dissatisfaction or procedural challenges")
+    if len(petition_apps) > 0:
+        # Analyze petition types and outcomes
+        petition_types = {}
+        petition_decisions = {}
+
+        for app_data in petition_apps:
+            for petition in app_data['petitions']:
+                pet_type = petition.get('petitionTypeCode', 'Unknown')
+                decision = petition.get('decisionType', 'Unknown')
+                petition_types[pet_type] = petition_types.get(pet_type, 0) + 1
+                petition_decisions[decision] = petition_decisions.get(decision, 0) + 1
+
+        # A matched app can still return an empty petitions list, so petition_count may be 0
+        petition_pct = 100.0 / petition_count if petition_count > 0 else 0.0
+
+        print("**Petition Type Distribution:**")
+        for pet_type, count in sorted(petition_types.items(), key=itemgetter(1), reverse=True):
+            # Interpret petition type
+            type_desc = PETITION_TYPE_DESC.get(pet_type, f'Type {pet_type}')
+            print(f"  - {type_desc}: {count} ({count * petition_pct:.1f}%)")
         print()
 
-    if '181' in petition_types and petition_types['181'] > petition_count * 0.3:
-        print(f"🚩 **Supervisory Review Petitions ({{petition_types['181']}}):** Applicants seeking examiner oversight")
-        print(f"   → **Implication:** Possible communication or procedural issues with examiner")
-        print(f"   → **Strategy:** Maintain clear, documented communication; consider early interviews")
+        print("**Petition Decision Outcomes:**")
+        for decision, count in sorted(petition_decisions.items(), key=itemgetter(1), reverse=True):
+            print(f"  - {decision}: {count} ({count * petition_pct:.1f}%)")
         print()
 
-    if '137' in petition_types and petition_types['137'] > 0:
-        print(f"📅 **Revival Petitions ({{petition_types['137']}}):** Applications abandoned and revived")
-        print(f"   → **Implication:** May indicate deadline pressure or procedural challenges")
+        # Quality indicators based on petition patterns
+        print("### Quality Indicators from Petition History")
         print()
 
-    if granted_rate > 50:
-        print(f"✅ **High Petition Success Rate ({{granted_rate:.0f}}%):** Examiner actions frequently overturned")
-        print(f"   → **Implication:** Petitions viable strategy if procedural issues arise")
-        print()
-    elif denied_rate > 70:
-        print(f"❌ **Low Petition Success Rate ({{granted_rate:.0f}}%):** Most petitions denied")
-        print(f"   → **Implication:** Petition strategy less effective; focus on substantive arguments")
-        print()
+        denied_rate = (petition_decisions.get('DENIED', 0) / petition_count) * 100 if petition_count > 0 else 0
+        granted_rate = (petition_decisions.get('GRANTED', 0) / petition_count) * 100 if petition_count > 0 else 0
 
-else:
-    print("✅ **No Petition History Found:** Clean prosecution record")
-    print("   → **Positive Indicator:** No evidence of procedural issues or applicant dissatisfaction")
-    print()
+        if petition_rate > 15:
+            print(f"⚠️ **High Petition Rate ({petition_rate:.0f}%):** Above-average supervisory review requests")
+            print(f"   → **Implication:** Possible applicant dissatisfaction or procedural challenges")
+            print()
+
+        if '181' in petition_types and petition_types['181'] > petition_count * 0.3:
+            print(f"🚩 **Supervisory Review Petitions ({petition_types['181']}):** Applicants seeking examiner oversight")
+            print(f"   → **Implication:** Possible communication or procedural issues with examiner")
+            print(f"   → **Strategy:** Maintain clear, documented communication; consider early interviews")
+            print()
+
+        if '137' in petition_types and petition_types['137'] > 0:
+            print(f"📅 **Revival Petitions ({petition_types['137']}):** Applications abandoned and revived")
+            print(f"   → **Implication:** May indicate deadline pressure or procedural challenges")
+            print()
+
+        if granted_rate > 50:
+            print(f"✅ **High Petition Success Rate ({granted_rate:.0f}%):** Examiner actions frequently overturned")
+            print(f"   → **Implication:** Petitions viable strategy if procedural issues arise")
+            print()
+        elif denied_rate > 70:
+            print(f"❌ **Low Petition Success Rate ({granted_rate:.0f}%):** Most petitions denied")
+            print(f"   → **Implication:** Petition strategy less effective; focus on substantive arguments")
+            print()
+
+    else:
+        print("✅ **No Petition History Found:** Clean prosecution record")
+        print("   → **Positive Indicator:** No evidence of procedural issues or applicant dissatisfaction")
+        print()
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -1057,6 +1201,7 @@ For cross-MCP correlation, request only needed fields:
 This reduces context from ~40KB (preset minimal) to ~5KB (ultra-minimal)
 
 ```python
+begin_phase()
 print("---")
 print()
 print("### PTAB Challenge Correlation (Post-Grant Risk Assessment)")
@@ -1072,113 +1217,161 @@ granted_patent_numbers = [
     if app.get('patentNumber')
 ]
 
-# Sort patent numbers (descending) - higher numbers = more recent = more likely to have PTAB proceedings
-granted_patent_numbers_sorted = sorted(granted_patent_numbers, reverse=True)
-
-print(f"🔍 **Checking PTAB challenges for {{len(granted_patent_numbers_sorted)}} granted patents...**")
+print(f"🔍 **Checking PTAB challenges for {len(granted_patent_numbers)} granted patents...**")
 print()
 
 # Sample to reduce API calls (PTAB data can be extensive)
-# Take most recent patents (highest numbers first) - PTAB proceedings more common for recent patents
-ptab_sample = granted_patent_numbers_sorted[:30]
+# Take most recent patents (highest numbers first) - PTAB proceedings more common for recent patents.
+# nlargest keeps only the top PTAB_N instead of sorting every granted patent
+ptab_sample = heapq.nlargest(PTAB_N, granted_patent_numbers)
 
-if ptab_sample:
-    print(f"📊 **PTAB sample range (most recent first):** {{ptab_sample[0]}} to {{ptab_sample[-1] if len(ptab_sample) > 1 else ptab_sample[0]}}")
+if len(ptab_sample) < min_phase_sample:
+    print(f"⚠️ **Skipping PTAB analysis** (n={len(ptab_sample)} below statistical threshold of {min_phase_sample})")
+    print()
+    challenge_rate = 0
+else:
+    print(f"📊 **PTAB sample range (most recent first):** {ptab_sample[0]} to {ptab_sample[-1]}")
     print()
 
-for patent_num in ptab_sample:
-    try:
-        # Use ultra-minimal mode with fields parameter for 99% reduction
-        proceedings = search_trials_minimal(
-            patent_number=patent_num,
-            fields=['trialNumber', 'trialMetaData.trialStatusCategory', 'petitionerData.petitionerName'],
-            limit=10
-        )
-
-        if proceedings.get('count', 0) > 0:
-            ptab_challenges.append({{
-                'patent_number': patent_num,
-                'proceedings': proceedings['results']
-            }})
-    except Exception as e:
-        # PTAB data may not be available for all patents
-        continue
-
-challenge_rate = (len(ptab_challenges) / len(ptab_sample)) * 100 if len(ptab_sample) > 0 else 0
+    # Query PTAB in batches of 10 patents per call instead of one call per patent
+    PTAB_BATCH_SIZE = 10
+    ptab_fields = [
+        'trialNumber', 'trialMetaData.trialStatusCategory', 'petitionerData.petitionerName',
+        'patentOwnerData.patentNumber'
+    ]
 
-print(f"**PTAB Challenge Statistics:**")
-print(f"  - Patents with Challenges: {{len(ptab_challenges)}}/{{len(ptab_sample)}} ({{challenge_rate:.1f}}%)")
-print()
+    import re
+    patent_kind_suffix = re.compile(r'(?<=[0-9])[A-Z][0-9]?$$')
 
-if len(ptab_challenges) > 0:
-    # Analyze challenge types and outcomes
-    proceeding_types = Counter()
-    proceeding_statuses = Counter()
+    def normalize_patent_number(value):
+        # "US 10,123,456 B2", "US10123456" and 10123456 all map to "10123456"
+        text = re.sub(r'[^0-9A-Z]', '', str(value or '').upper()).removeprefix('US')
+        return patent_kind_suffix.sub('', text)
 
-    for challenge_data in ptab_challenges:
-        for proc in challenge_data['proceedings']:
-            proc_type = proc.get('subproceedingType', 'Unknown')
-            status = proc.get('proceedingStatusDescriptionText', 'Unknown')
-            proceeding_types[proc_type] += 1
-            proceeding_statuses[status] += 1
+    def proceeding_patent_number(proc):
+        return proc.get('patentNumber') or (proc.get('patentOwnerData') or {}).get('patentNumber')
 
-    total_proceedings = sum(proceeding_types.values())
+    # Proceedings keyed by normalized patent number; both the sample and the
+    # PTAB results go through normalize_patent_number() so formats can differ
+    sample_keys = {normalize_patent_number(patent_num) for patent_num in ptab_sample}
+    proceedings_by_patent = {}
+    unmatched_proceedings = 0
 
-    print("**Challenge Type Distribution:**")
-    for proc_type, count in proceeding_types.most_common():
-        pct = (count / total_proceedings) * 100
-        print(f"  - {{proc_type}}: {{count}} ({{pct:.1f}}%)")
+    for start in range(0, len(ptab_sample), PTAB_BATCH_SIZE):
+        batch = ptab_sample[start:start + PTAB_BATCH_SIZE]
+        try:
+            # Use ultra-minimal mode with fields parameter for 99% reduction
+            proceedings = await call_with_backoff(
+                search_trials_minimal,
+                patent_number=batch,
+                fields=ptab_fields,
+                limit=100
+            )
+            for proc in proceedings.get('results', []):
+                key = normalize_patent_number(proceeding_patent_number(proc))
+                if key in sample_keys:
+                    proceedings_by_patent.setdefault(key, []).append(proc)
+                else:
+                    unmatched_proceedings += 1
+        except Exception:
+            # List input rejected (or batch failed) - fall back to one patent per call
+            for patent_num in batch:
+                try:
+                    proceedings = await call_with_backoff(
+                        search_trials_minimal,
+                        patent_number=patent_num,
+                        fields=ptab_fields,
+                        limit=10
+                    )
+                    if proceedings.get('count', 0) > 0:
+                        proceedings_by_patent[normalize_patent_number(patent_num)] = proceedings['results']
+                except Exception:
+                    # PTAB data may not be available for all patents
+                    continue
+
+    ptab_challenges = [
+        {'patent_number': patent_num, 'proceedings': proceedings_by_patent[normalize_patent_number(patent_num)]}
+        for patent_num in ptab_sample
+        if proceedings_by_patent.get(normalize_patent_number(patent_num))
+    ]
+
+    challenge_rate = (len(ptab_challenges) / len(ptab_sample)) * 100 if len(ptab_sample) > 0 else 0
+
+    print(f"**PTAB Challenge Statistics:**")
+    print(f"  - Patents with Challenges: {len(ptab_challenges)}/{len(ptab_sample)} ({challenge_rate:.1f}%)")
+    if unmatched_proceedings:
+        print(f"  - ⚠️ Proceedings not matched to a sampled patent: {unmatched_proceedings} (excluded)")
     print()
 
-    print("**Proceeding Outcomes:**")
-    for status, count in proceeding_statuses.most_common():
-        pct = (count / total_proceedings) * 100
-        print(f"  - {{status}}: {{count}} ({{pct:.1f}}%)")
-    print()
+    if len(ptab_challenges) > 0:
+        # Analyze challenge types and outcomes
+        proceeding_types = {}
+        proceeding_statuses = {}
 
-    # Post-grant risk assessment
-    print("### Post-Grant Risk Assessment")
-    print()
+        for challenge_data in ptab_challenges:
+            for proc in challenge_data['proceedings']:
+                proc_type = proc.get('subproceedingType', 'Unknown')
+                status = proc.get('proceedingStatusDescriptionText', 'Unknown')
+                proceeding_types[proc_type] = proceeding_types.get(proc_type, 0) + 1
+                proceeding_statuses[status] = proceeding_statuses.get(status, 0) + 1
+
+        total_proceedings = sum(proceeding_types.values())
+        proceeding_pct = 100.0 / total_proceedings
 
-    if challenge_rate > 20:
-        print(f"🚨 **High Challenge Rate ({{challenge_rate:.0f}}%):** Patents frequently challenged at PTAB")
-        print(f"   → **Possible Causes:**")
-        print(f"      - Claim quality concerns (overly broad claims)")
-        print(f"      - High-value patent space (competitors motivated to challenge)")
-        print(f"   → **Recommendation:** Comprehensive prior art search and claim refinement")
+        print("**Challenge Type Distribution:**")
+        for proc_type, count in sorted(proceeding_types.items(), key=itemgetter(1), reverse=True):
+            print(f"  - {proc_type}: {count} ({count * proceeding_pct:.1f}%)")
         print()
-    elif challenge_rate > 10:
-        print(f"⚠️ **Moderate Challenge Rate ({{challenge_rate:.0f}}%):** Some PTAB activity")
-        print(f"   → **Implication:** Standard risk level for valuable patents")
+
+        print("**Proceeding Outcomes:**")
+        for status, count in sorted(proceeding_statuses.items(), key=itemgetter(1), reverse=True):
+            print(f"  - {status}: {count} ({count * proceeding_pct:.1f}%)")
         print()
-    else:
-        print(f"✅ **Low Challenge Rate ({{challenge_rate:.0f}}%):** Minimal PTAB challenges")
-        print(f"   → **Possible Indicators:**")
-        print(f"      - Robust prosecution quality")
-        print(f"      - Lower commercial value patent space")
-        print(f"      - Patents too recent for challenges")
+
+        # Post-grant risk assessment
+        print("### Post-Grant Risk Assessment")
         print()
 
-    # Outcome analysis
-    terminated = proceeding_statuses.get('Terminated', 0)
-    instituted = proceeding_statuses.get('Instituted', 0)
+        if challenge_rate > 20:
+            print(f"🚨 **High Challenge Rate ({challenge_rate:.0f}%):** Patents frequently challenged at PTAB")
+            print(f"   → **Possible Causes:**")
+            print(f"      - Claim quality concerns (overly broad claims)")
+            print(f"      - High-value patent space (competitors motivated to challenge)")
+            print(f"   → **Recommendation:** Comprehensive prior art search and claim refinement")
+            print()
+        elif challenge_rate > 10:
+            print(f"⚠️ **Moderate Challenge Rate ({challenge_rate:.0f}%):** Some PTAB activity")
+            print(f"   → **Implication:** Standard risk level for valuable patents")
+            print()
+        else:
+            print(f"✅ **Low Challenge Rate ({challenge_rate:.0f}%):** Minimal PTAB challenges")
+            print(f"   → **Possible Indicators:**")
+            print(f"      - Robust prosecution quality")
+            print(f"      - Lower commercial value patent space")
+            print(f"      - Patents too recent for challenges")
+            print()
+
+        # Outcome analysis
+        terminated = proceeding_statuses.get('Terminated', 0)
+        instituted = proceeding_statuses.get('Instituted', 0)
 
-    if terminated > instituted:
-        print(f"✅ **More Terminations than Institutions:** Patents surviving challenges")
+        if terminated > instituted:
+            print(f"✅ **More Terminations than Institutions:** Patents surviving challenges")
+            print()
+        elif instituted > 0:
+            print(f"⚠️ **Active Institutions:** Some patents under active PTAB review")
+            print(f"   → **Implication:** Monitor outcomes for examiner quality trends")
+            print()
+
+    else:
+        print("✅ **No PTAB Challenges Found:** Low post-grant risk")
         print()
-    elif instituted > 0:
-        print(f"⚠️ **Active Institutions:** Some patents under active PTAB review")
-        print(f"   → **Implication:** Monitor outcomes for examiner quality trends")
+        print("**Possible Indicators:**")
+        print("  - Strong prosecution quality")
+        print("  - Lower commercial value space")
+        print("  - Patents too recent for challenges (IPR requires post-grant timing)")
         print()
-
-else:
-    print("✅ **No PTAB Challenges Found:** Low post-grant risk")
-    print()
-    print("**Possible Indicators:**")
-    print("  - Strong prosecution quality")
-    print("  - Lower commercial value space")
-    print("  - Patents too recent for challenges (IPR requires post-grant timing)")
-    print()
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -1188,38 +1381,50 @@ else:
 ### 7.1 Executive Summary with Key Metrics
 
 ```python
+begin_phase()
 print("=" * 80)
 print("ENHANCED EXAMINER BEHAVIOR INTELLIGENCE REPORT")
 print("=" * 80)
 print()
 
-print(f"**Examiner:** {{primary_examiner}}")
-print(f"**Primary Art Unit:** {{primary_art_unit[0]}}")
+print(f"**Examiner:** {primary_examiner}")
+print(f"**Primary Art Unit:** {primary_art_unit[0]}")
 print(f"**Analysis Period:** 2015-01-01 to present")
-print(f"**Applications Analyzed:** {{len(applications)}}")
-print(f"**Citation Data Coverage:** {{apps_with_citations}}/{{sample_size}} applications ({{citation_coverage:.0f}}%)")
+print(f"**Applications Analyzed:** {len(applications)}")
+print(f"**Citation Data Coverage:** {apps_with_citations}/{sample_size} applications ({citation_coverage:.0f}%)")
 print()
 
 print("### Key Metrics Summary Table")
 print()
 
-# Create comprehensive metrics table
-print("| Category | Metric | Value |")
-print("|----------|--------|-------|")
-print(f"| **Citation Behavior** | Examiner Citation Rate | {{examiner_rate:.0f}}% |")
+# Create comprehensive metrics table as (category, metric, value) rows
 if apps_with_citations > 0:
-    print(f"| | Citations per Application | {{examiner_cited_count / apps_with_citations:.1f}} |")
-    if categories:
-        print(f"| | Primary Category | {{categories.most_common(1)[0][0]}} |")
+    citations_per_app = f"{examiner_cited_count / apps_with_citations:.1f}"
+    primary_category = categories.most_common(1)[0][0] if categories else None
 else:
-    print(f"| | Citations per Application | N/A |")
-    print(f"| | Primary Category | N/A |")
-print(f"| **Prosecution Patterns** | RCE Rate | {{rce_rate:.0f}}% |")
-print(f"| | Final Rejection Rate | {{final_rate:.0f}}% |")
-print(f"| | Difficulty Level | {{difficulty}} {{color}} |")
-print(f"| | Expected Budget | {{budget_multiplier}} standard |")
-print(f"| **Quality Indicators** | Petition Rate | {{petition_rate:.0f}}% |")
-print(f"| | PTAB Challenge Rate | {{challenge_rate:.0f}}% |")
+    citations_per_app = "N/A"
+    primary_category = "N/A"
+
+metric_rows = [
+    ("**Citation Behavior**", "Examiner Citation Rate", f"{examiner_rate:.0f}%"),
+    ("", "Citations per Application", citations_per_app),
+]
+if primary_category is not None:
+    metric_rows.append(("", "Primary Category", primary_category))
+metric_rows += [
+    ("**Prosecution Patterns**", "RCE Rate", f"{rce_rate:.0f}%"),
+    ("", "Final Rejection Rate", f"{final_rate:.0f}%"),
+    ("", "Difficulty Level", f"{difficulty} {color}"),
+    ("", "Expected Budget", f"{budget_multiplier} standard"),
+    ("**Quality Indicators**", "Petition Rate", f"{petition_rate:.0f}%"),
+    ("", "PTAB Challenge Rate", f"{challenge_rate:.0f}%"),
+]
+
+print("\\n".join([
+    "| Category | Metric | Value |",
+    "|----------|--------|-------|",
+    *(f"| {category} | {metric} | {value} |" for category, metric, value in metric_rows),
+]))
 print()
 ```
 
@@ -1234,10 +1439,10 @@ print()
 print("#### 1. Prior Art & IDS Strategy")
 print()
 
-if len(all_citations) > 0:
+if total_citations_collected > 0:
     if examiner_rate > 70:
         print("**Recommendation:** Focus on technical distinctions over comprehensive IDS")
-        print(f"**Rationale:** Examiner rarely uses applicant-cited references ({{examiner_rate:.0f}}% self-cited)")
+        print(f"**Rationale:** Examiner rarely uses applicant-cited references ({examiner_rate:.0f}% self-cited)")
         print("**Action Items:**")
         print("  - File targeted IDS with key closest prior art only")
         print("  - Include detailed explanations of non-applicability for each reference")
@@ -1245,7 +1450,7 @@ if len(all_citations) > 0:
         print()
     elif examiner_rate > 50:
         print("**Recommendation:** Strategic IDS filing of closest prior art with commentary")
-        print(f"**Rationale:** Examiner uses some applicant-cited references ({{examiner_rate:.0f}}% self-cited)")
+        print(f"**Rationale:** Examiner uses some applicant-cited references ({examiner_rate:.0f}% self-cited)")
         print("**Action Items:**")
         print("  - Include key references that show invention's technical advantages")
         print("  - Provide substantive commentary explaining how invention differs")
@@ -1253,7 +1458,7 @@ if len(all_citations) > 0:
         print()
     else:
         print("**Recommendation:** Comprehensive IDS with detailed framing explanations")
-        print(f"**Rationale:** Examiner frequently uses applicant-cited references ({{100-examiner_rate:.0f}}% applicant-cited used)")
+        print(f"**Rationale:** Examiner frequently uses applicant-cited references ({100-examiner_rate:.0f}% applicant-cited used)")
         print("**Action Items:**")
         print("  - File comprehensive IDS to shape prosecution narrative")
         print("  - Include detailed technical comparison for key references")
@@ -1309,22 +1514,22 @@ print("#### 3. Prosecution Timeline & Budget Planning")
 print()
 
 if avg_rce > 0.5:
-    print(f"**Expected Duration:** Extended (RCE likely in {{rce_rate:.0f}}% of cases)")
-    print(f"**Budget Planning:** Plan for {{budget_multiplier}} standard prosecution costs")
+    print(f"**Expected Duration:** Extended (RCE likely in {rce_rate:.0f}% of cases)")
+    print(f"**Budget Planning:** Plan for {budget_multiplier} standard prosecution costs")
     print("**Strategic Recommendations:**")
     print("  - Consider early claim narrowing to avoid multiple RCE cycles")
     print("  - Prepare fall-back claim sets in advance")
     print("  - Budget for extended prosecution (2-3+ years from first OA)")
     print()
 elif avg_rce > 0.2:
-    print(f"**Expected Duration:** Standard to extended (RCE in {{rce_rate:.0f}}% of cases)")
-    print(f"**Budget Planning:** Plan for {{budget_multiplier}} standard prosecution costs")
+    print(f"**Expected Duration:** Standard to extended (RCE in {rce_rate:.0f}% of cases)")
+    print(f"**Budget Planning:** Plan for {budget_multiplier} standard prosecution costs")
     print("**Strategic Recommendations:**")
     print("  - Have contingency claim sets ready")
     print("  - Standard prosecution timeline (1.5-2 years from first OA)")
     print()
 else:
-    print(f"**Expected Duration:** Standard (RCE uncommon at {{rce_rate:.0f}}%)")
+    print(f"**Expected Duration:** Standard (RCE uncommon at {rce_rate:.0f}%)")
     print("**Budget Planning:** Standard prosecution budget should suffice")
     print("**Strategic Recommendations:**")
     print("  - Examiner reasonable - standard prosecution approach")
@@ -1335,19 +1540,19 @@ print("#### 4. Office Action Response Strategy")
 print()
 
 if avg_oa_pages > 15:
-    print(f"**Office Action Detail:** Lengthy, detailed OAs ({{avg_oa_pages:.0f}} pages avg)")
+    print(f"**Office Action Detail:** Lengthy, detailed OAs ({avg_oa_pages:.0f} pages avg)")
     print("**Response Approach:**")
     print("  - Allocate extra time for comprehensive rebuttal preparation")
     print("  - Match examiner's thoroughness with equally detailed technical responses")
     print("  - Provide point-by-point responses with supporting technical evidence")
     print()
 elif avg_oa_pages > 10:
-    print(f"**Office Action Detail:** Standard detail level ({{avg_oa_pages:.0f}} pages avg)")
+    print(f"**Office Action Detail:** Standard detail level ({avg_oa_pages:.0f} pages avg)")
     print("**Response Approach:** Normal response timeline and standard technical arguments")
     print()
 
 if final_rate > 50:
-    print(f"**Final OA Strategy:** High final rate ({{final_rate:.0f}}%) - plan for finals")
+    print(f"**Final OA Strategy:** High final rate ({final_rate:.0f}%) - plan for finals")
     print("**Recommendations:**")
     print("  - Consider early claim narrowing to avoid finals")
     print("  - Prepare RCE fall-back claim sets in advance")
@@ -1358,7 +1563,7 @@ print("#### 5. Risk Mitigation Strategies")
 print()
 
 if petition_rate > 15:
-    print(f"⚠️ **Procedural Risk:** Above-average petition rate ({{petition_rate:.0f}}%)")
+    print(f"⚠️ **Procedural Risk:** Above-average petition rate ({petition_rate:.0f}%)")
     print("**Mitigation Actions:**")
     print("  - Ensure strict deadline compliance (calendar all dates immediately)")
     print("  - Maintain clear, documented communication with examiner")
@@ -1366,18 +1571,18 @@ if petition_rate > 15:
     print()
 
 if challenge_rate > 20:
-    print(f"⚠️ **Post-Grant Risk:** High PTAB challenge rate ({{challenge_rate:.0f}}%)")
+    print(f"⚠️ **Post-Grant Risk:** High PTAB challenge rate ({challenge_rate:.0f}%)")
     print("**Mitigation Actions:**")
     print("  - Conduct comprehensive prior art search before filing")
     print("  - Emphasize claim specificity and clear written description")
     print("  - Document technical advantages and unexpected results")
     print()
 elif challenge_rate > 10:
-    print(f"⚠️ **Post-Grant Risk:** Moderate PTAB activity ({{challenge_rate:.0f}}%)")
+    print(f"⚠️ **Post-Grant Risk:** Moderate PTAB activity ({challenge_rate:.0f}%)")
     print("**Mitigation Actions:** Standard prior art diligence recommended")
     print()
 else:
-    print(f"✅ **Low Post-Grant Risk:** Minimal PTAB challenges ({{challenge_rate:.0f}}%)")
+    print(f"✅ **Low Post-Grant Risk:** Minimal PTAB challenges ({challenge_rate:.0f}%)")
     print()
 
 print("#### 6. Examiner Interview Strategy")
@@ -1410,12 +1615,12 @@ print("### DATA QUALITY & LIMITATIONS")
 print()
 
 print("**Coverage Analysis:**")
-print(f"  - Applications Analyzed: {{len(applications)}}")
-print(f"  - Citation Data Available: {{apps_with_citations}}/{{sample_size}} ({{citation_coverage:.0f}}%)")
-print(f"  - Prosecution Data: {{len(prosecution_sample)}} applications")
-print(f"  - NOA Analysis: {{len(noa_insights)}} granted patents")
-print(f"  - Petition Data: {{len(petition_sample)}} applications checked")
-print(f"  - PTAB Data: {{len(ptab_sample)}} granted patents checked")
+print(f"  - Applications Analyzed: {len(applications)}")
+print(f"  - Citation Data Available: {apps_with_citations}/{sample_size} ({citation_coverage:.0f}%)")
+print(f"  - Prosecution Data: {len(prosecution_sample)} applications")
+print(f"  - NOA Analysis: {len(noa_insights)} granted patents")
+print(f"  - Petition Data: {len(petition_sample)} applications checked")
+print(f"  - PTAB Data: {len(ptab_sample)} granted patents checked")
 print()
 
 print("**Data Limitations:**")
@@ -1427,7 +1632,7 @@ print()
 
 if citation_coverage < 50:
     print("⚠️ **LOW CITATION COVERAGE WARNING:**")
-    print(f"   Citation-based recommendations have limited statistical validity ({{citation_coverage:.0f}}% coverage)")
+    print(f"   Citation-based recommendations have limited statistical validity ({citation_coverage:.0f}% coverage)")
     print("   **Recommendations:**")
     print("     - Request more recent applications (filed 2018+) for better citation coverage")
     print("     - Supplement with manual review of office actions")
@@ -1436,63 +1641,84 @@ if citation_coverage < 50:
 
 print("**Statistical Confidence:**")
 if len(applications) >= min_sample_size:
-    print(f"  ✅ **Sample size ({{len(applications)}}) meets minimum threshold ({{min_sample_size}})**")
+    print(f"  ✅ **Sample size ({len(applications)}) meets minimum threshold ({min_sample_size})**")
     print("     Results have reasonable statistical confidence")
 else:
-    print(f"  ⚠️ **Sample size ({{len(applications)}}) below recommended minimum ({{min_sample_size}})**")
+    print(f"  ⚠️ **Sample size ({len(applications)}) below recommended minimum ({min_sample_size})**")
     print("     **Recommendation:** Increase sample for more robust conclusions")
     print("     Consider broader search or longer time period")
+
+# Adaptive sample size: Wilson interval on the observed grant rate, and the
+# sample needed for the target margin of error (adjust these two as needed)
+MARGIN_OF_ERROR = 0.05
+CONFIDENCE = 0.95
+
+n_apps = len(applications)
+if n_apps > 0:
+    z = statistics.NormalDist().inv_cdf(0.5 + CONFIDENCE / 2)
+    p_grant = len(granted_apps) / n_apps
+    center = (p_grant + z * z / (2 * n_apps)) / (1 + z * z / n_apps)
+    half_width = (z / (1 + z * z / n_apps)) * math.sqrt(
+        p_grant * (1 - p_grant) / n_apps + z * z / (4 * n_apps * n_apps)
+    )
+    n_needed = math.ceil(z * z * p_grant * (1 - p_grant) / MARGIN_OF_ERROR ** 2)
+
+    print(f"  - Grant rate: {p_grant:.0%} ({CONFIDENCE:.0%} CI {max(0.0, center - half_width):.0%}-{min(1.0, center + half_width):.0%})")
+    if n_needed > n_apps:
+        print(f"     **Recommendation:** Fetch {n_needed - n_apps} more applications for ±{MARGIN_OF_ERROR:.0%} at {CONFIDENCE:.0%} confidence")
+    else:
+        print(f"     Sample already sufficient for ±{MARGIN_OF_ERROR:.0%} at {CONFIDENCE:.0%} confidence (needs {n_needed})")
 print()
 ```
 
 ### 7.4 Actionable Next Steps
 
 ```python
-print("---")
-print()
-print("### RECOMMENDED NEXT STEPS")
-print()
-
-print("**Immediate Actions (Before Filing):**")
-print("  1. Review NOA text for specific allowance reasoning patterns (completed above)")
-print("  2. Analyze representative office actions for claim interpretation style")
-print("  3. Prepare initial claim sets following identified success patterns")
-print("  4. Conduct prior art search focusing on examiner's preferred citation types")
-print()
-
-print("**Pre-Filing Preparation:**")
-print("  5. Draft specification with adequate support for all claim limitations")
-print("  6. Include concrete examples and specific implementation details")
-print("  7. Prepare dependent claims for narrowing strategy if RCE likely")
-print("  8. Develop IDS strategy based on examiner's citation selectivity")
-print()
-
-print("**During Prosecution:**")
-print("  9. Schedule examiner interview after first office action")
-print("  10. Prepare amendment proposals aligned with NOA allowance patterns")
-print("  11. Provide detailed technical arguments matching examiner's OA detail level")
-print()
-
-print("**Ongoing Monitoring:**")
-print("  12. Track examiner's recent allowances for evolving patterns")
-print("  13. Monitor PTAB challenges if post-grant risk identified")
-print("  14. Review petition outcomes if quality concerns flagged")
-print()
-
-print("=" * 80)
-print("END OF ENHANCED EXAMINER BEHAVIOR INTELLIGENCE REPORT")
-print("=" * 80)
+# Static guidance: joined once and written with a single print
+NEXT_STEPS_REPORT = "\\n".join((
+    "---",
+    "",
+    "### RECOMMENDED NEXT STEPS",
+    "",
+    "**Immediate Actions (Before Filing):**",
+    "  1. Review NOA text for specific allowance reasoning patterns (completed above)",
+    "  2. Analyze representative office actions for claim interpretation style",
+    "  3. Prepare initial claim sets following identified success patterns",
+    "  4. Conduct prior art search focusing on examiner's preferred citation types",
+    "",
+    "**Pre-Filing Preparation:**",
+    "  5. Draft specification with adequate support for all claim limitations",
+    "  6. Include concrete examples and specific implementation details",
+    "  7. Prepare dependent claims for narrowing strategy if RCE likely",
+    "  8. Develop IDS strategy based on examiner's citation selectivity",
+    "",
+    "**During Prosecution:**",
+    "  9. Schedule examiner interview after first office action",
+    "  10. Prepare amendment proposals aligned with NOA allowance patterns",
+    "  11. Provide detailed technical arguments matching examiner's OA detail level",
+    "",
+    "**Ongoing Monitoring:**",
+    "  12. Track examiner's recent allowances for evolving patterns",
+    "  13. Monitor PTAB challenges if post-grant risk identified",
+    "  14. Review petition outcomes if quality concerns flagged",
+    "",
+    "=" * 80,
+    "END OF ENHANCED EXAMINER BEHAVIOR INTELLIGENCE REPORT",
+    "=" * 80,
+))
+print(NEXT_STEPS_REPORT)
 print()
 
 print("**Report Generation Notes:**")
-print(f"  - Total Applications Retrieved: {{len(applications)}}")
-print(f"  - Citations Analyzed: {{len(all_citations)}}")
-print(f"  - NOAs Extracted: {{len(noa_insights)}}")
+print(f"  - Total Applications Retrieved: {len(applications)}")
+print(f"  - Citations Analyzed: {total_citations_collected}")
+print(f"  - NOAs Extracted: {len(noa_insights)}")
 if len(noa_insights) > 0:
-    print(f"  - Total Extraction Cost: ${{total_noa_cost:.3f}}")
+    print(f"  - Total Extraction Cost: $${total_noa_cost:.3f}")
 print()
 print("**Next Analysis:** Consider running this analysis periodically (every 6-12 months)")
 print("to track examiner behavior changes over time.")
+end_phase()  # Emit this phase's report in one write
 ```
 
 ---
@@ -1542,9 +1768,9 @@ Every API call wrapped in try-except with:
 - Citations API calls: Free (public API)
 - FPD API calls: Free (public API)
 - PTAB API calls: Free (public API)
-- **NOA extraction (5 docs):** $0.01-0.05 (auto-optimize mode with PyPDF2 first, Mistral fallback)
+- **NOA extraction (5 docs):** $$0.01-0.05 (auto-optimize mode with PyPDF2 first, Mistral fallback)
 
-**Total estimated cost:** < $0.10 per examiner analysis
+**Total estimated cost:** < $$0.10 per examiner analysis
 
 ---
 
@@ -1563,3 +1789,57 @@ This enhanced prompt provides complete workflows with:
 
 **Philosophy:** Invest context in prompt to prevent 10x mistakes during execution.
 """
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_prompt(examiner_name: str, art_unit: str, technology_keywords: str) -> str:
+    """Fill the prompt template for one parameter combination (cached)."""
+    examiner_name_display = examiner_name or "Not specified"
+    art_unit_display = art_unit or "Not specified"
+    technology_keywords_display = technology_keywords or "Not specified"
+
+    return _PROMPT_TEMPLATE.substitute(
+        examiner_name=examiner_name,
+        art_unit=art_unit,
+        technology_keywords=technology_keywords,
+        examiner_name_display=examiner_name_display,
+        art_unit_display=art_unit_display,
+        technology_keywords_display=technology_keywords_display,
+    )
+
+
+@_prompt(
+    name="enhanced_examiner_behavior_intelligence_PFW_PTAB_FPD",
+    description="ENHANCED: Comprehensive examiner profiling with citation patterns, petition history, PTAB correlation, and strategic prosecution recommendations. At least ONE parameter required (examiner_name, art_unit, or technology_keywords). Citations data Oct 1, 2017+ only. Requires PFW, Citations, FPD, and PTAB MCPs.",
+)
+async def enhanced_examiner_behavior_intelligence_PFW_PTAB_FPD_prompt(
+    examiner_name: str = "", art_unit: str = "", technology_keywords: str = ""
+) -> str:
+    """Generate comprehensive examiner profiles combining prosecution patterns, citation behavior,
+    petition history, and PTAB challenge correlation for strategic prosecution planning.
+
+    MANDATORY FIRST STEP: Validate the provided parameters and immediately begin analysis using
+    any non-empty parameter. If ALL parameters are empty, ask the user to provide at least one
+    search parameter.
+
+    This is a COMPREHENSIVE MULTI-PHASE workflow:
+    1. PFW: Get examiner's applications with wildcard search + ultra-minimal fields
+    2. Citations: Analyze citation patterns with 2017+ date filtering
+    3. PFW: NOA deep dive for allowance reasoning patterns
+    4. PFW: Prosecution efficiency metrics (RCE, finals, amendments)
+    5. FPD: Petition history for quality assessment
+    6. PTAB: Post-grant challenge correlation
+    7. Generate comprehensive intelligence report with strategic recommendations
+
+    Args:
+        examiner_name: Examiner last name or full name (e.g., 'SMITH' or 'SMITH, JOHN')
+        art_unit: Optional art unit number for filtering (e.g., '2854')
+        technology_keywords: Optional technology focus areas
+    """
+
+    # Validate inputs
+    if not examiner_name and not art_unit and not technology_keywords:
+        return _MISSING_PARAMS_MSG
+
+    return _render_prompt(examiner_name, art_unit, technology_keywords)
@@ -4,28 +4,17 @@ Complete litigation citation research package using PFW, Citations, and PTAB cro
 for comprehensive case preparation
 """
 
-from . import mcp
-
+import functools
+from string import Template
+from typing import Final
 
-@mcp.prompt(
-    name="litigation_citation_research_PFW_PTAB",
-    description="Complete litigation citation research package. At least ONE required (patent_number or application_number). include_ptab: true/false for PTAB analysis. Requires PFW MCP, optional PTAB MCP.",
-)
-async def litigation_citation_research_PFW_PTAB_prompt(
-    patent_number: str = "",
-    application_number: str = "",
-    include_ptab: str = "true",
-) -> str:
-    """Comprehensive litigation research combining citation analysis, prosecution history, and PTAB proceedings.
+from . import mcp
+from ._shared_blocks import BOOTSTRAP_CI_BLOCK, NOA_EXTRACTION_BLOCK, OA_DATE_CLAUSE
 
-    Args:
-        patent_number: Patent number for litigation research (e.g., '9049188')
-        application_number: Application number if patent number not available
-        include_ptab: Include PTAB proceedings analysis ('true'/'false')
-    """
+# Bound once; register_prompts() sets mcp before importing this module
+_prompt = mcp.prompt
 
-    if not patent_number and not application_number:
-        return """
+_MISSING_IDENTIFIER_MSG: Final[str] = """
 # LITIGATION CITATION RESEARCH PACKAGE
 
 ❌ **ERROR: Missing Patent Identifier**
@@ -41,14 +30,13 @@ include_ptab='true'
 ```
 """
 
-    identifier = patent_number or application_number
-    id_type = "patent" if patent_number else "application"
-
-    return f"""
+# Built once at import; only the identifier fields vary per call
+_RESEARCH_TEMPLATE: Final[Template] = Template(
+    """
 # LITIGATION CITATION RESEARCH PACKAGE
 
-**Target {id_type.title()}:** {identifier}
-**Include PTAB Analysis:** {include_ptab}
+**Target ${id_type_title}:** ${identifier}
+**Include PTAB Analysis:** ${include_ptab}
 
 ## Phase 1: Citation Intelligence (Enriched Citation MCP)
 
@@ -56,81 +44,123 @@ include_ptab='true'
 
 ```python
 # Search for all citations related to the patent/application
-if "{patent_number}":
-    criteria = f'publicationNumber:{patent_number}'
+if "${patent_number}":
+    criteria = f'publicationNumber:${patent_number}'
 else:
-    criteria = f'patentApplicationNumber:{application_number}'
+    criteria = f'patentApplicationNumber:${application_number}'
 
 # Include date constraint (citations from 2017-10-01+ only)
-criteria += ' AND officeActionDate:[2017-10-01 TO *]'
+criteria += ' AND ${oa_date_clause}'
 
-# Get comprehensive citation data
-citations = search_citations_balanced(
+# Citations and PTAB discovery (Phase 3) are both keyed off the identifier and
+# independent of each other, so fetch them together; if your environment cannot
+# await tool calls, issue them as parallel tool calls instead
+import asyncio
+
+include_ptab = "${include_ptab}".lower() == 'true' and bool("${patent_number}")
+
+citations_call = search_citations_balanced(
     criteria=criteria,
     rows=200
 )
 
+if include_ptab:
+    # Ultra-minimal mode first for discovery, then escalate to balanced if needed
+    ptab_call = search_trials_minimal(
+        patent_number="${patent_number}",
+        fields=['trialNumber', 'trialMetaData.trialStatusCategory', 'petitionerData.petitionerName'],
+        limit=20
+    )
+    citations, ptab_proceedings = await asyncio.gather(citations_call, ptab_call)
+else:
+    citations, ptab_proceedings = await citations_call, None
+
 print(f"CITATION INTELLIGENCE")
-print(f"Found {{citations['response']['numFound']}} citation records")
+print(f"Found {citations['response']['numFound']} citation records")
 ```
 
 ### Step 1.2: Citation Analysis for Litigation
 
 ```python
 from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 
-# Categorize for litigation strategy
-examiner_citations = []
-applicant_citations = []
-key_prior_art = Counter()
+# Categorize for litigation strategy in one pass over the docs, keeping only
+# counts and reference ids rather than copies of each citation record
+examiner_count = 0
+applicant_count = 0
+key_prior_art = {}
+ref_ids = []
 
 for citation in citations['response']['docs']:
     ref_id = citation.get('citedDocumentIdentifier', 'Unknown')
-    category = citation.get('citationCategoryCode', 'Unknown')
 
     # Track cited references for invalidity research
-    key_prior_art[ref_id] += 1
+    key_prior_art[ref_id] = key_prior_art.get(ref_id, 0) + 1
+    ref_ids.append(ref_id)
 
     # Separate examiner vs applicant citations
     if citation.get('examinerCitedReferenceIndicator') == 'true':
-        examiner_citations.append(citation)
+        examiner_count += 1
     else:
-        applicant_citations.append(citation)
+        applicant_count += 1
+
+print(f"Examiner citations: {examiner_count}")
+print(f"Applicant citations: {applicant_count}")
 
-print(f"Examiner citations: {{len(examiner_citations)}}")
-print(f"Applicant citations: {{len(applicant_citations)}}")
+# Partial sort: only the top 10 are ordered, not the long tail
+top_refs = nlargest(10, key_prior_art.items(), key=itemgetter(1))
 
-print("\\nMost frequently cited references (invalidity targets):")
-for ref, count in key_prior_art.most_common(10):
-    print(f"  - {{ref}}: cited {{count}} times")
+${bootstrap_ci_block}
+# Show how much each count could move on a resample before ranking targets
+ref_ci = bootstrap_ci(ref_ids, [ref for ref, _ in top_refs])
+
+print("\\nMost frequently cited references (invalidity targets, 95% bootstrap CI):")
+for ref, count in top_refs:
+    lo, hi = ref_ci[ref]
+    print(f"  - {ref}: cited {count} times [{lo}-{hi}]")
 ```
 
 ### Step 1.3: Detailed Citation Context
 
 ```python
 # Get context for top citations
-top_citations = citations['response']['docs'][:10]
-
-litigation_citations = []
-for citation in top_citations:
-    citation_id = citation.get('citationIdentifier')
-    if citation_id:
-        details = get_citation_details(
-            citation_id=citation_id,
+# Detail lookups run concurrently (max 5 in flight); if your environment cannot
+# await tool calls, issue them as parallel tool calls instead
+import asyncio
+from itertools import islice
+
+top_citations = [c for c in islice(citations['response']['docs'], 10) if c.get('citationIdentifier')]
+details_semaphore = asyncio.Semaphore(5)
+
+async def fetch_details(citation):
+    async with details_semaphore:
+        return await get_citation_details(
+            citation_id=citation['citationIdentifier'],
             include_context=True
         )
 
-        litigation_citations.append({{
-            'reference': citation.get('citedDocumentIdentifier'),
-            'category': citation.get('citationCategoryCode'),
-            'source': 'Examiner' if citation.get('examinerCitedReferenceIndicator') == 'true' else 'Applicant',
-            'context': details.get('citingPassageText', 'No context available')[:300]
-        }})
+details_list = await asyncio.gather(
+    *(fetch_details(c) for c in top_citations), return_exceptions=True
+)
+
+litigation_citations = []
+for citation, details in zip(top_citations, details_list):
+    if isinstance(details, Exception):
+        continue
+
+    litigation_citations.append({
+        'reference': citation.get('citedDocumentIdentifier'),
+        'category': citation.get('citationCategoryCode'),
+        'source': 'Examiner' if citation.get('examinerCitedReferenceIndicator') == 'true' else 'Applicant',
+        'context': details.get('citingPassageText', 'No context available')[:300]
+    })
 
 print("\\nKey Citations with Context:")
 for i, cite in enumerate(litigation_citations):
-    print(f"{{i+1}}. {{cite['reference']}} ({{cite['category']}}, {{cite['source']}})")
-    print(f"   Context: {{cite['context']}}")
+    print(f"{i+1}. {cite['reference']} ({cite['category']}, {cite['source']})")
+    print(f"   Context: {cite['context']}")
 ```
 
 ## Phase 2: Prosecution History (PFW MCP)
@@ -139,55 +169,53 @@ for i, cite in enumerate(litigation_citations):
 
 ```python
 # Get application number if we only have patent number
-if "{patent_number}" and not "{application_number}":
+if "${patent_number}" and not "${application_number}":
     # Search for application using patent number
-    pfw_search = pfw_search_applications_minimal(
-        query=f'patentNumber:{patent_number}',
+    pfw_search = await pfw_search_applications_minimal(
+        query=f'patentNumber:${patent_number}',
         fields=['applicationNumberText'],
         limit=1
     )
     app_number = pfw_search['applications'][0]['applicationNumberText'] if pfw_search['applications'] else None
 else:
-    app_number = "{application_number}"
+    app_number = "${application_number}"
 
 if app_number:
     print(f"\\nPROSECUTION HISTORY ANALYSIS")
-    print(f"Application Number: {{app_number}}")
+    print(f"Application Number: {app_number}")
 
     # Get key prosecution documents
-    key_docs = pfw_get_application_documents(
+    key_docs = await pfw_get_application_documents(
         app_number=app_number,
         limit=50
     )
 
-    print(f"Found {{key_docs['count']}} prosecution documents")
+    print(f"Found {key_docs['count']} prosecution documents")
 ```
 
 ### Step 2.2: Extract Critical Prosecution Evidence
 
 ```python
 # Get specific document types for litigation
-noa_docs = pfw_get_application_documents(
+noa_docs = await pfw_get_application_documents(
     app_number=app_number,
     document_code='NOA',  # Notice of Allowance
     limit=10
 )
 
-rejection_docs = pfw_get_application_documents(
+rejection_docs = await pfw_get_application_documents(
     app_number=app_number,
     document_code='CTFR',  # Final Rejection
     limit=10
 )
 
-print(f"Notice of Allowance documents: {{noa_docs['count']}}")
-print(f"Final Rejection documents: {{rejection_docs['count']}}")
+print(f"Notice of Allowance documents: {noa_docs['count']}")
+print(f"Final Rejection documents: {rejection_docs['count']}")
 
 # Extract examiner's final reasoning
-if noa_docs['documentBag']:
-    noa_content = pfw_get_document_content(
-        app_number=app_number,
-        document_identifier=noa_docs['documentBag'][0]['documentIdentifier']
-    )
+noa_bag = islice(noa_docs['documentBag'], 5)
+${noa_extraction_block}
+if noa_content:
     print("\\nExaminer's allowance reasoning extracted for claim construction evidence")
 ```
 
@@ -206,22 +234,16 @@ if noa_docs['documentBag']:
 - Combined: 95-99% reduction vs old API
 
 ```python
-if "{include_ptab}".lower() == 'true' and "{patent_number}":
+if include_ptab:
     print(f"\\nPTAB PROCEEDINGS ANALYSIS")
 
-    # Search for PTAB proceedings involving this patent (ultra-minimal mode first)
-    # Use ultra-minimal mode first for discovery, then escalate to balanced if needed
-    ptab_proceedings = search_trials_minimal(
-        patent_number="{patent_number}",
-        fields=['trialNumber', 'trialMetaData.trialStatusCategory', 'petitionerData.petitionerName'],
-        limit=20
-    )
+    # ptab_proceedings was fetched alongside the citations in Step 1.1
     # If user needs more details on specific trials, follow up with:
     # search_trials_balanced(trial_number=selected_trial, limit=1)
 
-    print(f"Found {{ptab_proceedings.get('response', {{}}).get('numFound', 0)}} PTAB proceedings")
+    print(f"Found {ptab_proceedings.get('response', {}).get('numFound', 0)} PTAB proceedings")
 
-    if ptab_proceedings.get('response', {{}}).get('docs'):
+    if ptab_proceedings.get('response', {}).get('docs'):
         print("\\nPTAB Proceeding Types:")
         proceeding_types = Counter()
 
@@ -230,7 +252,7 @@ if "{include_ptab}".lower() == 'true' and "{patent_number}":
             proceeding_types[proc_type] += 1
 
         for proc_type, count in proceeding_types.items():
-            print(f"  - {{proc_type}}: {{count}}")
+            print(f"  - {proc_type}: {count}")
 
         # Get documents for key proceedings (decisions are now retrieved via documents API)
         key_proceeding = ptab_proceedings['response']['docs'][0]
@@ -239,14 +261,14 @@ if "{include_ptab}".lower() == 'true' and "{patent_number}":
         if trial_number:
             # Use ptab_get_documents() to list documents (supports filtering by category/party)
             # Use filtering to get only decision documents (95% token reduction)
-            decisions = ptab_get_documents(
+            decisions = await ptab_get_documents(
                 identifier=trial_number,
                 identifier_type='trial',
                 document_category='DECISION',  # Filter for decisions only
                 limit=5
             )
 
-            print(f"\\nFound {{len(decisions.get('documents', []))}} decision documents for trial {{trial_number}}")
+            print(f"\\nFound {len(decisions.get('documents', []))} decision documents for trial {trial_number}")
 ```
 
 ## Phase 4: Comprehensive Litigation Package
@@ -258,27 +280,28 @@ print(f"="*50)
 
 # Citation intelligence summary
 print(f"\\n1. CITATION INTELLIGENCE:")
-print(f"   - Total citations: {{citations['response']['numFound']}}")
-print(f"   - Examiner citations: {{len(examiner_citations)}}")
-print(f"   - Key prior art references: {{len(key_prior_art)}}")
+print(f"   - Total citations: {citations['response']['numFound']}")
+print(f"   - Examiner citations: {examiner_count}")
+print(f"   - Key prior art references: {len(key_prior_art)}")
 
 # Prosecution history summary
 print(f"\\n2. PROSECUTION HISTORY:")
-print(f"   - Application: {{app_number or 'Not found'}}")
-print(f"   - Total documents: {{key_docs['count'] if 'key_docs' in locals() else 'N/A'}}")
-print(f"   - Allowance documents: {{noa_docs['count'] if 'noa_docs' in locals() else 'N/A'}}")
+print(f"   - Application: {app_number or 'Not found'}")
+print(f"   - Total documents: {key_docs['count'] if 'key_docs' in locals() else 'N/A'}")
+print(f"   - Allowance documents: {noa_docs['count'] if 'noa_docs' in locals() else 'N/A'}")
 
 # PTAB summary
-if "{include_ptab}".lower() == 'true':
-    ptab_count = ptab_proceedings.get('response', {{}}).get('numFound', 0) if 'ptab_proceedings' in locals() else 0
+if "${include_ptab}".lower() == 'true':
+    ptab_count = ptab_proceedings.get('response', {}).get('numFound', 0) if ptab_proceedings else 0
     print(f"\\n3. PTAB PROCEEDINGS:")
-    print(f"   - Total proceedings: {{ptab_count}}")
-    print(f"   - Proceeding types: {{dict(proceeding_types) if 'proceeding_types' in locals() else 'None'}}")
+    print(f"   - Total proceedings: {ptab_count}")
+    proceeding_summary = ', '.join(f"{k}={v}" for k, v in proceeding_types.items()) if 'proceeding_types' in locals() else 'None'
+    print(f"   - Proceeding types: {proceeding_summary}")
 
 print(f"\\n4. LITIGATION READINESS:")
-print(f"   - Citation context extracted: {{len(litigation_citations)}} key references")
-print(f"   - Prosecution reasoning available: {{'Yes' if 'noa_content' in locals() else 'No'}}")
-print(f"   - PTAB challenge history: {{'Yes' if ptab_count > 0 else 'No'}}")
+print(f"   - Citation context extracted: {len(litigation_citations)} key references")
+print(f"   - Prosecution reasoning available: {'Yes' if noa_content else 'No'}")
+print(f"   - PTAB challenge history: {'Yes' if ptab_count > 0 else 'No'}")
 ```
 
 ## Expected Litigation Intelligence
@@ -299,3 +322,45 @@ print(f"   - PTAB challenge history: {{'Yes' if ptab_count > 0 else 'No'}}")
 
 **Token Efficiency:** Progressive disclosure from ultra-minimal discovery to balanced analysis for critical documents.
 """
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_prompt(patent_number: str, application_number: str, include_ptab: str) -> str:
+    """Fill the prompt template for one parameter combination (cached)."""
+    identifier = patent_number or application_number
+    id_type_title = "Patent" if patent_number else "Application"
+
+    return _RESEARCH_TEMPLATE.substitute(
+        identifier=identifier,
+        id_type_title=id_type_title,
+        include_ptab=include_ptab,
+        patent_number=patent_number,
+        application_number=application_number,
+        bootstrap_ci_block=BOOTSTRAP_CI_BLOCK,
+        noa_extraction_block=NOA_EXTRACTION_BLOCK,
+        oa_date_clause=OA_DATE_CLAUSE,
+    )
+
+
+@_prompt(
+    name="litigation_citation_research_PFW_PTAB",
+    description="Complete litigation citation research package. At least ONE required (patent_number or application_number). include_ptab: true/false for PTAB analysis. Requires PFW MCP, optional PTAB MCP.",
+)
+async def litigation_citation_research_PFW_PTAB_prompt(
+    patent_number: str = "",
+    application_number: str = "",
+    include_ptab: str = "true",
+) -> str:
+    """Comprehensive litigation research combining citation analysis, prosecution history, and PTAB proceedings.
+
+    Args:
+        patent_number: Patent number for litigation research (e.g., '9049188')
+        application_number: Application number if patent number not available
+        include_ptab: Include PTAB proceedings analysis ('true'/'false')
+    """
+
+    if not patent_number and not application_number:
+        return _MISSING_IDENTIFIER_MSG
+
+    return _render_prompt(patent_number, application_number, include_ptab)
@@ -3,26 +3,18 @@
 Complete citation analysis for specific patent or application with prosecution context
 """
 
-from . import mcp
-
+import functools
+import textwrap
+from string import Template
+from typing import Final
 
-@mcp.prompt(
-    name="patent_citation_analysis",
-    description="Complete citation analysis for specific patent or application. At least ONE required (patent_number or application_number). include_context: true/false for prosecution context from PFW.",
-)
-async def patent_citation_analysis_prompt(
-    patent_number: str = "", application_number: str = "", include_context: str = "true"
-) -> str:
-    """Analyze all citations for a specific patent or application with optional prosecution context.
+from . import mcp
+from ._shared_blocks import NOA_EXTRACTION_BLOCK, OA_DATE_CLAUSE
 
-    Args:
-        patent_number: Patent number (e.g., '9049188')
-        application_number: Application number (e.g., '14171705')
-        include_context: Include prosecution context from PFW ('true'/'false')
-    """
+# Bound once; register_prompts() sets mcp before importing this module
+_prompt = mcp.prompt
 
-    if not patent_number and not application_number:
-        return """
+_MISSING_IDENTIFIER_MSG: Final[str] = """
 # PATENT CITATION ANALYSIS
 
 ❌ **ERROR: Missing Identifier**
@@ -39,34 +31,36 @@ include_context='true'
 ```
 """
 
-    identifier = patent_number or application_number
-    id_type = "patent" if patent_number else "application"
+# Step 4 runs the shared block inside two levels of if
+_NOA_EXTRACTION_BLOCK: Final[str] = textwrap.indent(NOA_EXTRACTION_BLOCK, " " * 8)
 
-    return f"""
+# Built once at import; only the identifier fields vary per call
+_ANALYSIS_TEMPLATE: Final[Template] = Template(
+    """
 # PATENT CITATION ANALYSIS
 
-**Target {id_type.title()}:** {identifier}
-**Include Prosecution Context:** {include_context}
+**Target ${id_type_title}:** ${identifier}
+**Include Citation & Prosecution Context:** ${include_context}
 
 ## Step 1: Get Citation Records
 
 ```python
 # Search by patent or application number
-if "{patent_number}":
-    criteria = f'publicationNumber:{patent_number}'
+if "${patent_number}":
+    criteria = f'publicationNumber:${patent_number}'
 else:
-    criteria = f'patentApplicationNumber:{application_number}'
+    criteria = f'patentApplicationNumber:${application_number}'
 
 # Add date constraint
-criteria += ' AND officeActionDate:[2017-10-01 TO *]'
+criteria += ' AND ${oa_date_clause}'
 
 # Get comprehensive citation data
-citations = search_citations_balanced(
+citations = await search_citations_balanced(
     criteria=criteria,
     rows=100
 )
 
-print(f"Found {{citations['response']['numFound']}} citation records")
+print(f"Found {citations['response']['numFound']} citation records")
 ```
 
 ## Step 2: Citation Analysis
@@ -74,81 +68,90 @@ print(f"Found {{citations['response']['numFound']}} citation records")
 ```python
 from collections import Counter
 
-# Categorize citations
-categories = Counter()
-sources = Counter()
-art_units = Counter()
-
-for citation in citations['response']['docs']:
-    categories[citation.get('citationCategoryCode', 'Unknown')] += 1
-
-    if citation.get('examinerCitedReferenceIndicator') == 'true':
-        sources['Examiner'] += 1
-    else:
-        sources['Applicant'] += 1
-
-    art_units[citation.get('groupArtUnitNumber', 'Unknown')] += 1
+# Categorize citations (Counter does the counting loop in C)
+docs = citations['response']['docs']
+categories = Counter(c.get('citationCategoryCode', 'Unknown') for c in docs)
+sources = Counter(
+    'Examiner' if c.get('examinerCitedReferenceIndicator') == 'true' else 'Applicant'
+    for c in docs
+)
+art_units = Counter(c.get('groupArtUnitNumber', 'Unknown') for c in docs)
 
 print("Citation Summary:")
-print(f"Categories: {{dict(categories)}}")
-print(f"Sources: {{dict(sources)}}")
-print(f"Art Units: {{dict(art_units)}}")
+print("Categories:", *(f"{k}={v}" for k, v in categories.items()))
+print("Sources:", *(f"{k}={v}" for k, v in sources.items()))
+print("Art Units:", *(f"{k}={v}" for k, v in art_units.items()))
 ```
 
 ## Step 3: Detailed Citation Review
 
 ```python
 # Get individual citation details for key references
-key_citations = citations['response']['docs'][:10]  # Top 10
-
-for i, citation in enumerate(key_citations):
-    citation_id = citation.get('citationIdentifier')
-    if citation_id:
-        details = get_citation_details(
-            citation_id=citation_id,
-            include_context=True
-        )
+# Detail lookups run concurrently (max 5 in flight); if your environment cannot
+# await tool calls, issue them as parallel tool calls instead
+import asyncio
+
+# Passage text is all this step adds, so a summary-only run skips the lookups
+if "${include_context}".lower() == 'true':
+    key_citations = citations['response']['docs'][:10]  # Top 10
+    details_semaphore = asyncio.Semaphore(5)
+
+    async def fetch_details(citation):
+        citation_id = citation.get('citationIdentifier')
+        if not citation_id:
+            return None
+        async with details_semaphore:
+            return await get_citation_details(
+                citation_id=citation_id,
+                include_context=True
+            )
+
+    details_list = await asyncio.gather(
+        *(fetch_details(c) for c in key_citations), return_exceptions=True
+    )
+
+    for i, (citation, details) in enumerate(zip(key_citations, details_list)):
+        if details is None or isinstance(details, Exception):
+            continue
 
-        print(f"\\nCitation {{i+1}}:")
-        print(f"  Reference: {{citation.get('citedDocumentIdentifier')}}")
-        print(f"  Category: {{citation.get('citationCategoryCode')}}")
-        print(f"  Source: {{'Examiner' if citation.get('examinerCitedReferenceIndicator') == 'true' else 'Applicant'}}")
+        print(f"\\nCitation {i+1}:")
+        print(f"  Reference: {citation.get('citedDocumentIdentifier')}")
+        print(f"  Category: {citation.get('citationCategoryCode')}")
+        print(f"  Source: {'Examiner' if citation.get('examinerCitedReferenceIndicator') == 'true' else 'Applicant'}")
 
         if details.get('citingPassageText'):
-            print(f"  Context: {{details['citingPassageText'][:200]}}...")
+            print(f"  Context: {details['citingPassageText'][:200]}...")
+else:
+    print("\\nCitation detail lookups skipped (include_context=false)")
 ```
 
 ## Step 4: Prosecution Context (if enabled)
 
 ```python
-if "{include_context}".lower() == 'true':
+if "${include_context}".lower() == 'true':
     # Get prosecution history from PFW
-    if "{application_number}":
-        app_num = "{application_number}"
+    if "${application_number}":
+        app_number = "${application_number}"
     else:
         # Need to find application number from patent number
         print("Note: Need application number for prosecution context")
-        app_num = None
+        app_number = None
 
-    if app_num:
+    if app_number:
         # Get prosecution documents
-        docs = pfw_get_application_documents(
-            app_number=app_num,
+        docs = await pfw_get_application_documents(
+            app_number=app_number,
             document_code='NOA',  # Notice of Allowance
             limit=5
         )
 
         print(f"\\nProsecution Context:")
-        print(f"Found {{docs['count']}} Notice of Allowance documents")
+        print(f"Found {docs['count']} Notice of Allowance documents")
 
         # Get examiner's reasoning from NOA
-        if docs['documentBag']:
-            noa_doc = docs['documentBag'][0]
-            noa_content = pfw_get_document_content(
-                app_number=app_num,
-                document_identifier=noa_doc['documentIdentifier']
-            )
-
+        noa_bag = docs['documentBag']
+${noa_extraction_block}
+        if noa_content:
             print("Examiner's allowance reasoning available for comparison with citation decisions")
 ```
 
@@ -162,3 +165,42 @@ if "{include_context}".lower() == 'true':
 
 **Cross-MCP Integration:** Links citation decisions to prosecution outcomes for strategic insights.
 """
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_prompt(patent_number: str, application_number: str, include_context: str) -> str:
+    """Fill the prompt template for one parameter combination (cached)."""
+    identifier = patent_number or application_number
+    id_type_title = "Patent" if patent_number else "Application"
+
+    return _ANALYSIS_TEMPLATE.substitute(
+        identifier=identifier,
+        id_type_title=id_type_title,
+        include_context=include_context,
+        patent_number=patent_number,
+        application_number=application_number,
+        noa_extraction_block=_NOA_EXTRACTION_BLOCK,
+        oa_date_clause=OA_DATE_CLAUSE,
+    )
+
+
+@_prompt(
+    name="patent_citation_analysis",
+    description="Complete citation analysis for specific patent or application. At least ONE required (patent_number or application_number). include_context: true/false for citation passage context and prosecution context from PFW.",
+)
+async def patent_citation_analysis_prompt(
+    patent_number: str = "", application_number: str = "", include_context: str = "true"
+) -> str:
+    """Analyze all citations for a specific patent or application with optional prosecution context.
+
+    Args:
+        patent_number: Patent number (e.g., '9049188')
+        application_number: Application number (e.g., '14171705')
+        include_context: Include citation passage context and prosecution context from PFW ('true'/'false')
+    """
+
+    if not patent_number and not application_number:
+        return _MISSING_IDENTIFIER_MSG
+
+    return _render_prompt(patent_number, application_number, include_context)
@@ -4,30 +4,16 @@ Map prior art citation landscape for technology areas using art unit and tech ce
 with PFW integration
 """
 
-from . import mcp
-
+from string import Template
+from typing import Final
 
-@mcp.prompt(
-    name="technology_citation_landscape_PFW",
-    description="Map prior art citation landscape for technology areas. At least ONE required (technology_keywords, tech_center, or art_unit). date_start: YYYY-MM-DD for filing date range. Requires PFW MCP.",
-)
-async def technology_citation_landscape_PFW_prompt(
-    technology_keywords: str = "",
-    tech_center: str = "",
-    art_unit: str = "",
-    date_start: str = "2015-01-01",
-) -> str:
-    """Map citation landscape for technology areas to identify prior art patterns and examiner citation preferences.
+from . import mcp
+from ._shared_blocks import BOOTSTRAP_CI_BLOCK, OA_DATE_CLAUSE
 
-    Args:
-        technology_keywords: Technology terms for search (e.g., 'machine learning', 'wireless communication')
-        tech_center: Technology center number (e.g., '2100', '3600')
-        art_unit: Specific art unit number (e.g., '2854')
-        date_start: Start date for analysis (default: 2015-01-01, accounts for filing-to-OA lag)
-    """
+# Bound once; register_prompts() sets mcp before importing this module
+_prompt = mcp.prompt
 
-    if not technology_keywords and not tech_center and not art_unit:
-        return """
+_MISSING_PARAMS_MSG: Final[str] = """
 # TECHNOLOGY CITATION LANDSCAPE MAPPING
 
 ❌ **ERROR: Missing Search Parameters**
@@ -45,82 +31,114 @@ art_unit='2854'
 ```
 """
 
-    return f"""
+# (parameter, citation field) pairs, in the order they appear in the criteria
+_FIELD_MAP: Final[tuple] = (
+    ("technology_keywords", "citedDocumentTitle"),
+    ("tech_center", "techCenter"),
+    ("art_unit", "groupArtUnitNumber"),
+)
+
+# Built once at import; only the search parameters vary per call
+_LANDSCAPE_TEMPLATE: Final[Template] = Template(
+    """
 # TECHNOLOGY CITATION LANDSCAPE MAPPING
 
 **Technology Focus:**
-- **Keywords**: {technology_keywords or "Not specified"}
-- **Tech Center**: {tech_center or "Not specified"}
-- **Art Unit**: {art_unit or "Not specified"}
-- **Date Range**: {date_start} to present
-**Context:** Filing dates from {date_start} → Office actions from 2017-10-01+ (API availability)
+- **Keywords**: ${technology_keywords_display}
+- **Tech Center**: ${tech_center_display}
+- **Art Unit**: ${art_unit_display}
+- **Date Range**: ${date_start} to present
+**Context:** Filing dates from ${date_start} → Office actions from 2017-10-01+ (API availability)
 
 ## Step 1: Discovery Search (Ultra-Minimal Mode)
 
 ```python
-# Build search criteria for technology area
-criteria_parts = []
-if "{technology_keywords}":
-    criteria_parts.append(f'citedDocumentTitle:"{technology_keywords}"')
-if "{tech_center}":
-    criteria_parts.append(f'techCenter:{tech_center}')
-if "{art_unit}":
-    criteria_parts.append(f'groupArtUnitNumber:{art_unit}')
-
-# Add date constraint (CRITICAL: Citations only from 2017-10-01+, but use filing date context)
-criteria_parts.append('officeActionDate:[2017-10-01 TO *]')
-
-criteria = ' AND '.join(criteria_parts)
+# Search criteria for technology area
+# (date constraint is CRITICAL: citations only from 2017-10-01+, but use filing date context)
+criteria = '${criteria}'
+
+import math
+import random
+
+# Size the slice first (rows=1) so the sample can scale with it
+probe = search_citations_minimal(criteria=criteria, fields=['citationCategoryCode'], rows=1)
+num_found = probe['response']['numFound']
+
+# Client-side probability sample: random pages across the whole slice instead
+# of its first 100 hits, which follow index order rather than the population
+SAMPLE_PROBABILITY = 0.1
+SAMPLE_CAP = 100
+PAGE_SIZE = 25
+sample_size = min(num_found, SAMPLE_CAP, max(PAGE_SIZE, math.ceil(num_found * SAMPLE_PROBABILITY)))
+page_count = max(1, math.ceil(num_found / PAGE_SIZE))
+pages = random.sample(range(page_count), min(page_count, math.ceil(sample_size / PAGE_SIZE)))
 
 # Ultra-minimal discovery (99% token reduction)
-landscape_citations = search_citations_minimal(
-    criteria=criteria,
-    fields=['citationCategoryCode', 'groupArtUnitNumber', 'techCenter', 'citedDocumentIdentifier'],
-    rows=100
-)
+landscape_docs = []
+for page in sorted(pages):
+    batch = search_citations_minimal(
+        criteria=criteria,
+        fields=['citationCategoryCode', 'groupArtUnitNumber', 'techCenter', 'citedDocumentIdentifier'],
+        rows=PAGE_SIZE,
+        start=page * PAGE_SIZE
+    )
+    landscape_docs.extend(batch['response']['docs'])
+
+print(f"Sampled {len(landscape_docs)} of {num_found} citations from {len(pages)} random pages")
 ```
 
 ## Step 2: Analyze Citation Patterns
 
 ```python
 from collections import Counter
+from heapq import nlargest
+from itertools import islice
+from operator import itemgetter
 
 # Analyze citation categories
 category_dist = Counter()
-art_unit_dist = Counter()
+art_unit_dist = {}
 
-for citation in landscape_citations['response']['docs']:
+for citation in landscape_docs:
     category_dist[citation.get('citationCategoryCode', 'Unknown')] += 1
-    art_unit_dist[citation.get('groupArtUnitNumber', 'Unknown')] += 1
+    unit = citation.get('groupArtUnitNumber', 'Unknown')
+    art_unit_dist[unit] = art_unit_dist.get(unit, 0) + 1
 
-print("Citation Category Distribution:")
+# 95% Wilson interval per category: the margin the sample size buys
+Z = 1.96
+n = len(landscape_docs)
+print("Citation Category Distribution (sampled, 95% CI):")
 for cat, count in category_dist.items():
-    print(f"  - {{cat}}: {{count}}")
+    p = count / n
+    center = (p + Z * Z / (2 * n)) / (1 + Z * Z / n)
+    half = Z * math.sqrt(p * (1 - p) / n + Z * Z / (4 * n * n)) / (1 + Z * Z / n)
+    print(f"  - {cat}: {count} ({p:.1%}, CI {center - half:.1%}-{center + half:.1%})")
 
 print("\\nArt Unit Distribution:")
-for unit, count in art_unit_dist.most_common(10):
-    print(f"  - Art Unit {{unit}}: {{count}} citations")
+# Partial sort: only the top 10 are ordered, not the long tail
+for unit, count in nlargest(10, art_unit_dist.items(), key=itemgetter(1)):
+    print(f"  - Art Unit {unit}: {count} citations")
 ```
 
 ## Step 3: Cross-Reference with PFW (Patent Applications)
 
 ```python
 # Get top art units for deeper analysis
-top_art_units = [unit for unit, count in art_unit_dist.most_common(3)]
+top_art_units = [unit for unit, count in nlargest(3, art_unit_dist.items(), key=itemgetter(1))]
 
 for art_unit in top_art_units:
     # Search applications in this art unit + technology
-    tech_filter = f' AND inventionTitle:"{technology_keywords}"' if "{technology_keywords}" else ''
+    tech_filter = f' AND inventionTitle:"${technology_keywords}"' if "${technology_keywords}" else ''
 
     pfw_apps = pfw_search_applications_minimal(
-        query=f'groupArtUnitNumber:{{art_unit}}*{{tech_filter}} AND filingDate:[{date_start} TO *]',
+        query=f'groupArtUnitNumber:{art_unit}*{tech_filter} AND filingDate:[${date_start} TO *]',
         fields=['applicationNumberText', 'applicationMetaData.inventionTitle', 'applicationMetaData.groupArtUnitNumber'],
         limit=20
     )
 
-    print(f"\\nArt Unit {{art_unit}} Applications:")
-    for app in pfw_apps['applications'][:5]:
-        print(f"  - {{app['applicationNumberText']}}: {{app['applicationMetaData']['inventionTitle'][:80]}}")
+    print(f"\\nArt Unit {art_unit} Applications:")
+    for app in islice(pfw_apps['applications'], 5):
+        print(f"  - {app['applicationNumberText']}: {app['applicationMetaData']['inventionTitle'][:80]}")
 ```
 
 ## Step 4: Prior Art Reference Analysis
@@ -132,15 +150,21 @@ detailed_citations = search_citations_balanced(
     rows=50
 )
 
+${bootstrap_ci_block}
 # Analyze frequently cited references
-cited_refs = Counter()
-for citation in detailed_citations['response']['docs']:
-    ref_id = citation.get('citedDocumentIdentifier', 'Unknown')
-    cited_refs[ref_id] += 1
-
-print("\\nMost Frequently Cited References:")
-for ref, count in cited_refs.most_common(10):
-    print(f"  - {{ref}}: cited {{count}} times")
+ref_ids = [c.get('citedDocumentIdentifier', 'Unknown') for c in detailed_citations['response']['docs']]
+cited_refs = {}
+for ref_id in ref_ids:
+    cited_refs[ref_id] = cited_refs.get(ref_id, 0) + 1
+
+# Counts come from a sample, so show how much each could move on a resample
+top_refs = nlargest(10, cited_refs.items(), key=itemgetter(1))
+ref_ci = bootstrap_ci(ref_ids, [ref for ref, _ in top_refs])
+
+print("\\nMost Frequently Cited References (95% bootstrap CI):")
+for ref, count in top_refs:
+    lo, hi = ref_ci[ref]
+    print(f"  - {ref}: cited {count} times [{lo}-{hi}]")
 ```
 
 ## Expected Technology Landscape Intelligence
@@ -151,5 +175,59 @@ for ref, count in cited_refs.most_common(10):
 4. **Technology Evolution** - Citation trends over time periods
 5. **Cross-MCP Integration** - Applications and prosecution patterns in this technology
 
-**Token Efficiency:** 4 custom fields × 100 results = ~20KB (vs ~400KB with all fields)
+**Token Efficiency:** 4 custom fields × ≤100 sampled results = ≤20KB (vs ~400KB with all fields), with category shares reported as intervals rather than point counts
 """
+)
+
+
+@_prompt(
+    name="technology_citation_landscape_PFW",
+    description="Map prior art citation landscape for technology areas. At least ONE required (technology_keywords, tech_center, or art_unit). date_start: YYYY-MM-DD for filing date range. Requires PFW MCP.",
+)
+async def technology_citation_landscape_PFW_prompt(
+    technology_keywords: str = "",
+    tech_center: str = "",
+    art_unit: str = "",
+    date_start: str = "2015-01-01",
+) -> str:
+    """Map citation landscape for technology areas to identify prior art patterns and examiner citation preferences.
+
+    Args:
+        technology_keywords: Technology terms for search (e.g., 'machine learning', 'wireless communication')
+        tech_center: Technology center number (e.g., '2100', '3600')
+        art_unit: Specific art unit number (e.g., '2854')
+        date_start: Start date for analysis (default: 2015-01-01, accounts for filing-to-OA lag)
+    """
+
+    if not technology_keywords and not tech_center and not art_unit:
+        return _MISSING_PARAMS_MSG
+
+    technology_keywords_display = technology_keywords or "Not specified"
+    tech_center_display = tech_center or "Not specified"
+    art_unit_display = art_unit or "Not specified"
+
+    # Resolve the criteria here so the emitted example carries the finished string
+    values = {
+        "technology_keywords": technology_keywords,
+        "tech_center": tech_center,
+        "art_unit": art_unit,
+    }
+    fragments = [
+        f'{field}:"{values[arg]}"' if field == "citedDocumentTitle" else f"{field}:{values[arg]}"
+        for arg, field in _FIELD_MAP
+        if values[arg]
+    ]
+    fragments.append(OA_DATE_CLAUSE)
+    criteria = " AND ".join(fragments)
+
+    return _LANDSCAPE_TEMPLATE.substitute(
+        criteria=criteria,
+        bootstrap_ci_block=BOOTSTRAP_CI_BLOCK,
+        technology_keywords=technology_keywords,
+        tech_center=tech_center,
+        art_unit=art_unit,
+        date_start=date_start,
+        technology_keywords_display=technology_keywords_display,
+        tech_center_display=tech_center_display,
+        art_unit_display=art_unit_display,
+    )
@@ -2,13 +2,63 @@
 Citation service for USPTO Enriched Citation MCP.
 """
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Union
 import structlog
 from ..api.enriched_client import EnrichedCitationClient
 from ..config.field_manager import FieldManager
+from ..shared.enums import ContextLevel
+from ..shared.error_utils import get_safe_error_message
 
 logger = structlog.get_logger(__name__)
 
+_LINK_SAMPLE_SIZE = 5
+
+# Explicit boolean operators; a bare substring test would also match words
+# such as "ORACLE" or "BRAND"
+_BOOLEAN_OPERATOR_RE = re.compile(r"\b(?:AND|OR)\b")
+
+# Static response content, built once rather than per call
+_QUERY_TIPS = (
+    "Use field-specific searches (field:value)",
+    "Combine with boolean operators (AND, OR, NOT)",
+    "Use quotes for phrase searches",
+    "Use brackets for date ranges [start TO end]",
+)
+# A dict is mutable, so each response gets its own copy
+_PTAB_TOOLS = {
+    "trials": "search_trials_minimal/balanced/complete",
+    "documents": "ptab_get_documents",
+    "example": "search_trials_minimal(patent_number='10701173')",
+}
+
+# (search result field, cross-MCP link name, field name in the target MCP)
+_CROSS_MCP_FIELDS = (
+    ("patentApplicationNumber", "patent_file_wrapper", "applicationNumberText"),
+    ("publicationNumber", "ptab", "patentNumber"),
+    ("groupArtUnitNumber", "art_units", "groupArtUnitNumber"),
+    ("techCenter", "tech_centers", "techCenter"),
+)
+
+
+class _SampleSet:
+    """Distinct-value counter that keeps the first few values it sees."""
+
+    __slots__ = ("_seen", "sample", "count")
+
+    def __init__(self):
+        self._seen = set()
+        self.sample = []
+        self.count = 0
+
+    def add(self, value: str) -> None:
+        if value in self._seen:
+            return
+        self._seen.add(value)
+        self.count += 1
+        if len(self.sample) < _LINK_SAMPLE_SIZE:
+            self.sample.append(value)
+
 
 class CitationService:
     """Service for handling citation operations."""
@@ -17,23 +67,33 @@ class CitationService:
         self.client = client
         self.field_manager = field_manager
         self.logger = logger
+        # Field sets are fixed for the life of the service; resolve them once.
+        # Callers get a copy (see _fields) so the shared lists cannot be mutated.
+        self._field_sets: Dict[str, List[str]] = {
+            name: list(field_manager.get_field_set(name))
+            for name in ("citations_minimal", "citations_balanced")
+        }
+
+    def _fields(self, name: str) -> List[str]:
+        """Return a copy of a pre-resolved field set."""
+        return list(self._field_sets[name])
 
     async def search_minimal(self, criteria: str, rows: int = 100) -> Dict[str, Any]:
         """Search citations with minimal field set."""
-        fields = self.field_manager.get_field_set("citations_minimal")
+        fields = self._fields("citations_minimal")
         return await self.client.search_citations(
             criteria=criteria, fields=fields, rows=rows
         )
 
     async def search_balanced(self, criteria: str, rows: int = 20) -> Dict[str, Any]:
         """Search citations with balanced field set."""
-        fields = self.field_manager.get_field_set("citations_balanced")
+        fields = self._fields("citations_balanced")
         return await self.client.search_citations(
             criteria=criteria, fields=fields, rows=rows
         )
 
     async def get_details(
-        self, citation_id: str, include_context: bool = False
+        self, citation_id: str, include_context: Union[bool, ContextLevel] = False
     ) -> Dict[str, Any]:
         """Get detailed citation information."""
         return await self.client.get_citation_details(
@@ -58,13 +118,22 @@ class CitationService:
 
             # Add optimization suggestions
             suggestions = []
-            if "*" in query and query.count("*") > 3:
+            # More than three wildcards: each find() resumes after the last hit
+            # and the scan stops at the fourth, without counting the rest
+            fourth_wildcard = -1
+            for _ in range(4):
+                fourth_wildcard = query.find("*", fourth_wildcard + 1)
+                if fourth_wildcard == -1:
+                    break
+            else:
                 suggestions.append("Consider reducing wildcards for better performance")
 
-            if "AND" not in query and "OR" not in query and " " in query:
+            if " " in query and not _BOOLEAN_OPERATOR_RE.search(query):
                 suggestions.append("Use explicit AND/OR operators for clarity")
 
-            fields = self.field_manager.get_field_set(field_set)
+            fields = self._field_sets.get(field_set)
+            if fields is None:
+                fields = self.field_manager.get_field_set(field_set)
 
             return {
                 "status": "success",
@@ -73,16 +142,9 @@ class CitationService:
                 "field_set": field_set,
                 "available_fields": len(fields),
                 "optimization_suggestions": suggestions,
-                "query_tips": [
-                    "Use field-specific searches (field:value)",
-                    "Combine with boolean operators (AND, OR, NOT)",
-                    "Use quotes for phrase searches",
-                    "Use brackets for date ranges [start TO end]",
-                ],
+                "query_tips": _QUERY_TIPS,
             }
         except Exception as e:
-            from ..shared.error_utils import get_safe_error_message
-
             safe_message = get_safe_error_message(e, "Query validation failed")
             return {
                 "status": "error",
@@ -95,7 +157,7 @@ class CitationService:
         """Get database statistics and aggregations."""
         try:
             # Perform a minimal search to get count information
-            fields = self.field_manager.get_field_set("citations_minimal")
+            fields = self._fields("citations_minimal")
             result = await self.client.search_citations(
                 criteria=criteria or "*:*",
                 fields=fields,
@@ -113,8 +175,6 @@ class CitationService:
                 "guidance": "Use search functions with specific criteria to analyze subsets of data",
             }
         except Exception as e:
-            from ..shared.error_utils import get_safe_error_message
-
             safe_message = get_safe_error_message(e, "Statistics retrieval failed")
             return {
                 "status": "error",
@@ -131,58 +191,29 @@ class CitationService:
                 return {"available_links": {}, "integration_ready": False}
 
             # Extract unique identifiers for cross-MCP integration
-            application_numbers = set()
-            patent_numbers = set()
-            art_units = set()
-            tech_centers = set()
-
+            values = {source: _SampleSet() for source, _, _ in _CROSS_MCP_FIELDS}
             for doc in docs:
-                if app_num := doc.get("patentApplicationNumber"):
-                    application_numbers.add(str(app_num))
-                if pub_num := doc.get("publicationNumber"):
-                    patent_numbers.add(str(pub_num))
-                if art_unit := doc.get("groupArtUnitNumber"):
-                    art_units.add(str(art_unit))
-                if tc := doc.get("techCenter"):
-                    tech_centers.add(str(tc))
+                for source, _, _ in _CROSS_MCP_FIELDS:
+                    if value := doc.get(source):
+                        values[source].add(str(value))
 
             return {
                 "available_links": {
-                    "patent_file_wrapper": {
-                        "field": "applicationNumberText",
-                        "count": len(application_numbers),
-                        "sample": (
-                            list(application_numbers)[:5] if application_numbers else []
-                        ),
-                    },
-                    "ptab": {
-                        "field": "patentNumber",
-                        "count": len(patent_numbers),
-                        "sample": list(patent_numbers)[:5] if patent_numbers else [],
-                    },
-                    "art_units": {
-                        "field": "groupArtUnitNumber",
-                        "count": len(art_units),
-                        "sample": list(art_units)[:5] if art_units else [],
-                    },
-                    "tech_centers": {
-                        "field": "techCenter",
-                        "count": len(tech_centers),
-                        "sample": list(tech_centers)[:5] if tech_centers else [],
-                    },
+                    link: {
+                        "field": field,
+                        "count": values[source].count,
+                        "sample": values[source].sample,
+                    }
+                    for source, link, field in _CROSS_MCP_FIELDS
                 },
-                "integration_ready": len(application_numbers) > 0
-                or len(patent_numbers) > 0,
+                "integration_ready": bool(
+                    values["patentApplicationNumber"].count
+                    or values["publicationNumber"].count
+                ),
                 "guidance": "Use these identifiers to query PFW (pfw_search_applications_*) or PTAB (search_trials_*) MCPs",
-                "ptab_tools": {
-                    "trials": "search_trials_minimal/balanced/complete",
-                    "documents": "ptab_get_documents",
-                    "example": "search_trials_minimal(patent_number='10701173')"
-                }
+                "ptab_tools": dict(_PTAB_TOOLS),
             }
         except Exception as e:
-            from ..shared.error_utils import get_safe_error_message
-
             safe_message = get_safe_error_message(e, "Cross-MCP link extraction failed")
             return {
                 "available_links": {},
@@ -9,7 +9,7 @@ import asyncio
 import logging
 import time
 from enum import Enum
-from typing import Callable, Optional, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 from functools import wraps
 
 import httpx
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Minimum seconds between logged OPEN transitions for one breaker
+WARNING_INTERVAL = 5.0
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -70,6 +73,11 @@ class CircuitBreaker:
         self._failure_count = 0
         self._success_count = 0
         self._last_failure_time: Optional[float] = None
+        self._half_open_in_flight = 0
+        # Rate limiting for OPEN-transition warnings
+        self._last_warning_time = float("-inf")
+        self._suppressed_warnings = 0
+        # Guards state transitions only; the wrapped call runs unlocked
         self._lock = asyncio.Lock()
 
     @property
@@ -87,7 +95,57 @@ class CircuitBreaker:
         if self._last_failure_time is None:
             return False
 
-        return time.time() - self._last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self._last_failure_time >= self.recovery_timeout
+
+    def _release_probe(self) -> None:
+        """Give back a HALF_OPEN trial slot taken at admission."""
+        # The counter is reset when a new HALF_OPEN period starts, so a trial
+        # that outlived its period must not drive it negative
+        if self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def _record_failure(self, error: Exception) -> None:
+        """Count a failed call and open the circuit if warranted (lock held)."""
+        self._failure_count += 1
+        self._last_failure_time = time.monotonic()
+
+        # Unexpected exceptions count the same; only the log wording differs
+        if isinstance(error, self.expected_exception):
+            kind = "failure"
+        else:
+            kind = "unexpected failure"
+
+        if self._state == CircuitState.HALF_OPEN:
+            self._warn_opened(f"{kind} in half-open", error)
+            self._state = CircuitState.OPEN
+        elif (
+            self._state == CircuitState.CLOSED
+            and self._failure_count >= self.failure_threshold
+        ):
+            self._warn_opened("threshold reached", error)
+            self._state = CircuitState.OPEN
+
+    def _warn_opened(self, reason: str, error: Exception) -> None:
+        """
+        Log a transition to OPEN, at most once per WARNING_INTERVAL seconds.
+
+        A short recovery timeout can flap the circuit between HALF_OPEN and
+        OPEN; suppressed transitions are counted and reported with the next
+        warning that does get logged.
+        """
+        now = time.monotonic()
+        if now - self._last_warning_time < WARNING_INTERVAL:
+            self._suppressed_warnings += 1
+            return
+
+        logger.warning(
+            "Circuit breaker transitioning to OPEN (%s, %d similar suppressed): %s",
+            reason,
+            self._suppressed_warnings,
+            error,
+        )
+        self._last_warning_time = now
+        self._suppressed_warnings = 0
 
     async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """
@@ -102,94 +160,114 @@ class CircuitBreaker:
             Function result
 
         Raises:
-            CircuitBreakerError: If circuit is open
+            CircuitBreakerError: If circuit is open, or half-open with all
+                trial slots in use
             Exception: Original exception from function call
         """
-        async with self._lock:
-            # Check if circuit is open
-            if self._state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    logger.info("Circuit breaker transitioning to HALF_OPEN")
-                    self._state = CircuitState.HALF_OPEN
-                    self._success_count = 0
-                else:
-                    raise CircuitBreakerError("Circuit breaker is OPEN")
-
-            # Check if we're in half-open and have exceeded success threshold
-            if (
-                self._state == CircuitState.HALF_OPEN
-                and self._success_count >= self.success_threshold
-            ):
-                logger.info("Circuit breaker transitioning to CLOSED")
-                self._state = CircuitState.CLOSED
-                self._failure_count = 0
-
-            try:
-                # Execute function (handle both sync and async)
-                if asyncio.iscoroutinefunction(func):
-                    result = await func(*args, **kwargs)
-                else:
-                    result = func(*args, **kwargs)
-
-                # Success - update state
-                if self._state == CircuitState.HALF_OPEN:
-                    self._success_count += 1
-                    logger.debug(
-                        f"Circuit breaker half-open success count: {self._success_count}"
-                    )
-                elif self._state == CircuitState.CLOSED:
-                    self._failure_count = 0  # Reset failure count on success
-
-                return result
+        return await self._call(
+            func, asyncio.iscoroutinefunction(func), *args, **kwargs
+        )
 
-            except self.expected_exception as e:
-                # Failure - update state
-                self._failure_count += 1
-                self._last_failure_time = time.time()
-
-                if self._state == CircuitState.HALF_OPEN:
-                    logger.warning(
-                        f"Circuit breaker reverting to OPEN (failure in half-open): {e}"
-                    )
-                    self._state = CircuitState.OPEN
-                elif (
-                    self._state == CircuitState.CLOSED
-                    and self._failure_count >= self.failure_threshold
-                ):
-                    logger.warning(
-                        f"Circuit breaker transitioning to OPEN (threshold reached): {e}"
-                    )
-                    self._state = CircuitState.OPEN
+    async def _call(
+        self, func: Callable[..., Any], is_coroutine: bool, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run func under the breaker; is_coroutine says whether to await it.
 
-                raise  # Re-raise original exception
+        func may return an awaitable or a plain value depending on
+        is_coroutine, which a type checker cannot narrow from a bool, so this
+        is typed with Any; call() and __call__ restore the caller's type.
+        """
+        # Fast path: a healthy closed circuit has nothing to check or reset, so
+        # the lock is only taken if the call fails. The two reads cannot be
+        # interleaved by another task because there is no await between them.
+        healthy = self._state is CircuitState.CLOSED and self._failure_count == 0
 
-            except Exception as e:
-                # Unexpected exception - also count as failure
-                self._failure_count += 1
-                self._last_failure_time = time.time()
+        if healthy:
+            probing = False
+        else:
+            # Decide under the lock whether this call may proceed
+            async with self._lock:
+                if self._state == CircuitState.OPEN:
+                    if self._should_attempt_reset():
+                        logger.info("Circuit breaker transitioning to HALF_OPEN")
+                        self._state = CircuitState.HALF_OPEN
+                        self._success_count = 0
+                        self._half_open_in_flight = 0
+                    else:
+                        raise CircuitBreakerError("Circuit breaker is OPEN")
+
+                probing = self._state == CircuitState.HALF_OPEN
+                if probing:
+                    # Admit only as many trial calls as it takes to close the circuit
+                    if self._half_open_in_flight >= self.success_threshold:
+                        raise CircuitBreakerError("Circuit breaker is HALF_OPEN")
+                    self._half_open_in_flight += 1
+
+        # Run the call outside the lock so concurrent requests overlap
+        try:
+            # Execute function (handle both sync and async)
+            if is_coroutine:
+                result = await func(*args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+
+        except Exception as e:
+            async with self._lock:
+                if probing:
+                    self._release_probe()
+                self._record_failure(e)
+
+            raise  # Re-raise original exception
+        except BaseException:
+            # Cancelled (or interrupted) trial call: free its slot without
+            # counting a failure. No await, so no other task can interleave.
+            if probing:
+                self._release_probe()
+            raise
+
+        # Success on a circuit that is still healthy changes nothing
+        if (
+            not probing
+            and self._state is CircuitState.CLOSED
+            and self._failure_count == 0
+        ):
+            return result
+
+        # Success - update state
+        async with self._lock:
+            if probing:
+                self._release_probe()
 
-                if self._state == CircuitState.HALF_OPEN:
-                    logger.warning(
-                        f"Circuit breaker reverting to OPEN (unexpected failure): {e}"
-                    )
-                    self._state = CircuitState.OPEN
-                elif (
-                    self._state == CircuitState.CLOSED
-                    and self._failure_count >= self.failure_threshold
-                ):
-                    logger.warning(
-                        f"Circuit breaker transitioning to OPEN (threshold reached): {e}"
+            if self._state == CircuitState.HALF_OPEN:
+                self._success_count += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Circuit breaker half-open success count: %d",
+                        self._success_count,
                     )
-                    self._state = CircuitState.OPEN
+                if self._success_count >= self.success_threshold:
+                    logger.info("Circuit breaker transitioning to CLOSED")
+                    self._state = CircuitState.CLOSED
+                    self._failure_count = 0
+            elif self._state == CircuitState.CLOSED:
+                self._failure_count = 0  # Reset failure count on success
 
-                raise  # Re-raise original exception
+        return result
 
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
         """Decorator for use with @circuit_breaker."""
 
+        # Whether func is a coroutine function is fixed, so decide it once here
+        # rather than on every call
+        is_coroutine = asyncio.iscoroutinefunction(func)
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            return await self.call(func, *args, **kwargs)
+            return await self._call(func, True, *args, **kwargs)
+
+        if is_coroutine:
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -200,13 +278,9 @@ class CircuitBreaker:
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
 
-            return loop.run_until_complete(self.call(func, *args, **kwargs))
+            return loop.run_until_complete(self._call(func, False, *args, **kwargs))
 
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
 
 def circuit_breaker(
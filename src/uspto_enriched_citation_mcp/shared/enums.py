@@ -25,7 +25,7 @@ class ContextLevel(Enum):
         Returns:
             True for FULL/BALANCED, False for MINIMAL
         """
-        return self in (ContextLevel.FULL, ContextLevel.BALANCED)
+        return self is not ContextLevel.MINIMAL
 
     @classmethod
     def from_bool(cls, value: bool) -> "ContextLevel":
@@ -38,7 +38,7 @@ class ContextLevel(Enum):
         Returns:
             Corresponding ContextLevel
         """
-        return cls.FULL if value else cls.MINIMAL
+        return _CONTEXT_FROM_BOOL[bool(value)]
 
 
 class BackupPolicy(Enum):
@@ -59,7 +59,7 @@ class BackupPolicy(Enum):
         Returns:
             True for CREATE_BACKUP/AUTO, False for NO_BACKUP
         """
-        return self in (BackupPolicy.CREATE_BACKUP, BackupPolicy.AUTO)
+        return self is not BackupPolicy.NO_BACKUP
 
     @classmethod
     def from_bool(cls, value: bool) -> "BackupPolicy":
@@ -72,7 +72,12 @@ class BackupPolicy(Enum):
         Returns:
             Corresponding BackupPolicy
         """
-        return cls.CREATE_BACKUP if value else cls.NO_BACKUP
+        return _BACKUP_FROM_BOOL[bool(value)]
+
+
+# from_bool lookups, indexed by bool(value)
+_CONTEXT_FROM_BOOL = (ContextLevel.MINIMAL, ContextLevel.FULL)
+_BACKUP_FROM_BOOL = (BackupPolicy.NO_BACKUP, BackupPolicy.CREATE_BACKUP)
 
 
 class SearchMode(Enum):
@@ -9,19 +9,68 @@ import re
 import logging
 from typing import Optional, Dict
 
+from ..config.constants import MAX_SANITIZE_INPUT_LENGTH
+from .exceptions import (
+    AuthenticationError,
+    AuthorizationError,
+    NotFoundError,
+    RateLimitError,
+    ValidationError,
+    APIConnectionError,
+    APIUnavailableError,
+    APITimeoutError,
+    APIResponseError,
+)
+
 logger = logging.getLogger(__name__)
 
-# Sensitive patterns to remove from error messages
+# Sensitive patterns to remove from error messages. Repeated runs use
+# possessive quantifiers (Python 3.11+) so a failed match never backtracks
+# into them; with the input length cap this keeps redaction linear.
 SENSITIVE_PATTERNS = [
-    (r"[A-Za-z]:\\[^:\s]+", "[PATH_REDACTED]"),  # Windows paths
-    (r"/[^\s:]+/[^\s:]+", "[PATH_REDACTED]"),  # Unix paths
-    (r"[a-z0-9]{28,40}", "[KEY_REDACTED]"),  # API keys (28-40 chars)
+    (r"[A-Za-z]:\\[^:\s]++", "[PATH_REDACTED]"),  # Windows paths
+    (r"/[^\s:/]++/[^\s:]++", "[PATH_REDACTED]"),  # Unix paths
+    (
+        r"(?<![a-z0-9])(?=[a-z0-9]*[a-z])[a-z0-9]{28,}+(?![a-z0-9])",
+        "[KEY_REDACTED]",
+    ),  # API keys and tokens (28+ alphanumeric chars with at least one letter, not part of a longer run)
     (r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "[IP_REDACTED]"),  # IP addresses
-    (r"https?://[^\s]+", "[URL_REDACTED]"),  # URLs
-    (r'password["\']?\s*[:=]\s*["\']?[^\s"\']+', "password=[REDACTED]"),  # Passwords
+    (r"\bhttps?://\S++", "[URL_REDACTED]"),  # URLs
+    (r'password["\']?\s*+[:=]\s*+["\']?[^\s"\']++', "password=[REDACTED]"),  # Passwords
 ]
 
-# Exception type to user-friendly message mapping
+# All patterns fused into one alternation (compiled once at import) so a
+# message is scanned a single time; the named group that matched picks the
+# replacement. Earlier patterns win where several could match at one position.
+_SENSITIVE_RE = re.compile(
+    "|".join(
+        f"(?P<p{index}>{pattern})"
+        for index, (pattern, _) in enumerate(SENSITIVE_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+# The (possibly partial) non-whitespace run at the end of a truncated message
+_TRAILING_TOKEN_RE = re.compile(r"\S++\Z")
+_REPLACEMENTS: Dict[str, str] = {
+    f"p{index}": replacement
+    for index, (_, replacement) in enumerate(SENSITIVE_PATTERNS)
+}
+
+
+def _redact(match: "re.Match[str]") -> str:
+    """Return the replacement for whichever sensitive pattern matched."""
+    name = match.lastgroup
+    if name is None:
+        return match.group(0)
+    return _REPLACEMENTS[name]
+
+
+# Words that mark a message as internal detail rather than user-facing text;
+# one case-insensitive scan instead of lowercasing and testing each word
+_TECHNICAL_DETAIL_RE = re.compile(r"traceback|stack|module", re.IGNORECASE)
+
+# Exception type to user-friendly message mapping. Keyed by class name rather
+# than class so same-named errors from httpx, pydantic and json match too.
 EXCEPTION_MESSAGES: Dict[str, str] = {
     # Network/Connection errors
     "ConnectionError": "Unable to connect to USPTO API. Please check your network connection.",
@@ -65,18 +114,20 @@ def sanitize_error_message(message: str) -> str:
     - URLs
     - Passwords
 
+    Messages longer than MAX_SANITIZE_INPUT_LENGTH are truncated first, so
+    the cost of a call is bounded regardless of the exception text. The
+    token cut by the truncation is dropped: a key whose tail was cut off
+    would otherwise no longer match its pattern and leak its prefix.
+
     Args:
         message: Raw error message
 
     Returns:
         Sanitized error message safe for user display
     """
-    sanitized = message
-
-    for pattern, replacement in SENSITIVE_PATTERNS:
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-
-    return sanitized
+    if len(message) > MAX_SANITIZE_INPUT_LENGTH:
+        message = _TRAILING_TOKEN_RE.sub("", message[:MAX_SANITIZE_INPUT_LENGTH])
+    return _SENSITIVE_RE.sub(_redact, message)
 
 
 def get_safe_error_message(
@@ -96,30 +147,45 @@ def get_safe_error_message(
         Safe error message suitable for user display
     """
     exception_type = type(exception).__name__
+    known_message = EXCEPTION_MESSAGES.get(exception_type)
 
-    # Log full exception details internally (for debugging)
-    logger.error(
-        f"Exception occurred: {exception_type}: {str(exception)}", exc_info=True
-    )
+    # Log full exception details internally (for debugging). Lazy %-style
+    # arguments defer str(exception) to the handler, and are skipped entirely
+    # when ERROR records are disabled.
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Exception occurred: %s: %s", exception_type, exception, exc_info=True
+        )
 
-    # Check for known exception types
-    if exception_type in EXCEPTION_MESSAGES:
-        return EXCEPTION_MESSAGES[exception_type]
+    # Known exception types map to a fixed message; no need to stringify
+    if known_message is not None:
+        return known_message
 
     # For unknown exceptions, sanitize the message
     exception_message = str(exception)
     if exception_message:
         sanitized = sanitize_error_message(exception_message)
         # Only return sanitized message if it's not too technical
-        if len(sanitized) < 200 and not any(
-            word in sanitized.lower() for word in ["traceback", "stack", "module"]
-        ):
+        if len(sanitized) < 200 and not _TECHNICAL_DETAIL_RE.search(sanitized):
             return sanitized
 
     # Fall back to generic message
     return default_message
 
 
+# Status codes with a dedicated exception, and the message used when the
+# response carries none of its own
+_STATUS_MAP = {
+    401: (AuthenticationError, "Invalid API key"),
+    403: (AuthorizationError, "Access forbidden"),
+    404: (NotFoundError, "Resource not found"),
+    429: (RateLimitError, "Rate limit exceeded"),
+    502: (APIConnectionError, "Failed to connect to upstream service"),
+    503: (APIUnavailableError, "Service temporarily unavailable"),
+    504: (APITimeoutError, "Gateway timeout"),
+}
+
+
 def raise_http_exception(response, error_message: Optional[str] = None) -> None:
     """
     Raise appropriate exception for HTTP status code.
@@ -134,18 +200,6 @@ def raise_http_exception(response, error_message: Optional[str] = None) -> None:
     Raises:
         Appropriate USPTOCitationError subclass based on status code
     """
-    from .exceptions import (
-        AuthenticationError,
-        AuthorizationError,
-        NotFoundError,
-        RateLimitError,
-        ValidationError,
-        APIConnectionError,
-        APIUnavailableError,
-        APITimeoutError,
-        APIResponseError,
-    )
-
     # Return early if success status
     if response.status_code < 400:
         return
@@ -160,20 +214,9 @@ def raise_http_exception(response, error_message: Optional[str] = None) -> None:
         except Exception:
             error_message = response.text or f"HTTP {status_code}"
 
-    # Map status codes to exceptions with default messages
-    status_map = {
-        401: (AuthenticationError, "Invalid API key"),
-        403: (AuthorizationError, "Access forbidden"),
-        404: (NotFoundError, "Resource not found"),
-        429: (RateLimitError, "Rate limit exceeded"),
-        502: (APIConnectionError, "Failed to connect to upstream service"),
-        503: (APIUnavailableError, "Service temporarily unavailable"),
-        504: (APITimeoutError, "Gateway timeout"),
-    }
-
     # Handle specific status codes
-    if status_code in status_map:
-        exc_class, default_msg = status_map[status_code]
+    if status_code in _STATUS_MAP:
+        exc_class, default_msg = _STATUS_MAP[status_code]
 
         # Special handling for rate limit retry-after header
         if status_code == 429:
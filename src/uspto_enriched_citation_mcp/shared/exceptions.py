@@ -269,6 +269,20 @@ def exception_to_response(exc: Exception) -> dict:
     }
 
 
+# HTTP status code to exception class, for get_exception_class()
+_STATUS_EXCEPTIONS: Dict[int, type] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    429: RateLimitError,
+    500: APIError,
+    502: APIConnectionError,
+    503: APIUnavailableError,
+    504: APITimeoutError,
+}
+
+
 def get_exception_class(status_code: int) -> type:
     """
     Get appropriate exception class for HTTP status code.
@@ -279,16 +293,4 @@ def get_exception_class(status_code: int) -> type:
     Returns:
         Exception class to use
     """
-    status_map = {
-        400: ValidationError,
-        401: AuthenticationError,
-        403: AuthorizationError,
-        404: NotFoundError,
-        429: RateLimitError,
-        500: APIError,
-        502: APIConnectionError,
-        503: APIUnavailableError,
-        504: APITimeoutError,
-    }
-
-    return status_map.get(status_code, APIError)
+    return _STATUS_EXCEPTIONS.get(status_code, APIError)
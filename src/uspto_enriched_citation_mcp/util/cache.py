@@ -3,43 +3,67 @@
 Provides performance optimization through intelligent caching:
 - TTL Cache: Time-based expiration for relatively static data (fields)
 - LRU Cache: Size-based eviction for dynamic data (search results)
+- Disk Cache: Optional SQLite-backed TTL cache that survives restarts
 - Thread-safe operations
 - Configurable sizes and TTLs
 """
 
 import time
 import hashlib
+import heapq
 import json
+import sqlite3
 import threading
-from typing import Any, Optional, Dict
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional, Dict, List, Tuple
 from collections import OrderedDict
 from dataclasses import dataclass
 import logging
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Distinguishes a missing LRU key from a cached None
+_MISSING = object()
+
+# LRUCache negative-lookup filter: 64K bits, two bit positions per key taken
+# from the low and high halves of the key's hash
+_BLOOM_BITS = 1 << 16
+_BLOOM_MASK = _BLOOM_BITS - 1
+_BLOOM_REBUILD_FACTOR = 8
+
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """Single cache entry with metadata."""
+    """
+    Single cache entry with metadata.
+
+    Timestamps come from time.monotonic(); they measure ages and expiry, not
+    wall-clock time. Callers pass in the ``now`` they read once per operation.
+    """
 
-    key: str
     value: Any
     created_at: float
     expires_at: Optional[float]
     hit_count: int = 0
     last_accessed: float = 0.0
 
-    def is_expired(self) -> bool:
-        """Check if entry has expired."""
+    def is_expired(self, now: float) -> bool:
+        """Check if entry has expired as of ``now``."""
         if self.expires_at is None:
             return False
-        return time.time() > self.expires_at
+        return now > self.expires_at
 
-    def access(self) -> None:
-        """Record an access to this entry."""
+    def access(self, now: float) -> None:
+        """Record an access to this entry at ``now``."""
         self.hit_count += 1
-        self.last_accessed = time.time()
+        self.last_accessed = now
 
 
 class CacheStatsMixin:
@@ -47,33 +71,37 @@ class CacheStatsMixin:
     Mixin providing common cache statistics functionality.
 
     Provides shared get_stats() method for cache implementations.
-    Requires subclass to have: _lock, _hits, _misses, _cache, max_size
+    Requires subclass to have: _hits, _misses, _cache, max_size
     """
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
 
+        The figures are advisory, so they are read without the cache lock;
+        each read is atomic, and polling never stalls cache operations.
+
         Returns:
             Dict with hits, misses, size, hit_rate
         """
-        with self._lock:
-            total = self._hits + self._misses
-            hit_rate = (self._hits / total * 100) if total > 0 else 0.0
-
-            return {
-                "hits": self._hits,
-                "misses": self._misses,
-                "total_requests": total,
-                "hit_rate_percent": round(hit_rate, 2),
-                "current_size": len(self._cache),
-                "max_size": self.max_size,
-                "fill_percent": (
-                    round(len(self._cache) / self.max_size * 100, 2)
-                    if self.max_size > 0
-                    else 0.0
-                ),
-            }
+        hits = self._hits
+        misses = self._misses
+        size = len(self._cache)
+
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0.0
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "total_requests": total,
+            "hit_rate_percent": round(hit_rate, 2),
+            "current_size": size,
+            "max_size": self.max_size,
+            "fill_percent": (
+                round(size / self.max_size * 100, 2) if self.max_size > 0 else 0.0
+            ),
+        }
 
 
 class TTLCache(CacheStatsMixin):
@@ -94,11 +122,55 @@ class TTLCache(CacheStatsMixin):
         """
         self.default_ttl = default_ttl_seconds
         self.max_size = max_size
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = threading.RLock()
+        # Kept in creation order so the oldest entry is always first
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (expires_at, key) min-heap; may hold outdated pairs for keys that
+        # were re-set or removed, which are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
 
+    def _get_raw(
+        self, key: str, allow_stale: bool, now: float
+    ) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Look up an entry and record the hit or miss (lock held).
+
+        Expired entries are removed unless allow_stale is set.
+
+        Returns:
+            (entry, is_stale); entry is None on a miss
+        """
+        entry = self._cache.get(key)
+
+        if entry is None:
+            self._misses += 1
+            logger.debug("Cache miss: %s", key)
+            return None, False
+
+        is_stale = entry.is_expired(now)
+        if is_stale and not allow_stale:
+            # Remove expired entry
+            del self._cache[key]
+            self._misses += 1
+            logger.debug("Cache expired: %s", key)
+            return None, False
+
+        # Record access
+        entry.access(now)
+        self._hits += 1
+        if is_stale:
+            # Stale data is returned for graceful degradation
+            logger.warning(
+                "Cache stale (degraded mode): %s (age: %.0fs)",
+                key,
+                now - entry.created_at,
+            )
+        else:
+            logger.debug("Cache hit: %s (hits: %d)", key, entry.hit_count)
+        return entry, is_stale
+
     def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
         """
         Get value from cache.
@@ -111,33 +183,10 @@ class TTLCache(CacheStatsMixin):
             Cached value if exists and not expired, None otherwise
             If allow_stale=True, returns even expired entries
         """
+        now = time.monotonic()
         with self._lock:
-            entry = self._cache.get(key)
-
-            if entry is None:
-                self._misses += 1
-                logger.debug(f"Cache miss: {key}")
-                return None
-
-            if entry.is_expired():
-                if allow_stale:
-                    # Return stale data for graceful degradation
-                    entry.access()
-                    self._hits += 1
-                    logger.warning(f"Cache stale (degraded mode): {key} (age: {time.time() - entry.created_at:.0f}s)")
-                    return entry.value
-                else:
-                    # Remove expired entry
-                    del self._cache[key]
-                    self._misses += 1
-                    logger.debug(f"Cache expired: {key}")
-                    return None
-
-            # Record access and return value
-            entry.access()
-            self._hits += 1
-            logger.debug(f"Cache hit: {key} (hits: {entry.hit_count})")
-            return entry.value
+            entry, _ = self._get_raw(key, allow_stale, now)
+            return entry.value if entry is not None else None
 
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
         """
@@ -148,34 +197,69 @@ class TTLCache(CacheStatsMixin):
             value: Value to cache
             ttl_seconds: Time-to-live in seconds (uses default if None)
         """
+        now = time.monotonic()
         with self._lock:
-            # Enforce max size by removing oldest entry
+            # Enforce max size, dropping expired entries before live ones
             if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_oldest()
+                self._evict_expired(now)
+                if len(self._cache) >= self.max_size:
+                    self._evict_oldest()
 
             ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
-            now = time.time()
             expires_at = now + ttl if ttl > 0 else None
-
             entry = CacheEntry(
-                key=key,
                 value=value,
                 created_at=now,
                 expires_at=expires_at,
                 last_accessed=now,
             )
 
+            # Re-insert so a refreshed key moves to the end (newest)
+            self._cache.pop(key, None)
             self._cache[key] = entry
-            logger.debug(f"Cache set: {key} (TTL: {ttl}s, size: {len(self._cache)})")
+
+            # Track expiry only after the entry is stored, so a compaction
+            # rebuilds the heap from the new entry rather than the replaced one
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+                if len(self._expiry_heap) > 2 * self.max_size:
+                    self._compact_expiry_heap()
+            logger.debug(
+                "Cache set: %s (TTL: %ss, size: %d)", key, ttl, len(self._cache)
+            )
+
+    def _evict_expired(self, now: float) -> None:
+        """
+        Evict every entry that has expired as of ``now`` (lock held).
+
+        Only runs when a slot is needed: expired entries otherwise stay so
+        get(allow_stale=True) can serve them during an outage.
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip pairs left behind by a re-set or invalidated key
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+                logger.debug("Cache evicted (expired): %s", key)
+
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries only (lock held)."""
+        self._expiry_heap = [
+            (entry.expires_at, key)
+            for key, entry in self._cache.items()
+            if entry.expires_at is not None
+        ]
+        heapq.heapify(self._expiry_heap)
 
     def _evict_oldest(self) -> None:
-        """Evict the oldest entry to make room."""
+        """Evict the oldest entry to make room (lock held)."""
         if not self._cache:
             return
 
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].created_at)
-        del self._cache[oldest_key]
-        logger.debug(f"Cache evicted (oldest): {oldest_key}")
+        oldest_key, _ = self._cache.popitem(last=False)
+        logger.debug("Cache evicted (oldest): %s", oldest_key)
 
     def invalidate(self, key: str) -> bool:
         """
@@ -190,7 +274,7 @@ class TTLCache(CacheStatsMixin):
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
-                logger.debug(f"Cache invalidated: {key}")
+                logger.debug("Cache invalidated: %s", key)
                 return True
             return False
 
@@ -199,6 +283,7 @@ class TTLCache(CacheStatsMixin):
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._expiry_heap.clear()
             logger.info(f"Cache cleared: {count} entries removed")
 
     def get_with_metadata(self, key: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
@@ -211,31 +296,18 @@ class TTLCache(CacheStatsMixin):
 
         Returns:
             Dict with 'value', 'is_stale', 'age_seconds', 'hit_count' or None
+            ('created_at'/'expires_at' are monotonic-clock readings)
         """
+        now = time.monotonic()
         with self._lock:
-            entry = self._cache.get(key)
-
+            entry, is_stale = self._get_raw(key, allow_stale, now)
             if entry is None:
-                self._misses += 1
                 return None
 
-            is_stale = entry.is_expired()
-
-            if is_stale and not allow_stale:
-                del self._cache[key]
-                self._misses += 1
-                return None
-
-            # Record access
-            entry.access()
-            self._hits += 1
-
-            age_seconds = time.time() - entry.created_at
-
             return {
                 "value": entry.value,
                 "is_stale": is_stale,
-                "age_seconds": round(age_seconds, 1),
+                "age_seconds": round(now - entry.created_at, 1),
                 "hit_count": entry.hit_count,
                 "created_at": entry.created_at,
                 "expires_at": entry.expires_at,
@@ -250,6 +322,14 @@ class LRUCache(CacheStatsMixin):
 
     Best for data that's frequently accessed but memory-limited.
     Examples: Search results, computed values.
+
+    Entries never expire and no per-entry metadata is exposed, so values are
+    stored directly; the OrderedDict's order is the recency order.
+
+    A small bloom filter over inserted keys answers most misses without
+    taking the lock. Bits are never cleared on eviction, so the filter is
+    rebuilt from the live keys once inserts outnumber the cache size by
+    _BLOOM_REBUILD_FACTOR.
     """
 
     def __init__(self, max_size: int = 100):
@@ -260,11 +340,28 @@ class LRUCache(CacheStatsMixin):
             max_size: Maximum number of entries
         """
         self.max_size = max_size
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = threading.RLock()
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._bloom = bytearray(_BLOOM_BITS // 8)
+        self._bloom_inserts = 0
+        self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
 
+    def _bloom_add(self, key: str) -> None:
+        """Set the key's filter bits (lock held)."""
+        h = hash(key)
+        for bit in (h & _BLOOM_MASK, (h >> 16) & _BLOOM_MASK):
+            self._bloom[bit >> 3] |= 1 << (bit & 7)
+
+    def _bloom_may_contain(self, key: str) -> bool:
+        """False means the key is definitely absent; True means maybe present."""
+        h = hash(key)
+        bloom = self._bloom
+        low, high = h & _BLOOM_MASK, (h >> 16) & _BLOOM_MASK
+        return bool(
+            bloom[low >> 3] & (1 << (low & 7)) and bloom[high >> 3] & (1 << (high & 7))
+        )
+
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache and move to end (most recently used).
@@ -275,20 +372,28 @@ class LRUCache(CacheStatsMixin):
         Returns:
             Cached value if exists, None otherwise
         """
+        # Lock-free negative answer. A set() racing with this check may not be
+        # visible yet, which is no different from the get() winning the lock.
+        # The unlocked counter update can drop a count under thread contention;
+        # it only feeds get_stats().
+        if not self._bloom_may_contain(key):
+            self._misses += 1
+            logger.debug("LRU miss: %s", key)
+            return None
+
         with self._lock:
-            entry = self._cache.get(key)
+            value = self._cache.get(key, _MISSING)
 
-            if entry is None:
+            if value is _MISSING:
                 self._misses += 1
-                logger.debug(f"LRU miss: {key}")
+                logger.debug("LRU miss: %s", key)
                 return None
 
             # Move to end (most recently used)
             self._cache.move_to_end(key)
-            entry.access()
             self._hits += 1
-            logger.debug(f"LRU hit: {key} (hits: {entry.hit_count})")
-            return entry.value
+            logger.debug("LRU hit: %s", key)
+            return value
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -302,31 +407,28 @@ class LRUCache(CacheStatsMixin):
             # If key exists, update and move to end
             if key in self._cache:
                 self._cache.move_to_end(key)
-                entry = self._cache[key]
-                entry.value = value
-                entry.last_accessed = time.time()
-                logger.debug(f"LRU updated: {key}")
+                self._cache[key] = value
+                logger.debug("LRU updated: %s", key)
                 return
 
-            # Add new entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=time.time(),
-                expires_at=None,
-                last_accessed=time.time(),
-            )
-
-            self._cache[key] = entry
+            self._cache[key] = value
+            self._bloom_inserts += 1
+            if self._bloom_inserts > _BLOOM_REBUILD_FACTOR * self.max_size:
+                self._bloom[:] = bytes(len(self._bloom))
+                for live_key in self._cache:
+                    self._bloom_add(live_key)
+                self._bloom_inserts = len(self._cache)
+            else:
+                self._bloom_add(key)
 
             # Evict least recently used if over size
             if len(self._cache) > self.max_size:
-                evicted_key, evicted_entry = self._cache.popitem(last=False)
-                logger.debug(
-                    f"LRU evicted: {evicted_key} (hits: {evicted_entry.hit_count})"
-                )
+                evicted_key, _ = self._cache.popitem(last=False)
+                logger.debug("LRU evicted: %s", evicted_key)
 
-            logger.debug(f"LRU set: {key} (size: {len(self._cache)}/{self.max_size})")
+            logger.debug(
+                "LRU set: %s (size: %d/%d)", key, len(self._cache), self.max_size
+            )
 
     def invalidate(self, key: str) -> bool:
         """
@@ -341,7 +443,7 @@ class LRUCache(CacheStatsMixin):
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
-                logger.debug(f"LRU invalidated: {key}")
+                logger.debug("LRU invalidated: %s", key)
                 return True
             return False
 
@@ -350,11 +452,192 @@ class LRUCache(CacheStatsMixin):
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._bloom[:] = bytes(len(self._bloom))
+            self._bloom_inserts = 0
             logger.info(f"LRU cache cleared: {count} entries removed")
 
     # get_stats() inherited from CacheStatsMixin
 
 
+class DiskCache:
+    """
+    Persistent TTL cache backed by a single SQLite file.
+
+    Best for search results that are expensive to refetch across server
+    restarts, e.g. repeated examiner reports over the same applications.
+    Values must be JSON-serializable.
+    """
+
+    def __init__(self, path: str, default_ttl_seconds: int = 86400, max_size: int = 10000):
+        """
+        Initialize disk cache, creating the database file if needed.
+
+        Args:
+            path: SQLite database file path (``~`` is expanded)
+            default_ttl_seconds: Default time-to-live in seconds (default: 24 hours)
+            max_size: Maximum number of entries before oldest are evicted
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL)"
+            )
+            # Max-size eviction orders by created_at on every set()
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_created_at ON cache (created_at)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if exists and not expired, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self._misses += 1
+                logger.debug("Disk cache miss: %s", key)
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and time.time() > expires_at:
+                with self._conn:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._misses += 1
+                logger.debug("Disk cache expired: %s", key)
+                return None
+
+            self._hits += 1
+            logger.debug("Disk cache hit: %s", key)
+            return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """
+        Store value in cache with TTL.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+            ttl_seconds: Time-to-live in seconds (uses default if None)
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+        now = time.time()
+        expires_at = now + ttl if ttl > 0 else None
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, expires_at),
+            )
+            # Enforce max size by removing oldest entries
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            )
+        logger.debug("Disk cache set: %s (TTL: %ss)", key, ttl)
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove entry from cache.
+
+        Args:
+            key: Cache key to invalidate
+
+        Returns:
+            True if entry was removed, False if not found
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM cache")
+        logger.info(f"Disk cache cleared: {cursor.rowcount} entries removed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, size, hit_rate
+        """
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            total = self._hits + self._misses
+            hit_rate = (self._hits / total * 100) if total > 0 else 0.0
+
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "total_requests": total,
+                "hit_rate_percent": round(hit_rate, 2),
+                "current_size": size,
+                "max_size": self.max_size,
+                "path": str(self.path),
+            }
+
+
+_KEY_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _dumps_sorted(value: Any) -> str:
+    """
+    Serialize a nested key argument to JSON with sorted keys.
+
+    The stdlib fallback matches orjson's compact, non-ASCII-escaping output so
+    keys (including persisted DiskCache keys) do not change when orjson is
+    installed or removed.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode_key_part(value: Any) -> str:
+    """
+    Encode a non-scalar cache key argument.
+
+    Flat lists/tuples and dicts of scalars (the common case, e.g. field lists)
+    are written out with repr(), which keeps strings quoted so "a,b" and
+    "a", "b" stay distinct; lists and tuples encode alike. Anything nested
+    falls back to JSON.
+    """
+    if isinstance(value, (list, tuple)):
+        if all(isinstance(item, _KEY_SCALAR_TYPES) for item in value):
+            return "[" + ",".join(map(repr, value)) + "]"
+    elif isinstance(value, dict):
+        if all(isinstance(item, _KEY_SCALAR_TYPES) for item in value.values()):
+            return (
+                "{"
+                + ",".join(f"{k!r}:{v!r}" for k, v in sorted(value.items()))
+                + "}"
+            )
+    return _dumps_sorted(value)
+
+
 def generate_cache_key(prefix: str, *args, **kwargs) -> str:
     """
     Generate a deterministic cache key from arguments.
@@ -375,8 +658,7 @@ def generate_cache_key(prefix: str, *args, **kwargs) -> str:
         if isinstance(arg, (str, int, float, bool)):
             key_parts.append(str(arg))
         else:
-            # For complex types, use JSON serialization
-            key_parts.append(json.dumps(arg, sort_keys=True))
+            key_parts.append(_encode_key_part(arg))
 
     # Add keyword args (sorted for determinism)
     for k in sorted(kwargs.keys()):
@@ -384,13 +666,13 @@ def generate_cache_key(prefix: str, *args, **kwargs) -> str:
         if isinstance(v, (str, int, float, bool)):
             key_parts.append(f"{k}={v}")
         else:
-            key_parts.append(f"{k}={json.dumps(v, sort_keys=True)}")
+            key_parts.append(f"{k}={_encode_key_part(v)}")
 
     # Create hash for long keys
     key_str = ":".join(key_parts)
     if len(key_str) > 200:
         # Use hash for very long keys
-        key_hash = hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        key_hash = hashlib.blake2b(key_str.encode(), digest_size=8).hexdigest()
         return f"{prefix}:hash:{key_hash}"
 
     return key_str
@@ -399,6 +681,7 @@ def generate_cache_key(prefix: str, *args, **kwargs) -> str:
 # Global cache instances
 _fields_cache: Optional[TTLCache] = None
 _search_cache: Optional[LRUCache] = None
+_disk_cache: Optional[DiskCache] = None
 
 
 def get_fields_cache(ttl_seconds: int = 3600, max_size: int = 10) -> TTLCache:
@@ -436,14 +719,39 @@ def get_search_cache(max_size: int = 100) -> LRUCache:
     return _search_cache
 
 
+def get_disk_cache(path: str, ttl_seconds: int = 86400) -> Optional[DiskCache]:
+    """
+    Get or create the global persistent search cache.
+
+    Args:
+        path: SQLite database file path
+        ttl_seconds: TTL for persisted results (default: 24 hours)
+
+    Returns:
+        DiskCache instance, or None if the database could not be opened
+    """
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            _disk_cache = DiskCache(path, default_ttl_seconds=ttl_seconds)
+        except (OSError, sqlite3.Error) as e:
+            # Unwritable directory or unopenable database: run without it
+            logger.warning(f"Disk cache unavailable at {path}, continuing without it: {e}")
+            return None
+        logger.info(f"Disk cache initialized (path: {path}, TTL: {ttl_seconds}s)")
+    return _disk_cache
+
+
 def clear_all_caches() -> None:
     """Clear all global caches."""
-    global _fields_cache, _search_cache
+    global _fields_cache, _search_cache, _disk_cache
 
     if _fields_cache:
         _fields_cache.clear()
     if _search_cache:
         _search_cache.clear()
+    if _disk_cache:
+        _disk_cache.clear()
 
     logger.info("All caches cleared")
 
@@ -461,5 +769,7 @@ def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
         stats["fields_cache"] = _fields_cache.get_stats()
     if _search_cache:
         stats["search_cache"] = _search_cache.get_stats()
+    if _disk_cache:
+        stats["disk_cache"] = _disk_cache.get_stats()
 
     return stats
@@ -9,12 +9,31 @@ Features:
 - Secure file permissions
 """
 
+import atexit
 import logging
 import os
+import queue
 import re
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f]")
+
+# Started by setup_logging(); stopped at interpreter exit to flush the queue
+_queue_listener: Optional[QueueListener] = None
+
+# Parent of every module-level logging.getLogger(__name__) logger in the package
+_PACKAGE_LOGGER_NAME = "uspto_enriched_citation_mcp"
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if one was started."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
 
 
 class SanitizingFilter(logging.Filter):
@@ -22,7 +41,7 @@ class SanitizingFilter(logging.Filter):
     Logging filter that sanitizes sensitive data and prevents log injection.
 
     Removes:
-    - API keys (28-40 character alphanumeric strings)
+    - API keys and tokens (28+ character alphanumeric runs containing a letter)
     - File paths (Windows and Unix)
     - IP addresses
     - URLs
@@ -32,13 +51,16 @@ class SanitizingFilter(logging.Filter):
 
     # Sensitive patterns to sanitize (same as error_utils)
     SENSITIVE_PATTERNS = [
-        (r"[A-Za-z]:\\[^:\s]+", "[PATH_REDACTED]"),  # Windows paths
-        (r"/[^\s:]+/[^\s:]+", "[PATH_REDACTED]"),  # Unix paths
-        (r"[a-z0-9]{28,40}", "[KEY_REDACTED]"),  # API keys
+        (r"[A-Za-z]:\\[^:\s]++", "[PATH_REDACTED]"),  # Windows paths
+        (r"/[^\s:/]++/[^\s:]++", "[PATH_REDACTED]"),  # Unix paths
+        (
+            r"(?<![a-z0-9])(?=[a-z0-9]*[a-z])[a-z0-9]{28,}+(?![a-z0-9])",
+            "[KEY_REDACTED]",
+        ),  # API keys and tokens (at least one letter, not part of a longer alphanumeric run)
         (r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "[IP_REDACTED]"),  # IP addresses
-        (r"https?://[^\s]+", "[URL_REDACTED]"),  # URLs
+        (r"\bhttps?://\S++", "[URL_REDACTED]"),  # URLs
         (
-            r'password["\']?\s*[:=]\s*["\']?[^\s"\']+',
+            r'password["\']?\s*+[:=]\s*+["\']?[^\s"\']++',
             "password=[REDACTED]",
         ),  # Passwords
         (
@@ -47,6 +69,12 @@ class SanitizingFilter(logging.Filter):
         ),  # API key assignments
     ]
 
+    # Compiled once; filter() runs on every log record
+    _COMPILED_PATTERNS = tuple(
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in SENSITIVE_PATTERNS
+    )
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Filter and sanitize log record.
@@ -62,8 +90,8 @@ class SanitizingFilter(logging.Filter):
             message = str(record.msg)
 
             # Remove sensitive patterns
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                message = re.sub(pattern, replacement, message, flags=re.IGNORECASE)
+            for pattern, replacement in self._COMPILED_PATTERNS:
+                message = pattern.sub(replacement, message)
 
             # Prevent log injection by escaping control characters
             message = self._prevent_log_injection(message)
@@ -96,9 +124,7 @@ class SanitizingFilter(logging.Filter):
         message = message.replace("\n", "\\n").replace("\r", "\\r")
 
         # Replace other control characters
-        message = re.sub(
-            r"[\x00-\x1f\x7f]", lambda m: f"\\x{ord(m.group(0)):02x}", message
-        )
+        message = _CONTROL_CHARS.sub(lambda m: f"\\x{ord(m.group(0)):02x}", message)
 
         return message
 
@@ -113,12 +139,29 @@ class SanitizingFilter(logging.Filter):
             Sanitized value
         """
         if isinstance(value, str):
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                value = re.sub(pattern, replacement, value, flags=re.IGNORECASE)
+            for pattern, replacement in self._COMPILED_PATTERNS:
+                value = pattern.sub(replacement, value)
             value = self._prevent_log_injection(value)
         return value
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves traceback formatting to the listener thread.
+
+    The stock QueueHandler formats each record (including exc_info) before
+    enqueueing it, which keeps the expensive part on the caller's thread. Here
+    only the message arguments are merged so later mutation of the arguments
+    cannot change the logged text; exc_info travels with the record and is
+    formatted by the destination handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logging(
     level: str = "INFO",
     log_dir: Optional[str] = None,
@@ -188,9 +231,10 @@ def setup_logging(
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.addFilter(SanitizingFilter())
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     # File handlers (if enabled)
+    file_logging_error = None
     if enable_file_logging:
         try:
             # Application log file (INFO and above)
@@ -204,7 +248,7 @@ def setup_logging(
             app_handler.setLevel(logging.INFO)
             app_handler.addFilter(SanitizingFilter())
             app_handler.setFormatter(formatter)
-            logger.addHandler(app_handler)
+            handlers.append(app_handler)
 
             # Set secure permissions (owner rw, group r)
             os.chmod(app_log_file, 0o640)
@@ -220,17 +264,38 @@ def setup_logging(
             error_handler.setLevel(logging.WARNING)
             error_handler.addFilter(SanitizingFilter())
             error_handler.setFormatter(formatter)
-            logger.addHandler(error_handler)
+            handlers.append(error_handler)
 
             # Set secure permissions (owner rw, group r)
             os.chmod(error_log_file, 0o640)
 
-            logger.info(f"File logging enabled: {log_path}")
-            logger.info(f"Log rotation: {max_bytes:,} bytes, {backup_count} backups")
-
         except Exception as e:
-            logger.warning(f"Failed to setup file logging: {e}")
-            logger.warning("Continuing with console logging only")
+            file_logging_error = e
+            enable_file_logging = False
+
+    # The handlers run on a background listener thread; callers only enqueue.
+    # The queue handler goes on this logger and on the package logger that the
+    # module-level __name__ loggers inherit from. Neither propagates, so their
+    # records are never also formatted and written synchronously by root's
+    # handlers. The root logger itself is left to the MCP framework.
+    global _queue_listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    queue_handler = _DeferredQueueHandler(log_queue)
+    package_logger = logging.getLogger(_PACKAGE_LOGGER_NAME)
+    for queued_logger in (logger, package_logger):
+        queued_logger.addHandler(queue_handler)
+        queued_logger.propagate = False
+    package_logger.setLevel(getattr(logging, level.upper()))
+
+    if enable_file_logging:
+        logger.info(f"File logging enabled: {log_path}")
+        logger.info(f"Log rotation: {max_bytes:,} bytes, {backup_count} backups")
+    elif file_logging_error is not None:
+        logger.warning(f"Failed to setup file logging: {file_logging_error}")
+        logger.warning("Continuing with console logging only")
 
     logger.setLevel(getattr(logging, level.upper()))
 
@@ -1,7 +1,8 @@
 """Query validation utilities for Lucene syntax with enhanced security."""
 
 import re
-from typing import Tuple, Set
+import string
+from typing import NamedTuple, Optional, Tuple, Set
 from .security_logger import get_security_logger
 from ..config.constants import (
     MAX_QUERY_LENGTH,
@@ -42,6 +43,41 @@ VALID_FIELDS: Set[str] = {
 # Valid Lucene operators
 VALID_OPERATORS: Set[str] = {"AND", "OR", "NOT", "TO"}
 
+# Injection patterns (compiled once at import)
+_DANGEROUS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"<script",
+        r"javascript:",
+        r"\\x[0-9a-f]{2}",
+        r"\\u[0-9a-f]{4}",
+        r"\$\{",  # Template injection
+        r"`",  # Command injection
+    )
+)
+
+_FIELD_PATTERN = re.compile(r"(?<!\w)(\w+):")
+_EMPTY_FIELD_VALUE_PATTERN = re.compile(r"(?<!\w)(\w+):\s*(?:\s|$|AND|OR|NOT)")
+_LEADING_OPERATOR_PATTERN = re.compile(r"\s*(AND|OR|NOT)\s+")
+
+# Characters allowed in a query besides whitespace
+_ALLOWED_QUERY_CHARS = frozenset(
+    string.ascii_letters + string.digits + ':*?"()[]-&|!.,_'
+)
+
+
+class _QueryScan(NamedTuple):
+    """Structural facts gathered by a single pass over a query."""
+
+    error: Optional[str] = None
+    paren_depth: int = 0
+    bracket_depth: int = 0
+    quote_count: int = 0
+    range_count: int = 0
+    wildcard_count: int = 0
+    has_invalid_chars: bool = False
+    has_leading_wildcard: bool = False
+
 
 def validate_lucene_syntax(query: str) -> Tuple[bool, str]:
     """
@@ -77,81 +113,50 @@ def validate_lucene_syntax(query: str) -> Tuple[bool, str]:
         return False, f"Query too long (max {MAX_QUERY_LENGTH} characters)"
 
     # Check for injection patterns
-    dangerous_patterns = [
-        r"<script",
-        r"javascript:",
-        r"\\x[0-9a-f]{2}",
-        r"\\u[0-9a-f]{4}",
-        r"\$\{",  # Template injection
-        r"`",  # Command injection
-    ]
-    for pattern in dangerous_patterns:
-        if re.search(pattern, query, re.IGNORECASE):
+    for pattern in _DANGEROUS_PATTERNS:
+        if pattern.search(query):
             # Log injection attempt
             security_logger = get_security_logger()
             security_logger.injection_attempt(
                 injection_type="query_injection",
                 input_field="lucene_query",
-                pattern_detected=pattern,
+                pattern_detected=pattern.pattern,
                 query_preview=query[:LOG_QUERY_PREVIEW_LENGTH],
             )
             return False, "Query contains potentially dangerous patterns"
 
-    # Validate balanced parentheses
-    paren_count = 0
-    bracket_count = 0
-    for char in query:
-        if char == "(":
-            paren_count += 1
-        elif char == ")":
-            paren_count -= 1
-        elif char == "[":
-            bracket_count += 1
-        elif char == "]":
-            bracket_count -= 1
+    # Single linear pass for structure (balance, nesting, ranges, characters)
+    scan = _scan_query(query)
+    if scan.error:
+        return False, scan.error
 
-        # Prevent excessive nesting (DoS protection)
-        if (
-            paren_count > MAX_QUERY_NESTING_DEPTH
-            or bracket_count > MAX_QUERY_NESTING_DEPTH
-        ):
-            return (
-                False,
-                f"Query nesting too deep (max {MAX_QUERY_NESTING_DEPTH} levels)",
-            )
-
-        if paren_count < 0 or bracket_count < 0:
-            return False, "Unbalanced parentheses or brackets"
-
-    if paren_count != 0:
+    if scan.paren_depth != 0:
         return False, "Unbalanced parentheses"
-    if bracket_count != 0:
+    if scan.bracket_depth != 0:
         return False, "Unbalanced brackets"
 
     # Validate balanced quotes
-    quote_count = query.count('"')
-    if quote_count % 2 != 0:
+    if scan.quote_count % 2 != 0:
         return False, "Unbalanced quotes"
 
     # Validate field names and values (security-critical)
     # Extract field:value patterns
-    field_pattern = r"(\w+):"
-    fields_used = re.findall(field_pattern, query)
+    fields_used = _FIELD_PATTERN.findall(query)
 
     # Check for empty field values (field: with no value)
-    if re.search(r"(\w+):\s*(?:\s|$|AND|OR|NOT)", query):
+    if _EMPTY_FIELD_VALUE_PATTERN.search(query):
         return False, "Field queries must have non-empty values"
 
     # Check for leading boolean operators
-    if re.search(r"^\s*(AND|OR|NOT)\s+", query):
+    if _LEADING_OPERATOR_PATTERN.match(query):
         return False, "Query cannot start with a boolean operator"
 
-    # Check for incomplete boolean expressions
-    if re.search(r"(AND|OR)\s*$", query):
+    # Check for incomplete boolean expressions (query is already stripped)
+    if query.endswith(("AND", "OR")):
         return False, "Incomplete boolean expression"
 
     # Check for incomplete range expressions
-    if re.search(r"\[.*TO\s*$", query):
+    if query.endswith("TO") and "[" in query[:-2]:
         return False, "Incomplete range expression"
 
     for field in fields_used:
@@ -170,34 +175,114 @@ def validate_lucene_syntax(query: str) -> Tuple[bool, str]:
             )
 
     # Validate range queries
-    range_pattern = r"\[([^\]]+) TO ([^\]]+)\]"
-    ranges = re.findall(range_pattern, query)
-    if len(ranges) > MAX_RANGE_QUERIES:
+    if scan.range_count > MAX_RANGE_QUERIES:
         return False, f"Too many range queries (max {MAX_RANGE_QUERIES})"
 
     # Restrict allowed characters (more restrictive than before)
     # Allow: alphanumeric, field separator (:), wildcards (*?), quotes ("),
     # parentheses (()), brackets ([]), hyphen (-), space, boolean operators (&|!),
     # range (TO), and basic punctuation (.,_)
-    if not re.match(r'^[a-zA-Z0-9:*?"()\[\]\-\s&|!.,_]+$', query):
+    if scan.has_invalid_chars:
         return False, "Query contains invalid characters"
 
     # Additional security: prevent excessive wildcards (DoS)
-    wildcard_count = query.count("*") + query.count("?")
-    if wildcard_count > MAX_WILDCARDS_PER_QUERY:
+    if scan.wildcard_count > MAX_WILDCARDS_PER_QUERY:
         # Log excessive wildcards (DoS indicator)
         security_logger = get_security_logger()
         security_logger.excessive_wildcards(
             query=query,
-            wildcard_count=wildcard_count,
+            wildcard_count=scan.wildcard_count,
             max_allowed=MAX_WILDCARDS_PER_QUERY,
         )
         return False, f"Too many wildcards (max {MAX_WILDCARDS_PER_QUERY})"
 
     # Prevent leading wildcards (performance issue) - but allow in range queries
-    # First remove range query content to avoid false positives
-    query_without_ranges = re.sub(r"\[[^\]]+\]", "", query)
-    if re.search(r"^\*|\s\*", query_without_ranges):
+    if scan.has_leading_wildcard:
         return False, "Leading wildcards are not allowed (performance issue)"
 
     return True, "Query validation passed"
+
+
+def _scan_query(query: str) -> _QueryScan:
+    """
+    Scan a query once, character by character, collecting structural facts.
+
+    Replaces several independent regex passes with a linear state machine so
+    validation cost stays O(n) regardless of input shape. Tracks paren and
+    bracket depth, quotes, range expressions, wildcards, disallowed characters
+    and wildcards that start a term outside of range brackets.
+
+    Args:
+        query: Stripped Lucene query string
+
+    Returns:
+        _QueryScan with ``error`` set if nesting is too deep or a closing
+        paren/bracket appears before its opener
+    """
+    paren_depth = 0
+    bracket_depth = 0
+    quote_count = 0
+    range_count = 0
+    wildcard_count = 0
+    has_invalid_chars = False
+    has_leading_wildcard = False
+    range_start = 0
+    # Last character seen outside range brackets ("" = start of query)
+    prev_outside = ""
+
+    for index, char in enumerate(query):
+        if char == "(":
+            paren_depth += 1
+        elif char == ")":
+            paren_depth -= 1
+        elif char == "[":
+            if bracket_depth == 0:
+                range_start = index + 1
+            bracket_depth += 1
+        elif char == "]":
+            bracket_depth -= 1
+            if bracket_depth == 0:
+                range_body = query[range_start:index]
+                if " TO " in range_body:
+                    range_count += 1
+                if not range_body:
+                    prev_outside = char
+                continue
+        elif char == '"':
+            quote_count += 1
+        elif char == "*" or char == "?":
+            wildcard_count += 1
+            if (
+                char == "*"
+                and bracket_depth == 0
+                and (not prev_outside or prev_outside.isspace())
+            ):
+                has_leading_wildcard = True
+
+        if char not in _ALLOWED_QUERY_CHARS and not char.isspace():
+            has_invalid_chars = True
+
+        # Prevent excessive nesting (DoS protection)
+        if (
+            paren_depth > MAX_QUERY_NESTING_DEPTH
+            or bracket_depth > MAX_QUERY_NESTING_DEPTH
+        ):
+            return _QueryScan(
+                error=f"Query nesting too deep (max {MAX_QUERY_NESTING_DEPTH} levels)"
+            )
+
+        if paren_depth < 0 or bracket_depth < 0:
+            return _QueryScan(error="Unbalanced parentheses or brackets")
+
+        if bracket_depth == 0 and char != "[":
+            prev_outside = char
+
+    return _QueryScan(
+        paren_depth=paren_depth,
+        bracket_depth=bracket_depth,
+        quote_count=quote_count,
+        range_count=range_count,
+        wildcard_count=wildcard_count,
+        has_invalid_chars=has_invalid_chars,
+        has_leading_wildcard=has_leading_wildcard,
+    )
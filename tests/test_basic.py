@@ -2,6 +2,8 @@
 Basic tests for USPTO Enriched Citation MCP.
 """
 
+import json
+
 import pytest
 import pytest_asyncio
 from unittest.mock import patch, AsyncMock
@@ -92,7 +94,7 @@ class TestBasic:
             mock_response_obj.status_code = 200
             mock_response_obj.json = lambda: mock_response  # Use lambda instead of return_value
             mock_response_obj.headers = {"content-type": "application/json"}
-            mock_response_obj.content = b"{}"
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_get.return_value = mock_response_obj
 
             result = await client.get_fields()
@@ -119,7 +121,7 @@ class TestBasic:
             mock_response_obj.status_code = 200
             mock_response_obj.json = lambda: mock_response  # Use lambda instead of return_value
             mock_response_obj.headers = {"content-type": "application/json"}
-            mock_response_obj.content = b"{}"
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_post.return_value = mock_response_obj
 
             result = await client.search_records(criteria=criteria, rows=5)
@@ -127,6 +129,30 @@ class TestBasic:
             assert result["response"]["numFound"] >= 0
             assert result["response"]["start"] == 0
 
+    @pytest.mark.asyncio
+    async def test_search_records_survives_disk_cache_errors(self, mock_client, tmp_path):
+        """Test that a failing persistent cache falls through to the API."""
+        import sqlite3
+        from uspto_enriched_citation_mcp.util.cache import DiskCache
+
+        client = mock_client
+        client.disk_cache = DiskCache(str(tmp_path / "cache.sqlite"))
+        mock_response = {"response": {"numFound": 0, "start": 0, "docs": []}}
+
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post, \
+                patch.object(client.disk_cache, "get", side_effect=sqlite3.OperationalError("database is locked")), \
+                patch.object(client.disk_cache, "set", side_effect=sqlite3.OperationalError("disk I/O error")):
+            mock_response_obj = AsyncMock()
+            mock_response_obj.status_code = 200
+            mock_response_obj.json = lambda: mock_response  # Use lambda instead of return_value
+            mock_response_obj.headers = {"content-type": "application/json"}
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_post.return_value = mock_response_obj
+
+            result = await client.search_records(criteria="patentApplicationNumber:17000001", rows=5)
+            assert result == mock_response
+            mock_post.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_citation_details(self, mock_client):
         """Test getting citation details."""
@@ -147,7 +173,7 @@ class TestBasic:
             mock_response_obj.status_code = 200
             mock_response_obj.json = lambda: mock_response  # Use lambda instead of return_value
             mock_response_obj.headers = {"content-type": "application/json"}
-            mock_response_obj.content = b"{}"
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_post.return_value = mock_response_obj
 
             result = await client.get_citation_details(citation_id)
@@ -135,11 +135,32 @@ class TestConvenienceParameters:
             category_code="102"
         ))
 
-        assert "(citedDocumentIdentifier:US*)" in result.query
+        assert "citedDocumentIdentifier:US* AND" in result.query
+        assert "(citedDocumentIdentifier:US*)" not in result.query  # Single term not wrapped
         assert "techCenter:2100" in result.query
         assert "citationCategoryCode:102" in result.query
         assert " AND " in result.query
 
+    def test_multi_term_criteria_grouped(self):
+        """Test that multi-term criteria stay parenthesized when combined."""
+        result = build_query(QueryParameters(
+            criteria="citationCategoryCode:X OR citationCategoryCode:Y",
+            tech_center="2100"
+        ))
+
+        assert "(citationCategoryCode:X OR citationCategoryCode:Y) AND" in result.query
+
+    def test_symbolic_operator_and_newline_criteria_grouped(self):
+        """Test that ||, && and newline-separated criteria are parenthesized too."""
+        for criteria in (
+            "citationCategoryCode:X||citationCategoryCode:Y",
+            "citationCategoryCode:X&&techCenter:2800",
+            "citationCategoryCode:X\nOR citationCategoryCode:Y",
+            "citationCategoryCode:X\r\nOR citationCategoryCode:Y",
+        ):
+            result = build_query(QueryParameters(criteria=criteria, tech_center="2100"))
+            assert result.query.startswith(f"({criteria}) AND"), criteria
+
     def test_no_colon_escaping(self):
         """Verify colons in field:value syntax are NOT escaped."""
         result = build_query(QueryParameters(tech_center="2100"))
@@ -301,8 +301,79 @@ class TestCircuitBreaker:
         # Should be closed or transitioning to closed
         assert breaker.state in [CircuitState.CLOSED, CircuitState.HALF_OPEN]
 
+    @pytest.mark.asyncio
+    async def test_circuit_allows_concurrent_calls(self):
+        """Test 3.7: Calls through a closed circuit run concurrently."""
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        async def slow_call():
+            await asyncio.sleep(0.1)
+            return "success"
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(breaker.call(slow_call) for _ in range(5)))
+
+        assert results == ["success"] * 5
+        assert time.perf_counter() - start < 0.3
+
+    @pytest.mark.asyncio
+    async def test_half_open_limits_trial_calls(self):
+        """Test 3.8: HALF_OPEN admits at most success_threshold trial calls."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.05, success_threshold=2
+        )
+
+        async def failing_call():
+            raise ConnectionError("Test failure")
+
+        async def slow_call():
+            await asyncio.sleep(0.1)
+            return "success"
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(failing_call)
+        await asyncio.sleep(0.1)
+
+        results = await asyncio.gather(
+            *(breaker.call(slow_call) for _ in range(3)), return_exceptions=True
+        )
+
+        assert results.count("success") == 2
+        assert sum(isinstance(r, CircuitBreakerError) for r in results) == 1
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_call_releases_slot(self):
+        """Test 3.9: A cancelled HALF_OPEN trial call does not wedge the breaker."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.05, success_threshold=1
+        )
+
+        async def failing_call():
+            raise ConnectionError("Test failure")
+
+        async def hanging_call():
+            await asyncio.sleep(10)
+
+        async def successful_call():
+            return "success"
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(failing_call)
+        await asyncio.sleep(0.1)
+
+        trial = asyncio.create_task(breaker.call(hanging_call))
+        await asyncio.sleep(0.01)
+        assert breaker.state == CircuitState.HALF_OPEN
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        assert await breaker.call(successful_call) == "success"
+        assert breaker.state == CircuitState.CLOSED
+
     def test_circuit_breaker_decorator(self):
-        """Test 3.7: Circuit breaker works as decorator."""
+        """Test 3.10: Circuit breaker works as decorator."""
         test_breaker = circuit_breaker(failure_threshold=2, recovery_timeout=60.0)
 
         # Decorator should be a CircuitBreaker instance
@@ -502,6 +573,145 @@ class TestCaching:
         # Cache should still have 5 items (max_size)
         assert cache.currsize <= 5
 
+    def test_disk_cache(self, tmp_path, monkeypatch):
+        """Test 5.4: Disk cache persists entries across instances and expires them."""
+        from types import SimpleNamespace
+        from uspto_enriched_citation_mcp.util import cache as cache_module
+        from uspto_enriched_citation_mcp.util.cache import DiskCache
+
+        path = tmp_path / "cache.sqlite"
+        cache = DiskCache(str(path), default_ttl_seconds=60, max_size=2)
+        cache.set("key_0", {"docs": [1, 2]})
+
+        # A fresh instance on the same file sees the entry
+        reopened = DiskCache(str(path), default_ttl_seconds=60, max_size=2)
+        assert reopened.get("key_0") == {"docs": [1, 2]}
+
+        # Oldest entries are evicted beyond max_size
+        reopened.set("key_1", "value_1")
+        reopened.set("key_2", "value_2")
+        assert reopened.get_stats()["current_size"] == 2
+        assert reopened.get("key_0") is None
+
+        # Expired entries are dropped
+        later = time.time() + 120
+        monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: later))
+        assert reopened.get("key_2") is None
+
+    def test_ttl_cache_evicts_expired_before_oldest(self, monkeypatch):
+        """Test 5.5: A full TTL cache drops an expired entry before the oldest live one."""
+        from types import SimpleNamespace
+        from uspto_enriched_citation_mcp.util import cache as cache_module
+        from uspto_enriched_citation_mcp.util.cache import TTLCache
+
+        clock = SimpleNamespace(now=0.0)
+        monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+        cache = TTLCache(default_ttl_seconds=60, max_size=2)
+        cache.set("b", "value_b", ttl_seconds=1000)
+        # Re-setting "a" pushes enough expiry pairs to trigger a heap compaction
+        for t in range(4):
+            clock.now = float(t)
+            cache.set("a", "value_a", ttl_seconds=1)
+
+        clock.now = 50.0
+        cache.set("c", "value_c")
+
+        assert list(cache._cache) == ["b", "c"]
+
+    def test_ttl_cache_compacts_expiry_heap(self, monkeypatch):
+        """Test 5.6: Re-set keys do not grow the expiry heap without bound."""
+        from types import SimpleNamespace
+        from uspto_enriched_citation_mcp.util import cache as cache_module
+        from uspto_enriched_citation_mcp.util.cache import TTLCache
+
+        clock = SimpleNamespace(now=0.0)
+        monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+        cache = TTLCache(default_ttl_seconds=60, max_size=3)
+        for t in range(100):
+            clock.now = float(t)
+            cache.set(f"key_{t % 3}", t)
+
+        assert len(cache._expiry_heap) <= 2 * cache.max_size
+        # Every live entry's current expiry is still tracked
+        for key, entry in cache._cache.items():
+            assert (entry.expires_at, key) in cache._expiry_heap
+
+
+    def test_lru_cache_misses_after_eviction(self):
+        """Test 5.7: An evicted LRU key misses, even though its filter bits stay set."""
+        from uspto_enriched_citation_mcp.util.cache import LRUCache
+
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+        assert cache.get_stats()["misses"] == 1
+
+        # A cached None is a hit, not a miss
+        cache.set("none", None)
+        assert cache.get("none") is None
+        assert cache.get_stats()["hits"] == 3
+
+    def test_lru_cache_hits_after_bloom_rebuild(self):
+        """Test 5.8: Live keys still hit after the negative-lookup filter is rebuilt."""
+        from uspto_enriched_citation_mcp.util import cache as cache_module
+        from uspto_enriched_citation_mcp.util.cache import LRUCache
+
+        cache = LRUCache(max_size=3)
+        inserts = cache_module._BLOOM_REBUILD_FACTOR * cache.max_size + 5
+        for i in range(inserts):
+            cache.set(f"key_{i}", i)
+
+        # The rebuild reset the insert counter to (about) the live size
+        assert cache._bloom_inserts < inserts
+        for i in range(inserts - 3, inserts):
+            assert cache.get(f"key_{i}") == i
+        assert cache.get("key_0") is None
+
+    def test_cache_key_list_and_tuple_arguments_match(self):
+        """Test 5.9: List and tuple arguments produce the same cache key."""
+        from uspto_enriched_citation_mcp.util.cache import generate_cache_key
+
+        fields = ["patentApplicationNumber", "citedDocumentIdentifier"]
+        assert generate_cache_key("search", "q", selected_fields=fields) == generate_cache_key(
+            "search", "q", selected_fields=tuple(fields)
+        )
+        # Nested arguments take the JSON path and still match
+        assert generate_cache_key("search", [[1, 2], {"a": 1}]) == generate_cache_key(
+            "search", ((1, 2), {"a": 1})
+        )
+        # Quoting keeps a joined string distinct from a list of its parts
+        assert generate_cache_key("search", ["a,b"]) != generate_cache_key("search", ["a", "b"])
+
+    def test_cache_key_same_with_and_without_orjson(self, monkeypatch):
+        """Test 5.10: The stdlib JSON fallback produces the same keys as orjson."""
+        pytest.importorskip("orjson")
+        from uspto_enriched_citation_mcp.util import cache as cache_module
+        from uspto_enriched_citation_mcp.util.cache import generate_cache_key
+
+        nested = {"b": [1, {"x": "é"}], "a": None, "n": 1.5}
+        with_orjson = generate_cache_key("search", nested, filters=[{"k": True}])
+
+        monkeypatch.setattr(cache_module, "orjson", None)
+        assert generate_cache_key("search", nested, filters=[{"k": True}]) == with_orjson
+
+    def test_disk_cache_unavailable_is_skipped(self, tmp_path, monkeypatch):
+        """Test 5.11: An unopenable disk cache path disables the cache instead of failing."""
+        from uspto_enriched_citation_mcp.util import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "_disk_cache", None)
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+
+        assert cache_module.get_disk_cache(str(blocker / "cache.sqlite")) is None
+        assert cache_module._disk_cache is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -354,6 +354,128 @@ class TestInputValidation:
         # Should be handled (valid or invalid is implementation-dependent)
         assert is_valid is not None
 
+    def test_leading_wildcard_outside_ranges(self):
+        """Test 3.5: Leading wildcards rejected except inside range brackets."""
+        from uspto_enriched_citation_mcp.util.query_validator import validate_lucene_syntax
+
+        is_valid, message = validate_lucene_syntax("techCenter:2100 AND *son")
+        assert is_valid is False
+        assert "leading wildcards" in message.lower()
+
+        is_valid, _ = validate_lucene_syntax("officeActionDate:[* TO 2023-12-31]")
+        assert is_valid is True
+
+    def test_adversarial_input_validates_quickly(self):
+        """Test 3.6: Pathological inputs are validated in linear time."""
+        import time
+        from uspto_enriched_citation_mcp.util.query_validator import validate_lucene_syntax
+
+        adversarial_inputs = [
+            "a" * 4900,
+            "[" + "x TO " * 900,
+            "techCenter:" + "(" * 5 + "x" * 4900,
+        ]
+
+        start = time.perf_counter()
+        for test_input in adversarial_inputs:
+            is_valid, _ = validate_lucene_syntax(test_input)
+            assert is_valid is not None
+        assert time.perf_counter() - start < 1.0
+
+    def test_error_message_sanitization(self):
+        """Test 3.7: Sensitive details are redacted from error messages."""
+        from uspto_enriched_citation_mcp.shared.error_utils import sanitize_error_message
+
+        message = (
+            "Failed at /usr/lib/app/client.py calling https://api.example.com/v1 "
+            "from 10.0.0.1 with password=hunter2"
+        )
+        sanitized = sanitize_error_message(message)
+
+        assert sanitized == (
+            "Failed at [PATH_REDACTED] calling [URL_REDACTED] "
+            "from [IP_REDACTED] with password=[REDACTED]"
+        )
+        assert sanitize_error_message("Plain message") == "Plain message"
+
+    def test_key_redaction_skips_numeric_identifiers(self):
+        """Test 3.8: Alphanumeric runs with a letter are redacted; all-digit identifiers are not."""
+        from uspto_enriched_citation_mcp.shared.error_utils import sanitize_error_message
+        from uspto_enriched_citation_mcp.util.logging import SanitizingFilter
+
+        key = "a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5"  # pragma: allowlist secret
+        assert sanitize_error_message(f"key {key} rejected") == "key [KEY_REDACTED] rejected"
+
+        # USPTO keys are 30 lowercase characters and may contain no digits at all
+        letters_key = "abcdefghijklmnopqrstuvwxyzabcd"  # pragma: allowlist secret
+        assert sanitize_error_message(f"key {letters_key}") == "key [KEY_REDACTED]"
+
+        # Keys joined to identifiers by underscores are still redacted
+        assert sanitize_error_message(f"id_{key}") == "id_[KEY_REDACTED]"
+        assert sanitize_error_message(f"api_key_{key}") == "api_key_[KEY_REDACTED]"
+
+        # Runs longer than 40 characters, e.g. 64-character hex tokens
+        token = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"  # pragma: allowlist secret
+        assert sanitize_error_message(f"token {token}") == "token [KEY_REDACTED]"
+
+        # Long all-digit identifiers are domain data, not keys
+        number = "1" * 30
+        assert sanitize_error_message(f"number {number}") == f"number {number}"
+
+        # The log filter applies the same key rule
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 0, f"token {token} id_{key} {letters_key}", None, None
+        )
+        SanitizingFilter().filter(record)
+        assert record.msg == "token [KEY_REDACTED] id_[KEY_REDACTED] [KEY_REDACTED]"
+
+    def test_error_message_sanitization_is_bounded(self):
+        """Test 3.9: Pathological error text is sanitized quickly and truncated."""
+        import time
+        from uspto_enriched_citation_mcp.config.constants import MAX_SANITIZE_INPUT_LENGTH
+        from uspto_enriched_citation_mcp.shared.error_utils import sanitize_error_message
+
+        adversarial_messages = [
+            "/" * 100000,
+            "/a" * 50000 + ":",
+            "password" * 20000,
+            "C:\\" + "x" * 100000,
+        ]
+
+        start = time.perf_counter()
+        for message in adversarial_messages:
+            assert len(sanitize_error_message(message)) <= MAX_SANITIZE_INPUT_LENGTH
+        assert time.perf_counter() - start < 1.0
+
+    def test_truncation_does_not_leak_key_prefix(self):
+        """Test 3.11: A key cut by the input length cap is dropped, not partially kept."""
+        from uspto_enriched_citation_mcp.config.constants import MAX_SANITIZE_INPUT_LENGTH
+        from uspto_enriched_citation_mcp.shared.error_utils import sanitize_error_message
+
+        key = "abcdefghijklmnopqrstuvwxyzabcd"  # pragma: allowlist secret
+        # Place the key so the cap keeps only its first 20 characters, too
+        # short for the key pattern to match on its own
+        prefix_length = MAX_SANITIZE_INPUT_LENGTH - 20
+        padding = ("x " * prefix_length)[: prefix_length - 1] + " "
+        message = padding + key + " tail"
+
+        sanitized = sanitize_error_message(message)
+        assert key[:10] not in sanitized
+        assert len(sanitized) <= MAX_SANITIZE_INPUT_LENGTH
+
+    def test_module_loggers_log_through_queue(self):
+        """Test 3.10: Package module loggers go through the sanitizing log queue, not root."""
+        from uspto_enriched_citation_mcp.util.logging import _DeferredQueueHandler, setup_logging
+
+        setup_logging(enable_file_logging=False)
+
+        package_logger = logging.getLogger("uspto_enriched_citation_mcp")
+        assert any(isinstance(h, _DeferredQueueHandler) for h in package_logger.handlers)
+        assert package_logger.propagate is False
+
+        module_logger = logging.getLogger("uspto_enriched_citation_mcp.shared.error_utils")
+        assert module_logger.getEffectiveLevel() <= logging.INFO
+
 
 class TestSecurityEventTypes:
     """Test security event type enumeration."""